@@ -0,0 +1,178 @@
+"""
+Export of sorted records for the Sorting Algorithm Stress Test
+Design & Analysis of Algorithms Lab - Prelim Exam
+
+Writes the rows of a ColumnStore in the order of a sort permutation:
+
+    stats = export_sorted(manager.store, order, 'sorted.csv.gz')
+    print(stats.summary())
+
+Formats: 'csv' (ID,FirstName,LastName with a header row), 'jsonl' (one
+JSON object per line) and 'columnar' (the .colcache layout of records.py
+with only the exported rows' names, read back with
+records.load_column_file). The format follows the file
+extension unless given, and a trailing ".gz" gzip-compresses any of them.
+Rows are gathered from the columns BATCH_ROWS at a time and written as one
+csv writerows() call or one joined string per batch into a BUFFER_SIZE
+write buffer, never row by row. The file is written under a temporary
+name and renamed when complete.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from records import SORT_COLUMNS, ColumnStore, write_columns
+from sorting import SortCancelled
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'columnar')
+EXTENSIONS: Dict[str, str] = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.srtc': 'columnar'}
+
+BATCH_ROWS = 50000
+BUFFER_SIZE = 1 << 20
+# Level 1 writes about 1.6x faster than the default 6 for ~10% larger files
+GZIP_LEVEL = 1
+
+
+def export_format(path: str) -> Tuple[str, bool]:
+    """(format, gzip) implied by a file name such as "sorted.jsonl.gz" """
+    compress = path.endswith('.gz')
+    stem = path[:-3] if compress else path
+    ext = os.path.splitext(stem)[1].lower()
+    if ext not in EXTENSIONS:
+        raise ValueError(f"{path}: unknown export extension, use one of "
+                         f"{', '.join(sorted(EXTENSIONS))} (optionally + .gz)")
+    return EXTENSIONS[ext], compress
+
+
+class ExportStats:
+    """What one export wrote and how fast"""
+
+    def __init__(self, path: str, fmt: str, compress: bool):
+        self.path = path
+        self.format = fmt
+        self.compress = compress
+        self.rows = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+    @property
+    def mb_per_s(self) -> float:
+        """Output throughput (compressed bytes for .gz)"""
+        return self.bytes_written / self.seconds / 1e6 if self.seconds > 0 else float('inf')
+
+    def as_dict(self) -> dict:
+        return {
+            'path': self.path,
+            'format': self.format,
+            'gzip': self.compress,
+            'rows': self.rows,
+            'bytes_written': self.bytes_written,
+            'seconds': self.seconds,
+            'rows_per_s': self.rows_per_s,
+            'mb_per_s': self.mb_per_s,
+        }
+
+    def summary(self) -> str:
+        kind = self.format + (' + gzip' if self.compress else '')
+        return (f"{self.rows:,} rows as {kind}, {self.bytes_written / 1e6:.1f} MB in {self.seconds:.3f} s "
+                f"({self.rows_per_s:,.0f} rows/s, {self.mb_per_s:.1f} MB/s)")
+
+
+def _report(progress: Optional[Callable[[float], Optional[bool]]], fraction: float) -> None:
+    if progress is not None and progress(fraction) is False:
+        raise SortCancelled(f"export cancelled at {fraction:.1%}")
+
+
+def _batches(order, batch_rows: int) -> Iterator[Tuple[int, List[int]]]:
+    """(rows done, indices) per batch of a list, array or NumPy permutation"""
+    numpy = type(order).__module__ == 'numpy'
+    for start in range(0, len(order), batch_rows):
+        batch = order[start:start + batch_rows]
+        yield start + len(batch), batch.tolist() if numpy else batch
+
+
+def _write_csv(f: io.TextIOBase, store: ColumnStore, order, batch_rows: int, progress) -> None:
+    ids, firsts, lasts, names = store.ids, store.first_codes, store.last_codes, store.names
+    writer = csv.writer(f, lineterminator='\n')
+    writer.writerow(SORT_COLUMNS)
+    for done, batch in _batches(order, batch_rows):
+        writer.writerows(zip([ids[i] for i in batch],
+                             [names[firsts[i]] for i in batch],
+                             [names[lasts[i]] for i in batch]))
+        _report(progress, done / len(order))
+
+
+def _write_jsonl(f: io.TextIOBase, store: ColumnStore, order, batch_rows: int, progress) -> None:
+    ids, firsts, lasts = store.ids, store.first_codes, store.last_codes
+    # Each distinct name is JSON-encoded once, not once per row
+    quoted = [json.dumps(name, ensure_ascii=False) for name in store.names]
+    for done, batch in _batches(order, batch_rows):
+        f.write(''.join([f'{{"ID":{ids[i]},"FirstName":{quoted[firsts[i]]},"LastName":{quoted[lasts[i]]}}}\n'
+                         for i in batch]))
+        _report(progress, done / len(order))
+
+
+def export_sorted(store: ColumnStore, order, path: str, fmt: Optional[str] = None,
+                  compress: Optional[bool] = None, batch_rows: int = BATCH_ROWS,
+                  progress: Optional[Callable[[float], Optional[bool]]] = None) -> ExportStats:
+    """
+    Write store's rows in the order of a permutation to path
+
+    order is any sort result (list, array('i') or NumPy array of row
+    indices, possibly fewer than len(store) as for a top-K preview). fmt
+    and compress default to what the file name implies. progress gets the
+    fraction written after every batch; returning False cancels the
+    export with SortCancelled and leaves no partial file behind.
+    """
+    if fmt is None or compress is None:
+        implied_fmt, implied_compress = export_format(path)
+        fmt = implied_fmt if fmt is None else fmt
+        compress = implied_compress if compress is None else compress
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}; choose from {', '.join(EXPORT_FORMATS)}")
+
+    stats = ExportStats(path, fmt, compress)
+    start = time.perf_counter()
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=BUFFER_SIZE) as raw:
+            stream = raw
+            if compress:
+                import gzip
+
+                # mtime=0 keeps the output byte-identical across runs
+                stream = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=GZIP_LEVEL, mtime=0)
+            if fmt == 'columnar':
+                # The gathered columns are written as whole sections, with
+                # only the names the exported rows use
+                write_columns(stream, store.take(order).compact())
+                _report(progress, 1.0)
+            else:
+                text = io.TextIOWrapper(stream, encoding='utf-8', newline='', write_through=False)
+                writer = _write_csv if fmt == 'csv' else _write_jsonl
+                writer(text, store, order, batch_rows, progress)
+                # Flush without closing the layers below (closed in order here)
+                text.flush()
+                text.detach()
+            if compress:
+                stream.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    stats.seconds = time.perf_counter() - start
+    stats.rows = len(order)
+    stats.bytes_written = os.path.getsize(path)
+    return stats
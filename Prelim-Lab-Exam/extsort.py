@@ -0,0 +1,285 @@
+"""
+External merge sort for generated_data.csv-format files
+Design & Analysis of Algorithms Lab - Prelim Exam
+
+Sorts a CSV that does not have to fit in memory:
+
+    stats = external_sort('big.csv', 'sorted.csv', 'LastName, FirstName DESC, ID',
+                          memory_limit=64 << 20)
+    print(stats.summary())
+
+Phase 1 reads rows until the estimated size of the run reaches
+memory_limit, sorts the run in memory and spills it to a temporary CSV.
+Phase 2 k-way merges the runs with a heap (heapq.merge), at most fan_in
+files at a time; more runs than that are merged in several passes. Both
+phases are stable, so rows with equal keys keep their input order.
+"""
+
+import csv
+import heapq
+import os
+import shutil
+import tempfile
+import time
+from functools import lru_cache, total_ordering
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from records import SORT_COLUMNS, collation_key_func, parse_order_by
+
+DEFAULT_MEMORY_LIMIT = 64 << 20
+DEFAULT_FAN_IN = 64
+
+# Estimated bytes per buffered row on top of its characters: the row list,
+# three str objects and the sort key (measured with tracemalloc on
+# generated_data.csv at about 270 bytes per ~19-character row)
+ROW_OVERHEAD = 256
+# Distinct names whose collation key is memoised; bounded so a high-cardinality
+# column cannot grow the memo past the run memory limit
+NAME_KEY_CACHE = 65536
+
+
+@total_ordering
+class _Descending:
+    """Wraps a key so it compares in reverse (for DESC terms of any type)"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+class ExternalSortStats:
+    """What one external sort did and how fast"""
+
+    def __init__(self):
+        self.rows = 0
+        self.runs = 0
+        self.merge_passes = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.run_seconds = 0.0
+        self.merge_seconds = 0.0
+        self.largest_run_bytes = 0
+
+    @property
+    def seconds(self) -> float:
+        return self.run_seconds + self.merge_seconds
+
+    @property
+    def mb_per_s(self) -> float:
+        """Input throughput over both phases"""
+        return self.input_bytes / self.seconds / 1e6 if self.seconds > 0 else float('inf')
+
+    def as_dict(self) -> dict:
+        return {
+            'rows': self.rows,
+            'runs': self.runs,
+            'merge_passes': self.merge_passes,
+            'input_bytes': self.input_bytes,
+            'output_bytes': self.output_bytes,
+            'largest_run_bytes': self.largest_run_bytes,
+            'run_seconds': self.run_seconds,
+            'merge_seconds': self.merge_seconds,
+            'seconds': self.seconds,
+            'mb_per_s': self.mb_per_s,
+        }
+
+    def summary(self) -> str:
+        return (f"{self.rows:,} rows, {self.input_bytes / 1e6:.1f} MB in {self.seconds:.3f} s "
+                f"({self.mb_per_s:.1f} MB/s): {self.runs} runs sorted in {self.run_seconds:.3f} s, "
+                f"{self.merge_passes} merge pass(es) in {self.merge_seconds:.3f} s")
+
+
+def row_key_func(header: Sequence[str], column: str, collation: str = 'binary') -> Callable[[List[str]], Any]:
+    """
+    Sort key of a raw CSV row for a column or ORDER BY list
+
+    IDs compare as ints and names by their collation key, memoised for
+    the NAME_KEY_CACHE most recent distinct names. A single column gives the bare value; an ORDER BY
+    list gives a tuple with DESC terms wrapped so they compare reversed.
+    """
+    terms = [(column, False)] if column in SORT_COLUMNS else parse_order_by(column)
+    collate = collation_key_func(collation)
+    name_key = lru_cache(maxsize=NAME_KEY_CACHE)(collate) if collate is not None else None
+
+    parts = []
+    for name, descending in terms:
+        try:
+            position = list(header).index(name)
+        except ValueError:
+            raise ValueError(f"CSV header is missing a column: {name}") from None
+        if name == 'ID':
+            part = (lambda row, p=position: int(row[p]))
+        elif collate is None:
+            part = itemgetter(position)
+        else:
+            part = (lambda row, p=position: name_key(row[p]))
+        if descending:
+            part = (lambda row, f=part: _Descending(f(row)))
+        parts.append(part)
+
+    if len(parts) == 1 and not terms[0][1]:
+        return parts[0]
+    return lambda row: tuple(part(row) for part in parts)
+
+
+def _read_runs(reader: Iterator[List[str]], key: Callable[[List[str]], Any], reverse: bool,
+               memory_limit: int, sort_func: Optional[Callable], stats: ExternalSortStats
+               ) -> Iterator[List[List[str]]]:
+    """Yield sorted runs of rows whose estimated size stays under memory_limit"""
+    run: List[List[str]] = []
+    run_bytes = 0
+    for row in reader:
+        run.append(row)
+        run_bytes += ROW_OVERHEAD + sum(map(len, row))
+        if run_bytes >= memory_limit:
+            stats.largest_run_bytes = max(stats.largest_run_bytes, run_bytes)
+            yield _sort_run(run, key, reverse, sort_func)
+            run = []
+            run_bytes = 0
+    if run:
+        stats.largest_run_bytes = max(stats.largest_run_bytes, run_bytes)
+        yield _sort_run(run, key, reverse, sort_func)
+
+
+def _sort_run(run: List[List[str]], key: Callable[[List[str]], Any], reverse: bool,
+              sort_func: Optional[Callable]) -> List[List[str]]:
+    """
+    Sort one run in memory, with list.sort or a sorting.py function
+
+    Like the GUI, the sorting.py functions get integer keys: names and
+    ORDER BY tuples are replaced by their rank among the run's distinct
+    keys, so radix_sort works on every column.
+    """
+    if sort_func is None:
+        run.sort(key=key, reverse=reverse)
+        return run
+    keys = [key(row) for row in run]
+    if keys and not isinstance(keys[0], int):
+        ranks = {value: rank for rank, value in enumerate(sorted(set(keys)))}
+        keys = [ranks[value] for value in keys]
+    order, _ = sort_func(list(range(len(run))), keys.__getitem__, reverse)
+    return [run[i] for i in order]
+
+
+def _write_rows(path: str, rows: Iterable[List[str]], header: Optional[List[str]] = None) -> None:
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        if header is not None:
+            writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _merge(paths: List[str], out_path: str, key: Callable[[List[str]], Any], reverse: bool,
+           header: Optional[List[str]] = None) -> None:
+    """Heap-merge sorted run files into one file"""
+    files = [open(path, 'r', encoding='utf-8', newline='') for path in paths]
+    try:
+        merged = heapq.merge(*(csv.reader(f) for f in files), key=key, reverse=reverse)
+        _write_rows(out_path, merged, header)
+    finally:
+        for f in files:
+            f.close()
+
+
+def external_sort(in_path: str, out_path: str, column: str = 'ID', reverse: bool = False,
+                  collation: str = 'binary', memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                  fan_in: int = DEFAULT_FAN_IN, tmp_dir: Optional[str] = None,
+                  sort_func: Optional[Callable] = None) -> ExternalSortStats:
+    """
+    Sort a CSV with a header row by column (or ORDER BY list) into out_path
+
+    memory_limit caps the estimated size of the rows held for one run;
+    the merge holds one row per open run. Runs are written under tmp_dir
+    (default: the system temp directory) and removed afterwards. sort_func
+    is any sorting.py sort (arr, key_func, reverse) -> (list, seconds);
+    by default runs are sorted with list.sort.
+    """
+    if memory_limit < 1 or fan_in < 2:
+        raise ValueError("need memory_limit >= 1 and fan_in >= 2")
+    if column not in SORT_COLUMNS:
+        terms = parse_order_by(column)
+        if len(terms) == 1:
+            # One DESC term is a reversed sort on the bare key, which is
+            # cheaper than wrapping every key (and just as stable)
+            column, descending = terms[0]
+            reverse = reverse != descending
+
+    stats = ExternalSortStats()
+    stats.input_bytes = os.path.getsize(in_path)
+    work_dir = tempfile.mkdtemp(prefix='extsort-', dir=tmp_dir)
+    try:
+        start = time.perf_counter()
+        with open(in_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                raise ValueError(f"{in_path}: empty file, expected a header row")
+            key = row_key_func(header, column, collation)
+            paths = []
+            for run in _read_runs(reader, key, reverse, memory_limit, sort_func, stats):
+                path = os.path.join(work_dir, f"run-0-{len(paths)}.csv")
+                _write_rows(path, run)
+                paths.append(path)
+                stats.rows += len(run)
+                # Drop this run before the next one is read
+                del run
+        stats.runs = len(paths)
+        stats.run_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        level = 0
+        while len(paths) > fan_in:
+            level += 1
+            merged = []
+            for group in range(0, len(paths), fan_in):
+                path = os.path.join(work_dir, f"run-{level}-{len(merged)}.csv")
+                _merge(paths[group:group + fan_in], path, key, reverse)
+                for done in paths[group:group + fan_in]:
+                    os.remove(done)
+                merged.append(path)
+            paths = merged
+        _merge(paths, out_path, key, reverse, header)
+        stats.merge_passes = level + 1
+        stats.merge_seconds = time.perf_counter() - start
+        stats.output_bytes = os.path.getsize(out_path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return stats
+
+
+def write_sample_csv(path: str, rows: int, source_path: str, seed: int = 0) -> None:
+    """
+    Write `rows` rows in the source CSV's format with random IDs and names
+    drawn from it (benchmark input of any size)
+    """
+    import random
+
+    rng = random.Random(seed)
+    with open(source_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        first_names, last_names = set(), set()
+        first_col, last_col = header.index('FirstName'), header.index('LastName')
+        for row in reader:
+            first_names.add(row[first_col])
+            last_names.add(row[last_col])
+    first_names, last_names = sorted(first_names), sorted(last_names)
+
+    block = 100000
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['ID', 'FirstName', 'LastName'])
+        for start in range(0, rows, block):
+            writer.writerows([rng.randint(1, 10 ** 9), rng.choice(first_names), rng.choice(last_names)]
+                             for _ in range(min(block, rows - start)))
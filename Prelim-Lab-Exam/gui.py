@@ -0,0 +1,1093 @@
+"""
+Sorting Algorithm Stress Test - GUI
+Design & Analysis of Algorithms Lab - Prelim Exam
+
+Tkinter front end. Only imported from app.main(), so the sorting and data
+modules stay usable where Tk is slow to load or not installed.
+"""
+
+import time
+import os
+import tkinter as tk
+from tkinter import scrolledtext, messagebox, filedialog, ttk
+
+from sortlab.progress import ProgressMeter, format_eta
+from sortlab.scaling import fit_scaling, geometric_sizes, run_scaling
+from sortlab.timing import format_seconds, measure
+from sortlab.tkviews import VirtualTable, WorkerQueue
+from records import COLLATIONS, SORT_COLUMNS, CSVDataManager, format_order_by, parse_order_by
+from resultcache import SortResultCache, result_key, sort_cache_dir_for
+from export import export_format, export_sorted
+from sorting import (bubble_sort, insertion_sort, merge_sort, bottom_up_merge_sort, parallel_merge_sort,
+                     hybrid_sort, radix_sort, argsort_keys, numpy_available, heap_top_k,
+                     quickselect_top_k, SortCancelled)
+
+
+# Scaling test: smallest N, and the longest a single timed point may take
+SCALING_START = 250
+SCALING_POINT_S = 1.0
+
+
+# ============================================================================
+# GUI APPLICATION
+# ============================================================================
+
+class SortingBenchmarkGUI:
+    """Professional GUI for sorting algorithm benchmarking"""
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("⚡ SORTING ALGORITHM STRESS TEST")
+        self.root.geometry("1400x1050")
+        self.root.configure(bg="#0a0e27")
+        
+        # Modern color scheme
+        self.bg_color = "#0a0e27"
+        self.accent_color = "#1a2847"
+        self.text_color = "#ffffff"
+        self.button_colors = {
+            "bubble": "#ff6b6b",
+            "insertion": "#4ecdc4",
+            "merge": "#45b7d1",
+            "hybrid": "#6bcb77",
+            "radix": "#ffd93d",
+            "scaling": "#a78bfa",
+            "tail": "#f472b6",
+            "topk": "#fb923c",
+            "export": "#34d399",
+            "cancel": "#ffaa00"
+        }
+        
+        # Load CSV data
+        try:
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            # Try multiple paths
+            csv_paths = [
+                os.path.join(script_dir, 'generated_data.csv'),  # In root folder
+                os.path.join(script_dir, 'data', 'generated_data.csv'),  # In data folder
+            ]
+            csv_path = None
+            for path in csv_paths:
+                if os.path.exists(path):
+                    csv_path = path
+                    break
+            
+            if not csv_path:
+                raise FileNotFoundError(f"CSV file not found in: {', '.join(csv_paths)}")
+            
+            self.data_manager = CSVDataManager(csv_path)
+            print(f"✓ Loaded {self.data_manager.get_total_count():,} records from CSV at {csv_path} "
+                  f"({self.data_manager.get_rows_per_second():,.0f} rows/sec)")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load CSV: {e}")
+            self.data_manager = None
+        
+        # Sorting runs on a worker thread; its messages are handled here on
+        # the Tk thread, so the worker never touches a widget
+        self.current_run = None
+        self.meter = None
+        self.scaling_fits = {}
+        self.result_cache = SortResultCache()
+        self.last_order = None
+        self.export_path = None
+        self.worker = WorkerQueue(self.root, {
+            "sorting": self.on_sorting,
+            "progress": self.on_progress,
+            "result": self.on_result,
+            "cached": self.on_cached,
+            "tailed": self.on_tailed,
+            "exported": self.on_exported,
+            "scaling": self.on_scaling,
+            "cancelled": self.on_cancelled,
+            "error": self.on_error,
+            "done": self.on_done,
+        })
+        
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Setup the user interface with modern design"""
+        # ===== HEADER =====
+        header_frame = tk.Frame(self.root, bg="#0f1535", highlightthickness=0)
+        header_frame.pack(fill=tk.X, padx=0, pady=0)
+        
+        # Gradient effect with border
+        border = tk.Frame(header_frame, bg="#45b7d1", height=3)
+        border.pack(fill=tk.X, side=tk.TOP)
+        
+        title = tk.Label(header_frame, text="⚡ SORTING ALGORITHM STRESS TEST", 
+                        font=("Segoe UI", 26, "bold"), 
+                        bg="#0f1535", fg="#45b7d1")
+        title.pack(pady=18, padx=20)
+        
+        subtitle = tk.Label(header_frame, 
+                           text=f"📊 Processing {self.data_manager.get_total_count():,} Records | Professional CSV Benchmarking Tool", 
+                           font=("Segoe UI", 11, "italic"), 
+                           bg="#0f1535", fg="#00ffff")
+        subtitle.pack(pady=(0, 18), padx=20)
+        
+        # ===== CONTROL PANEL (Modern Design) =====
+        control_frame = tk.Frame(self.root, bg="#1a2847", highlightthickness=0)
+        control_frame.pack(fill=tk.X, padx=15, pady=15)
+        
+        # Add subtle border
+        control_border = tk.Frame(self.root, bg="#45b7d1", height=1)
+        control_border.pack(fill=tk.X, padx=15, pady=(0, 0))
+        
+        # Column selection
+        col_frame = tk.Frame(control_frame, bg="#1a2847")
+        col_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(col_frame, text="📁 Sort Column:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.column_var = tk.StringVar(value="ID")
+        self.column_menu = ttk.Combobox(col_frame, textvariable=self.column_var, 
+                                        values=["ID", "FirstName", "LastName"],
+                                        state="readonly", width=12, font=("Segoe UI", 10))
+        self.column_menu.pack(side=tk.LEFT, padx=5)
+        self.column_menu.configure(foreground="black")
+        
+        # Row count selection
+        row_frame = tk.Frame(control_frame, bg="#1a2847")
+        row_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(row_frame, text="🔢 Rows (N):", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.row_var = tk.StringVar(value="1000")
+        self.row_menu = ttk.Combobox(row_frame, textvariable=self.row_var, 
+                                     values=["1000", "10000", "100000"],
+                                     state="readonly", width=12, font=("Segoe UI", 10))
+        self.row_menu.pack(side=tk.LEFT, padx=5)
+        self.row_menu.configure(foreground="black")
+        
+        # Sort order
+        order_frame = tk.Frame(control_frame, bg="#1a2847")
+        order_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(order_frame, text="⬆️ Order:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.order_var = tk.StringVar(value="Ascending")
+        self.order_menu = ttk.Combobox(order_frame, textvariable=self.order_var, 
+                                       values=["Ascending", "Descending"],
+                                       state="readonly", width=12, font=("Segoe UI", 10))
+        self.order_menu.pack(side=tk.LEFT, padx=5)
+        self.order_menu.configure(foreground="black")
+        
+        # Merge sort variant
+        merge_frame = tk.Frame(control_frame, bg="#1a2847")
+        merge_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(merge_frame, text="⛓️ Merge:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.merge_var = tk.StringVar(value="Recursive")
+        self.merge_menu = ttk.Combobox(merge_frame, textvariable=self.merge_var, 
+                                       values=["Recursive", "Bottom-Up", "Parallel"],
+                                       state="readonly", width=12, font=("Segoe UI", 10))
+        self.merge_menu.pack(side=tk.LEFT, padx=5)
+        self.merge_menu.configure(foreground="black")
+        
+        tk.Label(merge_frame, text="Workers:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(10, 10))
+        
+        cpu_count = os.cpu_count() or 1
+        self.workers_var = tk.StringVar(value=str(cpu_count))
+        self.workers_menu = ttk.Combobox(merge_frame, textvariable=self.workers_var, 
+                                         values=[str(w) for w in range(1, max(cpu_count, 8) + 1)],
+                                         state="readonly", width=4, font=("Segoe UI", 10))
+        self.workers_menu.pack(side=tk.LEFT, padx=5)
+        self.workers_menu.configure(foreground="black")
+        
+        # ===== COMPOSITE ORDER BY =====
+        order_by_frame = tk.Frame(self.root, bg="#1a2847")
+        order_by_frame.pack(fill=tk.X, padx=15, pady=(10, 0))
+        
+        tk.Label(order_by_frame, text="🧮 ORDER BY:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10), pady=10)
+        
+        self.order_by_var = tk.StringVar(value="")
+        self.order_by_entry = tk.Entry(order_by_frame, textvariable=self.order_by_var, width=40,
+                                       font=("Segoe UI", 10), disabledbackground="#1a2847")
+        self.order_by_entry.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(order_by_frame, text="optional, e.g. LastName, FirstName DESC, ID — overrides Column and Order",
+                font=("Segoe UI", 9), bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=10)
+        
+        # Name collation: keys are computed once per distinct name
+        tk.Label(order_by_frame, text="🔤 Names:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10))
+        
+        self.collation_names = {label: name for name, label in COLLATIONS.items()}
+        self.collation_var = tk.StringVar(value=COLLATIONS['binary'])
+        self.collation_menu = ttk.Combobox(order_by_frame, textvariable=self.collation_var, 
+                                           values=list(COLLATIONS.values()),
+                                           state="readonly", width=36, font=("Segoe UI", 10))
+        self.collation_menu.pack(side=tk.LEFT, padx=5)
+        self.collation_menu.configure(foreground="black")
+        
+        # Top-K preview: only the first K rows of the sorted order
+        tk.Label(order_by_frame, text="🏆 Top-K:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10))
+        
+        self.top_k_var = tk.StringVar(value="100")
+        self.top_k_menu = ttk.Combobox(order_by_frame, textvariable=self.top_k_var, 
+                                       values=["10", "100", "1000", "10000"],
+                                       state="readonly", width=6, font=("Segoe UI", 10))
+        self.top_k_menu.pack(side=tk.LEFT, padx=5)
+        self.top_k_menu.configure(foreground="black")
+        
+        self.top_k_method_var = tk.StringVar(value="Heap")
+        self.top_k_method_menu = ttk.Combobox(order_by_frame, textvariable=self.top_k_method_var, 
+                                              values=["Heap", "Quickselect"],
+                                              state="readonly", width=11, font=("Segoe UI", 10))
+        self.top_k_method_menu.pack(side=tk.LEFT, padx=5)
+        self.top_k_method_menu.configure(foreground="black")
+        
+        # ===== TIMING OPTIONS =====
+        timing_frame = tk.Frame(self.root, bg="#1a2847")
+        timing_frame.pack(fill=tk.X, padx=15, pady=(10, 0))
+        
+        tk.Label(timing_frame, text="⏱️ Repeats:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10), pady=10)
+        
+        self.repeat_var = tk.StringVar(value="1")
+        self.repeat_menu = ttk.Combobox(timing_frame, textvariable=self.repeat_var, 
+                                        values=["1", "3", "5", "10"],
+                                        state="readonly", width=4, font=("Segoe UI", 10))
+        self.repeat_menu.pack(side=tk.LEFT, padx=5)
+        self.repeat_menu.configure(foreground="black")
+        
+        tk.Label(timing_frame, text="Warmup:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10))
+        
+        self.warmup_var = tk.StringVar(value="0")
+        self.warmup_menu = ttk.Combobox(timing_frame, textvariable=self.warmup_var, 
+                                        values=["0", "1", "2"],
+                                        state="readonly", width=4, font=("Segoe UI", 10))
+        self.warmup_menu.pack(side=tk.LEFT, padx=5)
+        self.warmup_menu.configure(foreground="black")
+        
+        self.gc_var = tk.BooleanVar(value=True)
+        self.gc_check = tk.Checkbutton(timing_frame, text="Pause GC while timing", variable=self.gc_var,
+                                       font=("Segoe UI", 10), bg="#1a2847", fg="#45b7d1",
+                                       selectcolor="#0a0e27", activebackground="#1a2847",
+                                       activeforeground="#45b7d1")
+        self.gc_check.pack(side=tk.LEFT, padx=20)
+        
+        # Integer sort backend: NumPy is offered only when it is installed
+        tk.Label(timing_frame, text="🔢 Radix backend:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10))
+        
+        backends = ["Python", "NumPy"] if numpy_available() else ["Python"]
+        self.backend_var = tk.StringVar(value=backends[-1])
+        self.backend_menu = ttk.Combobox(timing_frame, textvariable=self.backend_var, 
+                                         values=backends,
+                                         state="readonly", width=8, font=("Segoe UI", 10))
+        self.backend_menu.pack(side=tk.LEFT, padx=5)
+        self.backend_menu.configure(foreground="black")
+        
+        # Finished sorts are reused for the same column / order / N / algorithm
+        tk.Label(timing_frame, text="📦 Result cache:", font=("Segoe UI", 11, "bold"), 
+                bg="#1a2847", fg="#45b7d1").pack(side=tk.LEFT, padx=(20, 10))
+        
+        self.cache_var = tk.StringVar(value="Memory")
+        self.cache_menu = ttk.Combobox(timing_frame, textvariable=self.cache_var, 
+                                       values=["Off", "Memory", "Memory + disk"],
+                                       state="readonly", width=14, font=("Segoe UI", 10))
+        self.cache_menu.pack(side=tk.LEFT, padx=5)
+        self.cache_menu.configure(foreground="black")
+        
+        # ===== BUTTON PANEL (Modern Buttons) =====
+        button_frame = tk.Frame(self.root, bg="#0a0e27")
+        button_frame.pack(pady=20)
+        
+        self.bubble_btn = self.create_modern_button(button_frame, "🔄\nBUBBLE\nSORT", 
+                                            lambda: self.run_sort("bubble"), 
+                                            self.button_colors["bubble"], 0)
+        
+        self.insertion_btn = self.create_modern_button(button_frame, "➡️\nINSERTION\nSORT", 
+                                               lambda: self.run_sort("insertion"), 
+                                               self.button_colors["insertion"], 1)
+        
+        self.merge_btn = self.create_modern_button(button_frame, "⛓️\nMERGE\nSORT", 
+                                           lambda: self.run_sort("merge"), 
+                                           self.button_colors["merge"], 2)
+        
+        self.hybrid_btn = self.create_modern_button(button_frame, "🧬\nHYBRID\nSORT", 
+                                            lambda: self.run_sort("hybrid"), 
+                                            self.button_colors["hybrid"], 3)
+        
+        self.radix_btn = self.create_modern_button(button_frame, "🔢\nRADIX\nSORT", 
+                                           lambda: self.run_sort("radix"), 
+                                           self.button_colors["radix"], 4)
+        
+        self.scaling_btn = self.create_modern_button(button_frame, "📈\nSCALING\nTEST", 
+                                             self.run_scaling_test, 
+                                             self.button_colors["scaling"], 5)
+        
+        self.tail_btn = self.create_modern_button(button_frame, "📥\nTAIL\nCSV", 
+                                          self.run_tail, 
+                                          self.button_colors["tail"], 6)
+        
+        self.topk_btn = self.create_modern_button(button_frame, "🏆\nTOP-K\nPREVIEW", 
+                                          lambda: self.run_sort("topk"), 
+                                          self.button_colors["topk"], 7)
+        
+        self.cancel_btn = self.create_modern_button(button_frame, "⛔\nCANCEL\nSORT", 
+                                            self.cancel_sort, 
+                                            self.button_colors["cancel"], 8)
+        self.cancel_btn.config(state="disabled")
+        
+        # ===== LOADING & STATUS AREA =====
+        self.status_frame = tk.Frame(self.root, bg="#0a0e27")
+        self.status_frame.pack(pady=(5, 10))
+        
+        self.loading_label = tk.Label(self.status_frame, text="", font=("Segoe UI", 10), 
+                                      bg="#0a0e27", fg="#45b7d1")
+        self.loading_label.pack()
+        
+        # ===== PROGRESS BAR =====
+        self.progress_frame = tk.Frame(self.root, bg="#0a0e27")
+        self.progress_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
+        
+        self.progress_bar = tk.Canvas(self.progress_frame, height=6, bg="#1a2847", highlightthickness=0)
+        self.progress_bar.pack(fill=tk.X)
+        
+        # ===== WARNING LABEL =====
+        self.warning_label = tk.Label(self.root, text="", font=("Segoe UI", 10), 
+                                      bg="#0a0e27", fg="#ffaa00")
+        self.warning_label.pack(pady=(0, 10))
+        
+        # ===== OUTPUT AREA (Modern Design) =====
+        output_header = tk.Frame(self.root, bg="#0a0e27")
+        output_header.pack(fill=tk.X, padx=15, pady=(10, 0))
+        
+        output_label = tk.Label(output_header, text="📊 SORTED RESULTS:", 
+                               font=("Segoe UI", 13, "bold"), 
+                               bg="#0a0e27", fg="#45b7d1")
+        output_label.pack(side=tk.LEFT, padx=0, pady=(0, 8))
+        
+        self.export_btn = tk.Button(output_header, text="💾 EXPORT SORTED", command=self.run_export,
+                                    font=("Segoe UI", 10, "bold"), bg=self.button_colors["export"],
+                                    fg="#000000", activebackground=self.lighten_color(self.button_colors["export"]),
+                                    border=0, cursor="hand2", padx=12, pady=4, state="disabled")
+        self.export_btn.pack(side=tk.RIGHT, pady=(0, 8))
+        
+        # Output text area with modern styling (run summary)
+        text_container = tk.Frame(self.root, bg="#0a0e27")
+        text_container.pack(fill=tk.X, padx=15, pady=(0, 10))
+        
+        # Modern border effect
+        outer_border = tk.Frame(text_container, bg="#45b7d1", highlightthickness=0)
+        outer_border.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        
+        inner_frame = tk.Frame(outer_border, bg="#121a3a")
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        
+        self.result_text = scrolledtext.ScrolledText(
+            inner_frame, 
+            height=13, 
+            width=165,
+            font=("Consolas", 9),
+            bg="#121a3a",
+            fg="#45b7d1",
+            insertbackground="#45b7d1",
+            relief=tk.FLAT,
+            borderwidth=0,
+            highlightthickness=0
+        )
+        self.result_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Sorted records: virtualized, only the visible rows are rendered
+        table_container = tk.Frame(self.root, bg="#45b7d1", highlightthickness=0)
+        table_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        
+        self.result_table = VirtualTable(
+            table_container,
+            columns=[("#", 80), ("ID", 110), ("FirstName", 200), ("LastName", 200)],
+            bg="#121a3a", fg="#45b7d1", heading_bg="#1a2847"
+        )
+        self.result_table.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+    
+    def create_modern_button(self, parent, text, command, color, column):
+        """Create a modern styled button with hover effect"""
+        btn_frame = tk.Frame(parent, bg="#0a0e27")
+        btn_frame.grid(row=0, column=column, padx=15, pady=0, sticky="nsew")
+        
+        btn = tk.Button(
+            btn_frame,
+            text=text,
+            command=command,
+            font=("Segoe UI", 11, "bold"),
+            bg=color,
+            fg="#000000",
+            padx=25, pady=25,
+            border=0,
+            cursor="hand2",
+            activebackground=self.lighten_color(color),
+            activeforeground="#000000",
+            relief=tk.RAISED,
+            bd=1,
+            highlightthickness=0
+        )
+        btn.pack()
+        
+        # Add hover effects
+        btn.bind("<Enter>", lambda e: btn.config(relief=tk.SUNKEN, bd=3))
+        btn.bind("<Leave>", lambda e: btn.config(relief=tk.RAISED, bd=1))
+        
+        return btn
+    
+    def lighten_color(self, hex_color):
+        """Lighten a hex color for hover effect"""
+        hex_color = hex_color.lstrip('#')
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        r = min(255, r + 40)
+        g = min(255, g + 40)
+        b = min(255, b + 40)
+        return '#{:02x}{:02x}{:02x}'.format(r, g, b)
+    
+    def format_duration(self, seconds):
+        """Short durations in s / ms, long ones in minutes and hours"""
+        return format_seconds(seconds) if seconds < 60 else format_eta(seconds)
+    
+    def format_record(self, record):
+        """Cell values for one record in the results table"""
+        return record.id, record.first_name, record.last_name
+    
+    def update_progress(self, percentage):
+        """Update progress bar"""
+        self.progress_bar.delete("all")
+        bar_width = self.progress_bar.winfo_width()
+        if bar_width > 1:
+            filled_width = (percentage / 100) * bar_width
+            self.progress_bar.create_rectangle(0, 0, filled_width, 6, fill="#45b7d1", outline="")
+    
+    def disable_buttons(self):
+        """Disable all buttons during sorting"""
+        self.bubble_btn.config(state="disabled")
+        self.insertion_btn.config(state="disabled")
+        self.merge_btn.config(state="disabled")
+        self.hybrid_btn.config(state="disabled")
+        self.radix_btn.config(state="disabled")
+        self.scaling_btn.config(state="disabled")
+        self.tail_btn.config(state="disabled")
+        self.topk_btn.config(state="disabled")
+        self.export_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.column_menu.config(state="disabled")
+        self.row_menu.config(state="disabled")
+        self.order_menu.config(state="disabled")
+        self.order_by_entry.config(state="disabled")
+        self.collation_menu.config(state="disabled")
+        self.top_k_menu.config(state="disabled")
+        self.top_k_method_menu.config(state="disabled")
+        self.merge_menu.config(state="disabled")
+        self.workers_menu.config(state="disabled")
+        self.repeat_menu.config(state="disabled")
+        self.warmup_menu.config(state="disabled")
+        self.backend_menu.config(state="disabled")
+        self.cache_menu.config(state="disabled")
+        self.gc_check.config(state="disabled")
+    
+    def enable_buttons(self):
+        """Enable all buttons"""
+        self.bubble_btn.config(state="normal")
+        self.insertion_btn.config(state="normal")
+        self.merge_btn.config(state="normal")
+        self.hybrid_btn.config(state="normal")
+        self.radix_btn.config(state="normal")
+        self.scaling_btn.config(state="normal")
+        self.tail_btn.config(state="normal")
+        self.topk_btn.config(state="normal")
+        self.export_btn.config(state="normal" if self.last_order is not None else "disabled")
+        self.cancel_btn.config(state="disabled")
+        self.column_menu.config(state="readonly")
+        self.row_menu.config(state="readonly")
+        self.order_menu.config(state="readonly")
+        self.order_by_entry.config(state="normal")
+        self.collation_menu.config(state="readonly")
+        self.top_k_menu.config(state="readonly")
+        self.top_k_method_menu.config(state="readonly")
+        self.merge_menu.config(state="readonly")
+        self.workers_menu.config(state="readonly")
+        self.repeat_menu.config(state="readonly")
+        self.warmup_menu.config(state="readonly")
+        self.backend_menu.config(state="readonly")
+        self.cache_menu.config(state="readonly")
+        self.gc_check.config(state="normal")
+    
+    def run_sort(self, sort_type):
+        """Read the controls, then sort on a worker thread"""
+        if not self.data_manager:
+            messagebox.showerror("Error", "Data not loaded!")
+            return
+        
+        # Tk variables are read here, on the main thread; the worker only
+        # gets plain values and reports back through self.worker
+        column, order = self.read_sort_order()
+        if column is None:
+            return
+        collation = self.collation_names[self.collation_var.get()]
+        n = min(int(self.row_var.get()), self.data_manager.get_total_count())
+        merge_mode = self.merge_var.get()
+        workers = int(self.workers_var.get())
+        timing = {"repeat": int(self.repeat_var.get()), "warmup": int(self.warmup_var.get()),
+                  "disable_gc": self.gc_var.get()}
+        if sort_type == "radix" and self.backend_var.get() == "NumPy":
+            sort_type = "numpy"
+        top_k = None
+        if sort_type == "topk":
+            top_k = int(self.top_k_var.get())
+            sort_type = "topk_heap" if self.top_k_method_var.get() == "Heap" else "topk_select"
+        cache = None
+        # A top-K result is not a prefix-filterable full sort, so it is not cached
+        if self.cache_var.get() != "Off" and top_k is None:
+            cache = self.result_cache
+            cache.directory = (sort_cache_dir_for(self.data_manager.csv_path)
+                               if self.cache_var.get() == "Memory + disk" else None)
+        
+        emoji = {"bubble": "🔄", "insertion": "➡️", "merge": "⛓️", "hybrid": "🧬", "radix": "🔢",
+                 "numpy": "🔢", "topk_heap": "🏆", "topk_select": "🏆"}[sort_type]
+        algo_name = {"bubble": "BUBBLE SORT", "insertion": "INSERTION SORT", "merge": "MERGE SORT",
+                     "hybrid": "HYBRID SORT", "radix": "RADIX SORT", "numpy": "NUMPY ARGSORT",
+                     "topk_heap": f"TOP-{top_k} (HEAP)", "topk_select": f"TOP-{top_k} (QUICKSELECT)"}[sort_type]
+        if sort_type == "merge" and merge_mode != "Recursive":
+            algo_name = f"{algo_name} ({merge_mode.upper()})"
+        self.current_run = {"sort_type": sort_type, "emoji": emoji, "algo_name": algo_name,
+                            "column": column, "collation": collation, "n": n, "order": order,
+                            "merge_mode": merge_mode, "workers": workers, "top_k": top_k, **timing}
+        
+        # ===== PHASE 1: LOADING CSV =====
+        self.disable_buttons()
+        self.update_progress(0)
+        self.result_table.clear()
+        self.last_order = None
+        self.loading_label.config(text="⏳ Loading CSV data...", fg="#ffaa00")
+        self.show_parameters("PROCESSING", "⏳ Loading CSV...\n")
+        
+        # Warn before long runs, using the measured fit when there is one
+        fit = self.scaling_fits.get(self.fit_key(sort_type, merge_mode, column, order))
+        if fit is not None and fit.predict(n) > 5:
+            warning = (f"⚠️  Scaling test predicts {algo_name} on {n:,} records takes "
+                       f"about {format_eta(fit.predict(n))} per run")
+            self.warning_label.config(text=warning, fg="#ff6b6b")
+        elif n > 10000 and sort_type in ["bubble", "insertion"]:
+            warning = f"⚠️  WARNING: {algo_name} on {n:,} records will take several minutes!"
+            self.warning_label.config(text=warning, fg="#ff6b6b")
+        else:
+            self.warning_label.config(text="")
+        
+        # The sorts call the meter from the worker thread; it only posts
+        # throttled progress messages and reports a pending cancel
+        self.meter = ProgressMeter(
+            on_update=lambda fraction, elapsed, eta: self.worker.post("progress", fraction, elapsed, eta)
+        )
+        self.worker.start(self.execute_sort, sort_type, column, collation, n, order == "Descending",
+                          merge_mode, workers, top_k, timing, cache, self.meter)
+    
+    def read_sort_order(self):
+        """(column, order) from the controls; a composite ORDER BY wins over both"""
+        order_by = self.order_by_var.get().strip()
+        if not order_by:
+            return self.column_var.get(), self.order_var.get()
+        try:
+            # The canonical spec doubles as the key-cache and scaling-fit name
+            return format_order_by(parse_order_by(order_by)), "Per column"
+        except ValueError as e:
+            messagebox.showerror("ORDER BY", str(e))
+            return None, None
+    
+    def fit_key(self, sort_type, merge_mode, column, order):
+        """Scaling fits are kept per algorithm variant, column and order"""
+        algo = f"merge:{merge_mode}" if sort_type == "merge" else sort_type
+        return algo, column, order
+    
+    def run_scaling_test(self):
+        """Time every algorithm on growing N and fit n / n log n / n² models"""
+        if not self.data_manager:
+            messagebox.showerror("Error", "Data not loaded!")
+            return
+        
+        column, order = self.read_sort_order()
+        if column is None:
+            return
+        collation = self.collation_names[self.collation_var.get()]
+        n = min(int(self.row_var.get()), self.data_manager.get_total_count())
+        merge_mode = self.merge_var.get()
+        workers = int(self.workers_var.get())
+        if n < 2 * SCALING_START:
+            messagebox.showinfo("Scaling Test", f"Pick at least {2 * SCALING_START:,} rows for a scaling test.")
+            return
+        
+        self.current_run = {"sort_type": "scaling", "emoji": "📈", "algo_name": "SCALING TEST",
+                            "column": column, "collation": collation, "n": n, "order": order,
+                            "merge_mode": merge_mode, "workers": workers}
+        self.disable_buttons()
+        self.update_progress(0)
+        self.result_table.clear()
+        self.last_order = None
+        self.warning_label.config(text="")
+        self.loading_label.config(text="⏳ Timing every algorithm on growing N...", fg="#ffaa00")
+        self.show_parameters("RUNNING", f"⏳ Timing N = {SCALING_START:,}, {2 * SCALING_START:,}, ... up to {n:,} "
+                                        f"(points over {SCALING_POINT_S:.0f} s are extrapolated)...\n")
+        
+        self.meter = ProgressMeter(
+            on_update=lambda fraction, elapsed, eta: self.worker.post("progress", fraction, elapsed, eta)
+        )
+        self.worker.start(self.execute_scaling, column, collation, n, order == "Descending", merge_mode, workers,
+                          self.meter)
+    
+    def execute_scaling(self, column, collation, n, reverse, merge_mode, workers, meter):
+        """Worker thread: fit each algorithm's timings over geometric N"""
+        try:
+            keys = self.data_manager.get_sort_keys(column, n, collation)
+            key = keys.__getitem__
+            if merge_mode == "Parallel":
+                merge = lambda idx: parallel_merge_sort(idx, key, reverse, workers)
+            elif merge_mode == "Bottom-Up":
+                merge = lambda idx: bottom_up_merge_sort(idx, key, reverse)
+            else:
+                merge = lambda idx: merge_sort(idx, key, reverse)
+            algorithms = [
+                ("bubble", lambda idx: bubble_sort(idx, key, reverse)),
+                ("insertion", lambda idx: insertion_sort(idx, key, reverse)),
+                ("merge", merge),
+                ("hybrid", lambda idx: hybrid_sort(idx, key, reverse)),
+                ("radix", lambda idx: radix_sort(idx, key, reverse)),
+            ]
+            sizes = geometric_sizes(SCALING_START, n)
+            
+            fits = {}
+            for done, (sort_type, sort) in enumerate(algorithms):
+                def time_at(m):
+                    # Median of 3 after one warmup; the prefix keys serve every N
+                    return measure(sort, 3, 1, setup=lambda: (list(range(m)),)).median_s
+                
+                def on_point(m, seconds):
+                    step = sizes.index(m) + 1
+                    if meter((done + step / len(sizes)) / len(algorithms)) is False:
+                        raise SortCancelled("scaling test cancelled")
+                
+                points = run_scaling(time_at, sizes, SCALING_POINT_S, on_point)
+                fits[sort_type] = fit_scaling(points) if len(points) >= 2 else None
+            
+            self.worker.post("scaling", fits)
+        except SortCancelled:
+            self.worker.post("cancelled", meter.fraction, meter.elapsed)
+    
+    def run_tail(self):
+        """Read rows appended to the CSV into the maintained sorted index"""
+        if not self.data_manager:
+            messagebox.showerror("Error", "Data not loaded!")
+            return
+        
+        column, order = self.read_sort_order()
+        if column is None:
+            return
+        if column not in SORT_COLUMNS:
+            messagebox.showinfo("Tail CSV", "The live sorted index covers one column; clear ORDER BY first.")
+            return
+        collation = self.collation_names[self.collation_var.get()]
+        
+        self.current_run = {"sort_type": "tail", "emoji": "📥", "algo_name": "LIVE SORTED INDEX",
+                            "column": column, "collation": collation,
+                            "n": self.data_manager.get_total_count(), "order": order,
+                            "merge_mode": self.merge_var.get(), "workers": 1}
+        self.disable_buttons()
+        self.update_progress(0)
+        self.result_table.clear()
+        self.last_order = None
+        self.warning_label.config(text="")
+        self.loading_label.config(text="⏳ Reading appended rows...", fg="#ffaa00")
+        self.worker.start(self.execute_tail, column, collation, order == "Descending")
+    
+    def execute_tail(self, column, collation, reverse):
+        """Worker thread: build the index once, then absorb appended rows"""
+        start = time.perf_counter()
+        index = self.data_manager.sorted_index(column, collation)
+        build_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        added = self.data_manager.tail()
+        tail_time = time.perf_counter() - start
+        
+        self.worker.post("tailed", index.order(reverse), added, build_time, tail_time)
+    
+    def run_export(self):
+        """Write the records in the table, in sorted order, to a CSV, JSON Lines or columnar file"""
+        if self.last_order is None:
+            return
+        run = self.current_run
+        name = run["column"] if run["column"] in SORT_COLUMNS else "OrderBy"
+        path = filedialog.asksaveasfilename(
+            title="Export sorted records",
+            initialfile=f"sorted_{name}_{run['order'].lower()}.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("CSV, gzip", "*.csv.gz"),
+                       ("JSON Lines", "*.jsonl"), ("JSON Lines, gzip", "*.jsonl.gz"),
+                       ("Columnar", "*.srtc"), ("Columnar, gzip", "*.srtc.gz")]
+        )
+        if not path:
+            return
+        try:
+            export_format(path)
+        except ValueError as e:
+            messagebox.showerror("Export", str(e))
+            return
+        
+        self.export_path = path
+        self.disable_buttons()
+        self.update_progress(0)
+        self.loading_label.config(text=f"⏳ Exporting to {os.path.basename(path)}...", fg="#ffaa00")
+        self.meter = ProgressMeter(
+            on_update=lambda fraction, elapsed, eta: self.worker.post("progress", fraction, elapsed, eta)
+        )
+        self.worker.start(self.execute_export, self.last_order, path, self.meter)
+    
+    def execute_export(self, order_idx, path, meter):
+        """Worker thread: write the sorted rows in batches, posting the outcome"""
+        try:
+            stats = export_sorted(self.data_manager.store, order_idx, path, progress=meter)
+        except SortCancelled:
+            self.worker.post("exported", None, "Export cancelled, no file written")
+        except OSError as e:
+            self.worker.post("exported", None, f"Export failed: {e}")
+        else:
+            self.worker.post("exported", stats, None)
+    
+    def cancel_sort(self):
+        """Ask the running sort to stop at its next progress check"""
+        if self.meter is not None and self.worker.busy:
+            self.meter.cancel()
+            self.loading_label.config(text="⛔ Cancelling...", fg="#ffaa00")
+    
+    def execute_sort(self, sort_type, column, collation, n, reverse, merge_mode, workers, top_k, timing, cache,
+                     meter):
+        """Worker thread: load the keys and sort them, posting results to the queue"""
+        post = self.worker.post
+        try:
+            self.run_selected_sort(sort_type, column, collation, n, reverse, merge_mode, workers, top_k,
+                                   timing, cache, meter)
+        except SortCancelled:
+            post("cancelled", meter.fraction, meter.elapsed)
+    
+    def run_selected_sort(self, sort_type, column, collation, n, reverse, merge_mode, workers, top_k,
+                          timing, cache, meter):
+        """Load the key column and time the selected sort, or reuse a cached result (worker thread)"""
+        post = self.worker.post
+        
+        # Load the key column with timing; the sorts below work on an
+        # index permutation over these integer keys
+        load_start = time.perf_counter()
+        keys = self.data_manager.get_sort_keys(column, n, collation)
+        indices = list(range(len(keys)))
+        load_time = time.perf_counter() - load_start
+        post("sorting", load_time)
+        
+        # The same query (or a smaller N of a cached one) skips the sort
+        if cache is not None:
+            lookup_start = time.perf_counter()
+            algorithm = f"merge:{merge_mode}" if sort_type == "merge" else sort_type
+            cache_key = result_key(self.data_manager.fingerprint(), column, collation, reverse, algorithm)
+            found = cache.lookup(cache_key, len(keys))
+            if found is not None:
+                post("cached", found[0], load_time, time.perf_counter() - lookup_start, found[1])
+                return
+        
+        key = keys.__getitem__
+        if sort_type == "bubble":
+            sort = lambda hook: bubble_sort(indices, key, reverse, progress=hook)
+        elif sort_type == "insertion":
+            sort = lambda hook: insertion_sort(indices, key, reverse, progress=hook)
+        elif sort_type == "merge" and merge_mode == "Parallel":
+            # No progress hook: the work happens in other processes
+            sort = lambda hook: parallel_merge_sort(indices, key, reverse, workers)
+        elif sort_type == "merge" and merge_mode == "Bottom-Up":
+            sort = lambda hook: bottom_up_merge_sort(indices, key, reverse, progress=hook)
+        elif sort_type == "merge":
+            sort = lambda hook: merge_sort(indices, key, reverse, progress=hook)
+        elif sort_type == "hybrid":
+            sort = lambda hook: hybrid_sort(indices, key, reverse, progress=hook)
+        elif sort_type == "radix":
+            # Every column is an integer key here: IDs, or ranks of the names
+            sort = lambda hook: radix_sort(indices, key, reverse, progress=hook)
+        elif sort_type == "numpy":
+            # One stable argsort straight over the key column; the permutation
+            # stays an ndarray and is applied to the columns in on_result
+            sort = lambda hook: (argsort_keys(keys, reverse),)
+        elif sort_type == "topk_heap":
+            sort = lambda hook: heap_top_k(indices, key, top_k, reverse, progress=hook)
+        elif sort_type == "topk_select":
+            sort = lambda hook: quickselect_top_k(indices, key, top_k, reverse, progress=hook)
+        
+        # Time warmup + repeat runs with the shared harness; the meter sees
+        # one fraction across all of them, so the ETA covers the whole batch
+        runs = timing["warmup"] + timing["repeat"]
+        started = [0]
+        
+        def next_run():
+            run = started[0]
+            started[0] += 1
+            return (lambda fraction: meter((run + fraction) / runs),)
+        
+        results = []
+        stats = measure(sort, timing["repeat"], timing["warmup"], timing["disable_gc"],
+                        setup=next_run, on_result=lambda run, value: results.append(value[0]))
+        
+        # Baselines: the serial merge sort for Parallel, the built-in
+        # sorted() (CPython's Timsort in C) for the hybrid sort, and the
+        # full radix sort a top-K preview avoids
+        baseline_stats = None
+        if sort_type == "merge" and merge_mode == "Parallel":
+            baseline_stats = measure(lambda: merge_sort(indices, key, reverse), timing["repeat"],
+                                     timing["warmup"], timing["disable_gc"])
+        elif sort_type == "hybrid":
+            baseline_stats = measure(lambda: sorted(indices, key=key, reverse=reverse), timing["repeat"],
+                                     timing["warmup"], timing["disable_gc"])
+        elif top_k is not None:
+            baseline_stats = measure(lambda: radix_sort(indices, key, reverse), timing["repeat"],
+                                     timing["warmup"], timing["disable_gc"])
+        
+        if cache is not None:
+            cache.put(cache_key, len(keys), results[0])
+        post("result", results[0], load_time, stats, baseline_stats)
+    
+    # ========================================================================
+    # WORKER MESSAGES (run on the Tk main thread)
+    # ========================================================================
+    
+    def show_parameters(self, status, footer, load_time=None):
+        """Rewrite the summary with the current run's parameters"""
+        run = self.current_run
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{run['emoji']} {run['algo_name']} - {status}\n")
+        self.result_text.insert(tk.END, "=" * 150 + "\n\n")
+        self.result_text.insert(tk.END, "📋 Parameters:\n")
+        self.result_text.insert(tk.END, f"   • Column: {run['column']}\n")
+        self.result_text.insert(tk.END, f"   • Names: {COLLATIONS[run['collation']]}\n")
+        self.result_text.insert(tk.END, f"   • Rows (N): {run['n']:,}\n")
+        self.result_text.insert(tk.END, f"   • Order: {run['order']}\n")
+        if load_time is not None:
+            self.result_text.insert(tk.END, f"   • Data Load Time: {load_time*1000:.3f} ms\n")
+        self.result_text.insert(tk.END, "\n" + footer)
+        self.result_text.config(state="disabled")
+    
+    def on_sorting(self, load_time):
+        # ===== PHASE 2: SORTING =====
+        run = self.current_run
+        self.loading_label.config(text=f"⏳ Sorting {run['n']:,} records with {run['algo_name']}...", fg="#ffaa00")
+        self.show_parameters("SORTING IN PROGRESS", "⏳ Sorting in progress...\n", load_time)
+    
+    def on_progress(self, fraction, elapsed, eta):
+        run = self.current_run
+        if self.meter is not None and self.meter.cancelled:
+            return
+        self.update_progress(fraction * 100)
+        if self.export_path is not None:
+            task = f"⏳ Exporting {len(self.last_order):,} records to {os.path.basename(self.export_path)}"
+        elif run["sort_type"] == "scaling":
+            task = "⏳ Scaling test"
+        else:
+            task = f"⏳ Sorting {run['n']:,} records with {run['algo_name']}"
+        self.loading_label.config(
+            text=f"{task}... {fraction:.1%} • {elapsed:.1f}s elapsed • ETA {format_eta(eta)}",
+            fg="#ffaa00"
+        )
+    
+    def on_result(self, order_idx, load_time, stats, baseline_stats):
+        # ===== PHASE 3: DISPLAY RESULTS =====
+        run = self.current_run
+        self.update_progress(100)
+        
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{run['emoji']} {run['algo_name']} - ✅ COMPLETED\n")
+        self.result_text.insert(tk.END, "=" * 150 + "\n\n")
+        
+        self.result_text.insert(tk.END, "⏱️  TIMING RESULTS:\n")
+        self.result_text.insert(tk.END, f"   • CSV Load Time:   {load_time*1000:.3f} ms\n")
+        self.result_text.insert(tk.END, f"   • Sort Time:       {stats.summary()}\n")
+        if stats.repeat > 1:
+            low, high = stats.ci95_s
+            self.result_text.insert(tk.END, f"   • Mean / Median:   {stats.mean_s:.6f} s / {stats.median_s:.6f} s\n")
+            self.result_text.insert(tk.END, f"   • Std Dev:         {stats.stdev_s:.6f} s (95% CI {low:.6f} – {high:.6f} s)\n")
+        gc_note = ", GC paused" if stats.gc_disabled else ""
+        self.result_text.insert(tk.END, f"   • Runs:            {stats.warmup} warmup + {stats.repeat} timed{gc_note}\n")
+        self.result_text.insert(tk.END, f"   • Total Time:      {load_time + stats.mean_s:.6f} seconds (load + mean sort)\n\n")
+        
+        # Algorithm analysis: measured when a scaling test has been run
+        theoretical = {"bubble": "O(n²)", "insertion": "O(n²)", "radix": "O(n · key bytes)",
+                       "topk_heap": "O(n log k)", "topk_select": "O(n + k log k) expected",
+                       "numpy": "O(n log n), compiled"}.get(run["sort_type"], "O(n log n)")
+        fit = self.scaling_fits.get(self.fit_key(run["sort_type"], run["merge_mode"], run["column"], run["order"]))
+        self.result_text.insert(tk.END, "🔍 ALGORITHM ANALYSIS:\n")
+        if fit is None:
+            self.result_text.insert(tk.END, f"   • Complexity: {theoretical} (theoretical; run 📈 SCALING TEST for a measured fit)\n")
+        else:
+            self.result_text.insert(tk.END, f"   • Complexity: measured ~n^{fit.exponent:.2f}, best fit O({fit.best.name}) "
+                                            f"(theoretical {theoretical})\n")
+            self.result_text.insert(tk.END, f"   • Predicted Sort Time: {fit.predict(run['n']):.6f} s "
+                                            f"(measured mean {stats.mean_s:.6f} s)\n")
+        self.result_text.insert(tk.END, f"   • Records Sorted: {len(order_idx):,}\n")
+        if baseline_stats is not None and run["sort_type"] == "hybrid":
+            ratio = stats.mean_s / baseline_stats.mean_s if baseline_stats.mean_s > 0 else float('inf')
+            self.result_text.insert(tk.END, f"   • Built-in sorted(): {baseline_stats.summary()}\n")
+            self.result_text.insert(tk.END, f"   • Hybrid vs sorted(): {ratio:.1f}× slower "
+                                            f"(same Timsort strategy, pure Python vs C)\n")
+        elif baseline_stats is not None and run["top_k"] is not None:
+            speedup = baseline_stats.mean_s / stats.mean_s if stats.mean_s > 0 else float('inf')
+            self.result_text.insert(tk.END, f"   • Full Radix Sort of {run['n']:,}: {baseline_stats.summary()}\n")
+            self.result_text.insert(tk.END, f"   • Top-{run['top_k']} vs full sort: {speedup:.2f}× faster\n")
+        elif baseline_stats is not None:
+            speedup = baseline_stats.mean_s / stats.mean_s if stats.mean_s > 0 else float('inf')
+            self.result_text.insert(tk.END, f"   • Workers: {run['workers']}\n")
+            self.result_text.insert(tk.END, f"   • Serial Merge Sort: {baseline_stats.summary()}\n")
+            self.result_text.insert(tk.END, f"   • Parallel Speedup: {speedup:.2f}×\n")
+        self.result_text.insert(tk.END, "\n")
+        
+        # All sorted records go to the virtual table, which formats
+        # rows from the column store only as they scroll into view
+        self.result_text.insert(tk.END, f"📊 ALL {len(order_idx):,} SORTED RECORDS (Sorted by {run['column']}) are listed below\n")
+        self.result_text.insert(tk.END, "✅ Sorting completed successfully!\n")
+        self.result_text.config(state="disabled")
+        self.show_sorted_rows(order_idx)
+    
+    def on_cached(self, order_idx, load_time, lookup_s, source):
+        run = self.current_run
+        cache = self.result_cache
+        self.update_progress(100)
+        
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{run['emoji']} {run['algo_name']} - ✅ FROM CACHE\n")
+        self.result_text.insert(tk.END, "=" * 150 + "\n\n")
+        
+        self.result_text.insert(tk.END, "📦 CACHED RESULT:\n")
+        self.result_text.insert(tk.END, f"   • Source:          {source} (not sorted again)\n")
+        self.result_text.insert(tk.END, f"   • CSV Load Time:   {load_time*1000:.3f} ms\n")
+        self.result_text.insert(tk.END, f"   • Lookup Time:     {format_seconds(lookup_s)}\n")
+        self.result_text.insert(tk.END, f"   • Cache:           {len(cache)} results, {cache.bytes_used / 1e6:.1f} MB "
+                                        f"of {cache.budget_bytes / 1e6:.0f} MB, {cache.hits} hits / {cache.misses} misses\n")
+        self.result_text.insert(tk.END, "   • Set 📦 Result cache to Off to time the sort again\n\n")
+        self.result_text.insert(tk.END, f"📊 ALL {len(order_idx):,} SORTED RECORDS (Sorted by {run['column']}) are listed below\n")
+        self.result_text.config(state="disabled")
+        self.show_sorted_rows(order_idx)
+    
+    def on_tailed(self, order_idx, added, build_time, tail_time):
+        run = self.current_run
+        self.update_progress(100)
+        
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{run['emoji']} {run['algo_name']} - ✅ UP TO DATE\n")
+        self.result_text.insert(tk.END, "=" * 150 + "\n\n")
+        
+        self.result_text.insert(tk.END, "📥 APPENDED ROWS:\n")
+        self.result_text.insert(tk.END, f"   • New Rows:        {added:,} (now {len(order_idx):,} in total)\n")
+        self.result_text.insert(tk.END, f"   • Index Time:      {format_seconds(tail_time)} to read and insert them "
+                                        f"(no re-sort)\n")
+        if build_time >= 1e-3:
+            self.result_text.insert(tk.END, f"   • Index Built:     {format_seconds(build_time)} (first use of this "
+                                            f"column, one full sort)\n")
+        self.result_text.insert(tk.END, f"   • Column:          {run['column']} | Names: {COLLATIONS[run['collation']]} "
+                                        f"| Order: {run['order']}\n")
+        self.result_text.insert(tk.END, "   • Press 📥 TAIL CSV again after more rows are appended\n\n")
+        self.result_text.insert(tk.END, f"📊 ALL {len(order_idx):,} SORTED RECORDS (Sorted by {run['column']}) are listed below\n")
+        self.result_text.config(state="disabled")
+        self.show_sorted_rows(order_idx)
+    
+    def on_exported(self, stats, problem):
+        self.update_progress(0)
+        if stats is None:
+            self.loading_label.config(text=f"⛔ {problem}", fg="#ffaa00")
+            return
+        self.result_text.config(state="normal")
+        self.result_text.insert(tk.END, f"💾 Exported to {stats.path}: {stats.summary()}\n")
+        self.result_text.see(tk.END)
+        self.result_text.config(state="disabled")
+        self.loading_label.config(text=f"✅ Exported {stats.rows:,} records", fg="#45b7d1")
+    
+    def show_sorted_rows(self, order_idx):
+        """Fill the virtual table from a sort permutation and reset the status"""
+        store = self.data_manager.store
+        self.last_order = order_idx
+        if type(order_idx).__module__ == "numpy":
+            # Gather ID and name codes in sorted order in one vectorized pass
+            sorted_store = store.take(order_idx)
+            row = sorted_store.row
+        else:
+            row = lambda i: store.row(order_idx[i])
+        self.result_table.set_rows(
+            len(order_idx),
+            lambda i: (i + 1, *self.format_record(row(i)))
+        )
+        
+        self.warning_label.config(text="")
+        self.loading_label.config(text="✅ Ready for new sort", fg="#45b7d1")
+        
+        # Reset progress bar after brief delay
+        self.root.after(500, lambda: self.update_progress(0))
+    
+    def on_scaling(self, fits):
+        run = self.current_run
+        total = self.data_manager.get_total_count()
+        self.update_progress(100)
+        
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{run['emoji']} {run['algo_name']} - ✅ COMPLETED\n")
+        self.result_text.insert(tk.END, "=" * 150 + "\n\n")
+        self.result_text.insert(tk.END, f"📋 Column: {run['column']} | Order: {run['order']} | Merge: {run['merge_mode']}\n\n")
+        self.result_text.insert(tk.END, f"{'ALGORITHM':<12} {'LARGEST N':>10} {'EXPONENT':>9}  {'BEST FIT':<12} "
+                                        f"{'PREDICTED @ ' + format(run['n'], ','):>22} {'PREDICTED @ ' + format(total, ','):>22}\n")
+        
+        for sort_type, fit in fits.items():
+            if fit is None:
+                self.result_text.insert(tk.END, f"{sort_type:<12} (fewer than two sizes fit in {SCALING_POINT_S:.0f} s)\n")
+                continue
+            self.scaling_fits[self.fit_key(sort_type, run["merge_mode"], run["column"], run["order"])] = fit
+            self.result_text.insert(tk.END, f"{sort_type:<12} {fit.points[-1][0]:>10,} {fit.exponent:>9.2f}  "
+                                            f"{'O(' + fit.best.name + ')':<12} {self.format_duration(fit.predict(run['n'])):>22} "
+                                            f"{self.format_duration(fit.predict(total)):>22}\n")
+        
+        self.result_text.insert(tk.END, "\nSort results now report the measured complexity, and long runs are "
+                                        "warned about with the predicted time.\n")
+        self.result_text.config(state="disabled")
+        self.loading_label.config(text="✅ Scaling test finished", fg="#45b7d1")
+        self.root.after(500, lambda: self.update_progress(0))
+    
+    def on_cancelled(self, fraction, elapsed):
+        run = self.current_run
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{run['emoji']} {run['algo_name']} - ⛔ CANCELLED\n")
+        self.result_text.insert(tk.END, "=" * 150 + "\n\n")
+        self.result_text.insert(tk.END, f"   • Stopped at about {fraction:.1%} after {elapsed:.3f} seconds\n")
+        if fraction > 0:
+            self.result_text.insert(tk.END, f"   • Estimated full run: {format_eta(elapsed / fraction)}\n")
+        self.result_text.config(state="disabled")
+        self.result_table.clear()
+        self.last_order = None
+        self.update_progress(0)
+        self.warning_label.config(text="")
+        self.loading_label.config(text="⛔ Sort cancelled", fg="#ffaa00")
+    
+    def on_error(self, e):
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"❌ ERROR: {str(e)}\n")
+        self.result_text.config(state="disabled")
+        self.result_table.clear()
+        self.last_order = None
+        self.update_progress(0)
+        self.loading_label.config(text="❌ Error occurred", fg="#ff6b6b")
+        messagebox.showerror("Error", f"Sorting failed: {str(e)}")
+    
+    def on_done(self):
+        self.export_path = None
+        self.enable_buttons()
@@ -0,0 +1,778 @@
+"""
+Record storage and CSV loading for the Sorting Algorithm Stress Test
+Design & Analysis of Algorithms Lab - Prelim Exam
+
+Columnar record store, binary column cache and the CSV data manager.
+"""
+
+import time
+import os
+import sys
+import mmap
+import struct
+from array import array
+from typing import Any, Callable, List, Tuple, Dict, Iterator, Optional
+
+from sortedindex import SortedIndex
+
+
+# ============================================================================
+# DATA STRUCTURES
+# ============================================================================
+
+SORT_COLUMNS = ('ID', 'FirstName', 'LastName')
+
+
+def parse_order_by(spec: str) -> List[Tuple[str, bool]]:
+    """
+    Parse an ORDER BY list into (column, descending) terms
+    
+    'LastName, FirstName DESC, ID' -> [('LastName', False),
+    ('FirstName', True), ('ID', False)]. Column names and ASC/DESC are
+    case-insensitive; unknown or repeated columns raise ValueError.
+    """
+    by_name = {name.lower(): name for name in SORT_COLUMNS}
+    terms: List[Tuple[str, bool]] = []
+    for part in spec.split(','):
+        words = part.split()
+        if not 1 <= len(words) <= 2:
+            raise ValueError(f"ORDER BY term must be '<column> [ASC|DESC]', got {part.strip()!r}")
+        column = by_name.get(words[0].lower())
+        if column is None:
+            raise ValueError(f"Unknown column {words[0]!r} (choose from {', '.join(SORT_COLUMNS)})")
+        direction = words[1].upper() if len(words) == 2 else 'ASC'
+        if direction not in ('ASC', 'DESC'):
+            raise ValueError(f"Sort direction must be ASC or DESC, got {words[1]!r}")
+        if any(column == seen for seen, _ in terms):
+            raise ValueError(f"Column {column} appears twice in ORDER BY")
+        terms.append((column, direction == 'DESC'))
+    return terms
+
+
+def format_order_by(terms: List[Tuple[str, bool]]) -> str:
+    """The canonical spelling of parsed terms, e.g. 'LastName ASC, ID DESC'"""
+    return ', '.join(f"{column} {'DESC' if descending else 'ASC'}" for column, descending in terms)
+
+
+# Name collations, from strictest to loosest. Names that collate equal get
+# the same rank, so a stable sort keeps them in file order.
+COLLATIONS = {
+    'binary': 'Exact (code point) order',
+    'casefold': 'Ignore case',
+    'accents': 'Ignore case and accents',
+    'natural': 'Ignore case and accents, numbers by value',
+}
+
+
+def collation_key_func(collation: str) -> Optional[Callable[[str], Any]]:
+    """
+    The per-name key function of a collation (None for binary order)
+    
+    'casefold' compares str.casefold(), so "de la Cruz" and "De La Cruz"
+    tie. 'accents' also drops combining marks after NFKD decomposition
+    ("José" == "jose"). 'natural' additionally compares digit runs as
+    numbers, so "Name2" sorts before "Name10".
+    """
+    if collation not in COLLATIONS:
+        raise ValueError(f"Unknown collation {collation!r} (choose from {', '.join(COLLATIONS)})")
+    if collation == 'binary':
+        return None
+    if collation == 'casefold':
+        return str.casefold
+    
+    import unicodedata
+    
+    def fold(name: str) -> str:
+        decomposed = unicodedata.normalize('NFKD', name.casefold())
+        return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    
+    if collation == 'accents':
+        return fold
+    
+    import re
+    split_digits = re.compile(r'(\d+)').split
+    
+    def natural(name: str) -> tuple:
+        # re.split puts the digit runs at the odd positions, so two keys
+        # always compare str with str and int with int
+        parts: List[Any] = split_digits(fold(name))
+        parts[1::2] = [int(part) for part in parts[1::2]]
+        return tuple(parts)
+    
+    return natural
+
+
+class Record:
+    """Represents a single CSV record (a lightweight row view built from a ColumnStore)"""
+    __slots__ = ('id', 'first_name', 'last_name')
+    
+    def __init__(self, id_val: int, first_name: str, last_name: str):
+        self.id = id_val
+        self.first_name = first_name
+        self.last_name = last_name
+    
+    def __repr__(self):
+        return f"Record(ID={self.id}, First={self.first_name}, Last={self.last_name})"
+
+
+class ColumnStore:
+    """
+    Column-oriented storage for CSV rows
+    
+    IDs live in a signed 64-bit array. First and last names are
+    dictionary-encoded: every distinct name is stored once in `names` and
+    rows keep int32 codes into it. Row objects are only created on demand.
+    """
+    
+    def __init__(self):
+        self.ids = array('q')
+        self.first_codes = array('i')
+        self.last_codes = array('i')
+        self.names: List[str] = []
+        self._name_codes: Dict[str, int] = {}
+        self._ranks: Dict[str, array] = {}
+        self._collation_keys: Dict[str, list] = {}
+    
+    @classmethod
+    def from_columns(cls, ids, first_codes, last_codes, names: List[str]) -> 'ColumnStore':
+        """
+        Wrap existing columns without copying them
+        
+        The columns may be read-only memoryviews (e.g. over a memory-mapped
+        cache file); they are copied into arrays only if rows are appended.
+        """
+        store = cls()
+        store.ids = ids
+        store.first_codes = first_codes
+        store.last_codes = last_codes
+        store.names = names
+        store._name_codes = {name: code for code, name in enumerate(names)}
+        return store
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def _make_writable(self) -> None:
+        """Copy memoryview-backed columns into arrays before appending"""
+        if isinstance(self.ids, memoryview):
+            columns = []
+            for typecode, column in (('q', self.ids), ('i', self.first_codes), ('i', self.last_codes)):
+                copy = array(typecode)
+                copy.frombytes(column.cast('B'))
+                columns.append(copy)
+            self.ids, self.first_codes, self.last_codes = columns
+    
+    def encode_name(self, name: str) -> int:
+        """Return the dictionary code for a name, adding it if new"""
+        code = self._name_codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self._name_codes[name] = code
+            self.names.append(name)
+            self._ranks = {}
+        return code
+    
+    def append(self, id_val: int, first_name: str, last_name: str) -> None:
+        """Append one row"""
+        self._make_writable()
+        self.ids.append(id_val)
+        self.first_codes.append(self.encode_name(first_name))
+        self.last_codes.append(self.encode_name(last_name))
+    
+    def extend(self, rows: List[Tuple[int, str, str]]) -> None:
+        """Append a batch of (id, first_name, last_name) rows"""
+        self._make_writable()
+        encode = self.encode_name
+        self.ids.extend([row[0] for row in rows])
+        self.first_codes.extend([encode(row[1]) for row in rows])
+        self.last_codes.extend([encode(row[2]) for row in rows])
+    
+    def row(self, index: int) -> Record:
+        """Build the row view for one index"""
+        names = self.names
+        return Record(self.ids[index], names[self.first_codes[index]], names[self.last_codes[index]])
+    
+    def rows(self, indices) -> List[Record]:
+        """Build row views for a sequence of indices (e.g. a sort permutation)"""
+        ids, firsts, lasts, names = self.ids, self.first_codes, self.last_codes, self.names
+        return [Record(ids[i], names[firsts[i]], names[lasts[i]]) for i in indices]
+    
+    def take(self, indices) -> 'ColumnStore':
+        """
+        A new store with the rows at `indices`, in that order
+        
+        Applies a sort permutation to the ID and both name-code columns at
+        once; the name dictionary is shared, only the codes move. A NumPy
+        permutation (e.g. from sorting.argsort_keys) gathers the columns in
+        compiled code.
+        """
+        store = ColumnStore()
+        store.names = self.names
+        store._name_codes = self._name_codes
+        store._ranks = self._ranks
+        store._collation_keys = self._collation_keys
+        columns = (('q', self.ids), ('i', self.first_codes), ('i', self.last_codes))
+        
+        if type(indices).__module__ == 'numpy':
+            import numpy as np
+            gathered = []
+            for typecode, column in columns:
+                out = array(typecode)
+                out.frombytes(np.frombuffer(column, dtype=typecode)[indices].tobytes())
+                gathered.append(out)
+        else:
+            gathered = [array(typecode, [column[i] for i in indices]) for typecode, column in columns]
+        store.ids, store.first_codes, store.last_codes = gathered
+        return store
+    
+    def compact(self) -> 'ColumnStore':
+        """
+        A copy whose name dictionary holds only the names its rows use
+        
+        take() keeps the whole dictionary, so a few rows gathered from a
+        large store would carry every distinct name. Names keep their
+        relative code order. Returns self when every name is in use.
+        """
+        used = sorted(set(self.first_codes).union(self.last_codes))
+        if len(used) == len(self.names):
+            return self
+        remap = [0] * len(self.names)
+        for code, old in enumerate(used):
+            remap[old] = code
+        names = self.names
+        return ColumnStore.from_columns(array('q', self.ids),
+                                        array('i', [remap[c] for c in self.first_codes]),
+                                        array('i', [remap[c] for c in self.last_codes]),
+                                        [names[old] for old in used])
+    
+    def collation_keys(self, collation: str = 'binary') -> list:
+        """
+        The collation key of every distinct name, indexed by name code
+        
+        Keys are computed once per distinct name and kept, so after rows
+        with new names are appended only those names are keyed again.
+        Binary order needs no key: the names themselves are returned.
+        """
+        key = collation_key_func(collation)
+        if key is None:
+            return self.names
+        keys = self._collation_keys.setdefault(collation, [])
+        if len(keys) < len(self.names):
+            keys.extend(map(key, self.names[len(keys):]))
+        return keys
+    
+    def row_keys(self, column: str, collation: str = 'binary', start: int = 0) -> list:
+        """
+        Comparable keys of rows [start, len) of a column: IDs, or the
+        collation keys of the names (not ranks, which shift whenever a new
+        distinct name arrives)
+        """
+        if column == 'ID':
+            return list(self.ids[start:])
+        if column == 'FirstName':
+            codes = self.first_codes
+        elif column == 'LastName':
+            codes = self.last_codes
+        else:
+            raise KeyError(f"Unknown column: {column}")
+        keys = self.collation_keys(collation)
+        return [keys[code] for code in codes[start:]]
+    
+    def name_ranks(self, collation: str = 'binary') -> array:
+        """
+        Map each name code to its position in collation order
+        
+        Comparing ranks gives exactly the same order as comparing the
+        strings under the collation, but as plain integer comparisons.
+        Names that collate equal share a rank.
+        """
+        ranks = self._ranks.get(collation)
+        if ranks is None:
+            names = self.names
+            keys = self.collation_keys(collation)
+            ranks = array('i', bytes(4 * len(names)))
+            rank = -1
+            previous = None
+            for code in sorted(range(len(names)), key=keys.__getitem__):
+                if rank < 0 or keys[code] != previous:
+                    rank += 1
+                    previous = keys[code]
+                ranks[code] = rank
+            self._ranks[collation] = ranks
+        return ranks
+    
+    def key_column(self, column: str, n: int, collation: str = 'binary'):
+        """Integer sort keys for the first n rows of a column"""
+        if column == 'ID':
+            return self.ids[:n]
+        if column == 'FirstName':
+            codes = self.first_codes
+        elif column == 'LastName':
+            codes = self.last_codes
+        else:
+            raise KeyError(f"Unknown column: {column}")
+        ranks = self.name_ranks(collation)
+        return array('i', [ranks[code] for code in codes[:n]])
+    
+    def composite_key_column(self, terms: List[Tuple[str, bool]], n: int, collation: str = 'binary'):
+        """
+        One integer key per row for a multi-column ORDER BY
+        
+        Each term becomes a digit: name ranks (base = number of distinct
+        names) or the ID minus the smallest ID (base = ID range). A
+        descending term uses base - 1 - digit. The digits are combined as a
+        mixed-radix number, most significant term first, so comparing two
+        keys compares the terms in order and ascending order of the keys
+        is the full ORDER BY. The result is an array('q') when it fits in
+        64 bits (always for the three CSV columns at 100k rows), else a
+        list of Python ints, which only the comparison sorts accept.
+        """
+        keys: List[int] = []
+        total_base = 1
+        for column, descending in terms:
+            if column == 'ID':
+                ids = self.ids[:n]
+                low = min(ids) if n else 0
+                base = (max(ids) - low + 1) if n else 1
+                digits = [value - low for value in ids]
+            else:
+                base = max(1, len(self.names))
+                digits = self.key_column(column, n, collation)
+            if descending:
+                top = base - 1
+                digits = [top - digit for digit in digits]
+            
+            if total_base == 1:
+                keys = list(digits)
+            else:
+                keys = [key * base + digit for key, digit in zip(keys, digits)]
+            total_base *= base
+        
+        if total_base <= 1 << 63:
+            return array('q', keys)
+        return keys
+
+
+# ============================================================================
+# BINARY COLUMN CACHE
+# ============================================================================
+#
+# Parsing the CSV is by far the slowest part of startup, so the parsed
+# ColumnStore is saved next to it as "<csv>.colcache":
+#
+#   header  magic, version, byte order, source size / mtime / hash, counts
+#   ids     n x int64          (fixed width)
+#   first   n x int32          name codes
+#   last    n x int32          name codes
+#   offsets (m + 1) x uint32   start of each name in the heap
+#   heap    UTF-8 bytes of the m distinct names
+#
+# Each section starts on an 8-byte boundary. On reload the file is
+# memory-mapped and the columns are memoryviews straight into the mapping,
+# so nothing is parsed or copied.
+
+CACHE_MAGIC = b'SRTC'
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct('<4sHH QQ16s QQQ')
+
+
+def _align8(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def file_digest(path: str) -> bytes:
+    """128-bit BLAKE2b digest of a file's contents"""
+    import hashlib
+    
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def cache_path_for(csv_path: str) -> str:
+    """Location of the binary sidecar for a CSV file"""
+    return csv_path + '.colcache'
+
+
+def write_columns(f, store: ColumnStore, source: Tuple[int, int, bytes] = (0, 0, bytes(16))) -> None:
+    """
+    Write a store in the column-cache layout to a binary file object
+    
+    source is the (size, mtime_ns, digest) of the CSV the store was parsed
+    from; a standalone column file (e.g. an export) leaves it zeroed.
+    Sections are aligned by f.tell(), so f may be a GzipFile.
+    """
+    heap = bytearray()
+    offsets = array('I', [0])
+    for name in store.names:
+        heap += name.encode('utf-8')
+        offsets.append(len(heap))
+    
+    f.write(CACHE_HEADER.pack(
+        CACHE_MAGIC, CACHE_VERSION, 1 if sys.byteorder == 'little' else 2,
+        *source, len(store), len(store.names), len(heap)
+    ))
+    for section in (store.ids, store.first_codes, store.last_codes, offsets, heap):
+        f.write(b'\0' * (_align8(f.tell()) - f.tell()))
+        f.write(section)
+
+
+def _columns_from_buffer(buffer, rows: int, name_count: int, heap_size: int) -> Optional[ColumnStore]:
+    """A store whose columns are views into a buffer in the column-cache layout"""
+    view = memoryview(buffer)
+    offset = CACHE_HEADER.size
+    sections = []
+    for itemsize, count in ((8, rows), (4, rows), (4, rows), (4, name_count + 1), (1, heap_size)):
+        offset = _align8(offset)
+        sections.append(view[offset:offset + itemsize * count])
+        offset += itemsize * count
+    if offset > len(view):
+        return None
+    
+    ids, firsts, lasts, offsets, heap = sections
+    offsets = offsets.cast('I')
+    names = [str(heap[offsets[k]:offsets[k + 1]], 'utf-8') for k in range(name_count)]
+    return ColumnStore.from_columns(ids.cast('q'), firsts.cast('i'), lasts.cast('i'), names)
+
+
+def write_column_cache(csv_path: str, store: ColumnStore) -> str:
+    """Save a fully loaded store as the binary sidecar of csv_path"""
+    stat = os.stat(csv_path)
+    path = cache_path_for(csv_path)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        write_columns(f, store, (stat.st_size, stat.st_mtime_ns, file_digest(csv_path)))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_column_cache(csv_path: str) -> Optional[Tuple[ColumnStore, mmap.mmap]]:
+    """
+    Memory-map the sidecar of csv_path if it is still valid
+    
+    The cache is valid when the CSV size matches and either its mtime or
+    its content hash matches. Returns None when the cache is missing,
+    stale or unreadable.
+    """
+    path = cache_path_for(csv_path)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read(CACHE_HEADER.size)
+        (magic, version, byte_order, size, mtime_ns, digest,
+         rows, name_count, heap_size) = CACHE_HEADER.unpack(raw)
+    except (OSError, struct.error):
+        return None
+    
+    stat = os.stat(csv_path)
+    if (magic != CACHE_MAGIC or version != CACHE_VERSION
+            or byte_order != (1 if sys.byteorder == 'little' else 2)
+            or size != stat.st_size):
+        return None
+    if mtime_ns != stat.st_mtime_ns and digest != file_digest(csv_path):
+        return None
+    
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    store = _columns_from_buffer(mapping, rows, name_count, heap_size)
+    if store is None:
+        return None
+    return store, mapping
+
+
+def load_column_file(path: str) -> Tuple[ColumnStore, Any]:
+    """
+    Open any file in the column-cache layout, e.g. a columnar export
+    
+    Returns (store, buffer): the columns are views into the buffer, a
+    memory map, or the decompressed bytes of a ".gz" file. Raises
+    ValueError when the file is not in this layout.
+    """
+    if path.endswith('.gz'):
+        import gzip
+        
+        with gzip.open(path, 'rb') as f:
+            buffer = f.read()
+    else:
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        (magic, version, byte_order, _, _, _,
+         rows, name_count, heap_size) = CACHE_HEADER.unpack_from(buffer)
+    except struct.error:
+        magic = None
+    if (magic != CACHE_MAGIC or version != CACHE_VERSION
+            or byte_order != (1 if sys.byteorder == 'little' else 2)):
+        raise ValueError(f"{path}: not a column file (version {CACHE_VERSION}, native byte order)")
+    store = _columns_from_buffer(buffer, rows, name_count, heap_size)
+    if store is None:
+        raise ValueError(f"{path}: column file is truncated")
+    return store, buffer
+
+
+# ============================================================================
+# CSV DATA MANAGER
+# ============================================================================
+
+class CSVDataManager:
+    """Manages loading and accessing CSV data"""
+    
+    def __init__(self, csv_path: str, lazy: bool = False, chunk_size: int = 10000,
+                 use_cache: bool = True):
+        """
+        Initialize with CSV file path
+        
+        With lazy=True nothing is read up front; rows are streamed in
+        chunks only as far as get_records(n) needs them. With use_cache=True
+        a valid binary sidecar is memory-mapped instead of parsing the CSV,
+        and one is written after the first full parse.
+        """
+        self.csv_path = csv_path
+        self.chunk_size = chunk_size
+        self.use_cache = use_cache
+        self.store = ColumnStore()
+        self.load_time = 0.0
+        self.loaded_from_cache = False
+        self._cache_map: Optional[mmap.mmap] = None
+        self._fingerprint: Optional[Tuple[int, int, str]] = None
+        self._chunks: Optional[Iterator[List[Tuple[int, str, str]]]] = None
+        self._exhausted = False
+        self._columns: Optional[Tuple[int, int, int]] = None
+        self._tail_offset = 0
+        self._indexes: Dict[Tuple[str, str], SortedIndex] = {}
+        
+        if not os.path.exists(self.csv_path):
+            raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
+        
+        if use_cache and self._load_from_cache():
+            return
+        if not lazy:
+            self.load_data()
+    
+    def _load_from_cache(self) -> bool:
+        """Try to memory-map the binary sidecar; True on success"""
+        start_time = time.perf_counter()
+        cached = load_column_cache(self.csv_path)
+        if cached is None:
+            return False
+        self.store, self._cache_map = cached
+        # The cache was just checked to cover the whole file at this size
+        self._tail_offset = os.path.getsize(self.csv_path)
+        self.load_time = time.perf_counter() - start_time
+        self.loaded_from_cache = True
+        self._chunks = None
+        self._exhausted = True
+        return True
+    
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[List[Tuple[int, str, str]]]:
+        """
+        Stream (id, first_name, last_name) rows from the CSV file in lists
+        of at most chunk_size
+        
+        Only one chunk is held at a time, so memory stays bounded no matter
+        how large the file is.
+        """
+        # csv is only needed when there is no valid binary cache
+        import csv
+        
+        chunk_size = chunk_size or self.chunk_size
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            id_col, first_col, last_col = self._columns = self._header_columns(next(reader, []))
+            
+            chunk: List[Tuple[int, str, str]] = []
+            for row in reader:
+                try:
+                    chunk.append((int(row[id_col]), row[first_col], row[last_col]))
+                except (ValueError, IndexError) as e:
+                    print(f"Warning: Skipping row due to error: {e}")
+                    continue
+                
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            
+            # Where tail() picks up rows appended later
+            self._tail_offset = f.buffer.tell()
+            if chunk:
+                yield chunk
+    
+    @staticmethod
+    def _header_columns(header: List[str]) -> Tuple[int, int, int]:
+        """Positions of ID, FirstName and LastName in the header row"""
+        try:
+            return header.index('ID'), header.index('FirstName'), header.index('LastName')
+        except ValueError as e:
+            raise ValueError(f"CSV header is missing a column: {e}")
+    
+    def load_data(self) -> None:
+        """Load every record from the CSV file (or its binary cache)"""
+        self.store = ColumnStore()
+        self.load_time = 0.0
+        self.loaded_from_cache = False
+        self._chunks = None
+        self._exhausted = False
+        self._indexes = {}
+        if self.use_cache and self._load_from_cache():
+            return
+        self._load_until(None)
+    
+    def _load_until(self, n: Optional[int]) -> None:
+        """Pull chunks from the stream until n records are loaded (None = all)"""
+        if self._exhausted:
+            return
+        if self._chunks is None:
+            self._chunks = self.iter_chunks()
+        
+        start_time = time.perf_counter()
+        while n is None or len(self.store) < n:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                self._chunks = None
+                break
+            self.store.extend(chunk)
+        self.load_time += time.perf_counter() - start_time
+        
+        if self._exhausted and self.use_cache:
+            try:
+                write_column_cache(self.csv_path, self.store)
+            except OSError as e:
+                print(f"Warning: Could not write binary cache: {e}")
+    
+    def _available(self, n: int) -> int:
+        """Make sure up to n rows are loaded and return how many there are"""
+        if len(self.store) < n:
+            self._load_until(n)
+        return min(n, len(self.store))
+    
+    def get_records(self, n: int) -> List[Record]:
+        """Get first N records, streaming more rows from disk if needed"""
+        return self.store.rows(range(self._available(n)))
+    
+    def get_rows(self, indices) -> List[Record]:
+        """Get the records at the given indices, in that order"""
+        return self.store.rows(indices)
+    
+    def get_sort_keys(self, column: str, n: int, collation: str = 'binary') -> array:
+        """
+        Integer sort keys for the first N rows of a column or ORDER BY list
+        
+        Sorting range(N) with keys.__getitem__ yields the same permutation
+        as sorting the records with get_column_keys()[column]. `column` may
+        also be an ORDER BY list such as 'LastName, FirstName DESC, ID';
+        its keys are precomputed composite integers, so multi-column sorts
+        cost every algorithm exactly what a single-column sort does.
+        Name columns are ranked under `collation` (see COLLATIONS).
+        """
+        n = self._available(n)
+        if column in SORT_COLUMNS:
+            return self.store.key_column(column, n, collation)
+        return self.store.composite_key_column(parse_order_by(column), n, collation)
+    
+    def fingerprint(self) -> str:
+        """
+        Hex content digest of the CSV file, e.g. for keying sort results
+        
+        The digest is recomputed only when the file's size or mtime change.
+        """
+        stat = os.stat(self.csv_path)
+        cached = self._fingerprint
+        if cached is None or cached[:2] != (stat.st_size, stat.st_mtime_ns):
+            cached = (stat.st_size, stat.st_mtime_ns, file_digest(self.csv_path).hex())
+            self._fingerprint = cached
+        return cached[2]
+    
+    def sorted_index(self, column: str, collation: str = 'binary') -> SortedIndex:
+        """
+        The maintained sorted index of a column over every row
+        
+        Built with one sort on first use (loading the rest of the file if
+        needed); tail() then inserts appended rows into every index built
+        so far instead of re-sorting.
+        """
+        if column not in SORT_COLUMNS:
+            raise KeyError(f"Unknown column: {column}")
+        index = self._indexes.get((column, collation))
+        if index is None:
+            self._load_until(None)
+            keys = self.store.row_keys(column, collation)
+            index = SortedIndex(zip(keys, range(len(keys))))
+            self._indexes[(column, collation)] = index
+        return index
+    
+    def tail(self) -> int:
+        """
+        Append the rows written to the end of the CSV since it was read
+        
+        Reads only from the byte offset where the previous read stopped
+        and only complete lines, so a row that is still being written is
+        picked up by the next call. New rows go into the store and every
+        sorted index, and the binary cache is rewritten. Returns the number
+        of rows added. A file that shrank was rewritten, not appended to:
+        that raises ValueError and needs load_data().
+        """
+        import csv
+        
+        self._load_until(None)
+        size = os.path.getsize(self.csv_path)
+        if size < self._tail_offset:
+            raise ValueError(f"{self.csv_path} shrank since it was read; reload it")
+        if size == self._tail_offset:
+            return 0
+        
+        with open(self.csv_path, 'rb') as f:
+            if self._columns is None:
+                self._columns = self._header_columns(next(csv.reader([f.readline().decode('utf-8')]), []))
+            f.seek(self._tail_offset)
+            data = f.read(size - self._tail_offset)
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return 0
+        
+        id_col, first_col, last_col = self._columns
+        rows: List[Tuple[int, str, str]] = []
+        for row in csv.reader(data[:end].decode('utf-8').splitlines()):
+            try:
+                rows.append((int(row[id_col]), row[first_col], row[last_col]))
+            except (ValueError, IndexError) as e:
+                print(f"Warning: Skipping row due to error: {e}")
+        self._tail_offset += end
+        
+        start_time = time.perf_counter()
+        start = len(self.store)
+        self.store.extend(rows)
+        for (column, collation), index in self._indexes.items():
+            index.extend(zip(self.store.row_keys(column, collation, start), range(start, len(self.store))))
+        self.load_time += time.perf_counter() - start_time
+        
+        if self.use_cache and rows and self._tail_offset == size:
+            try:
+                write_column_cache(self.csv_path, self.store)
+            except OSError as e:
+                print(f"Warning: Could not write binary cache: {e}")
+        return len(rows)
+    
+    def get_total_count(self) -> int:
+        """Get total number of records loaded"""
+        return len(self.store)
+    
+    def is_fully_loaded(self) -> bool:
+        """Whether the whole CSV file has been read"""
+        return self._exhausted
+    
+    def get_rows_per_second(self) -> float:
+        """Loading throughput measured over everything read so far"""
+        if self.load_time <= 0:
+            return 0.0
+        return len(self.store) / self.load_time
+    
+    def get_column_keys(self):
+        """Return available columns for sorting"""
+        return {
+            'ID': lambda r: r.id,
+            'FirstName': lambda r: r.first_name,
+            'LastName': lambda r: r.last_name
+        }
@@ -0,0 +1,235 @@
+"""
+Sort-result cache for the Sorting Algorithm Stress Test
+Design & Analysis of Algorithms Lab - Prelim Exam
+
+A finished sort is kept as its index permutation, one int32 per row, so a
+repeated query is answered without sorting again:
+
+    key = result_key(manager.fingerprint(), column, collation, reverse, 'merge')
+    perm = cache.get(key, n)          # None on a miss
+    cache.put(key, n, perm)
+
+Entries live in an LRU bounded by a byte budget and, when a directory is
+given, are also written next to the CSV as "<csv>.sortcache/*.perm".
+Every sort here is stable, so the sort of the first n rows is the sort of
+a larger prefix with the indices >= n filtered out: a query for a smaller
+N is derived from a cached larger one instead of sorted.
+"""
+
+import os
+import sys
+import struct
+from array import array
+from collections import OrderedDict
+from typing import Iterator, Optional, Tuple
+
+# (dataset fingerprint, column or ORDER BY, collation, reverse, algorithm)
+ResultKey = Tuple[str, str, str, bool, str]
+
+DEFAULT_BUDGET_BYTES = 64 << 20
+
+PERM_MAGIC = b'SRTP'
+PERM_VERSION = 1
+PERM_HEADER = struct.Struct('<4sHH QI')
+
+
+def result_key(fingerprint: str, column: str, collation: str, reverse: bool, algorithm: str) -> ResultKey:
+    """The cache key of one sort, without N"""
+    return (fingerprint, column, collation, bool(reverse), algorithm)
+
+
+def sort_cache_dir_for(csv_path: str) -> str:
+    """Location of the persisted sort results for a CSV file"""
+    return csv_path + '.sortcache'
+
+
+def to_permutation(order) -> array:
+    """A sort result (list, array or NumPy array of indices) as array('i')"""
+    if type(order).__module__ == 'numpy':
+        perm = array('i')
+        perm.frombytes(order.astype('int32').tobytes())
+        return perm
+    if isinstance(order, array) and order.typecode == 'i':
+        return order
+    return array('i', order)
+
+
+def filter_prefix(perm: array, n: int) -> array:
+    """The sort of rows [0, n) from the sort of a larger prefix"""
+    try:
+        import numpy as np
+    except ImportError:
+        return array('i', [i for i in perm if i < n])
+
+    column = np.frombuffer(perm, dtype=np.int32)
+    out = array('i')
+    out.frombytes(column[column < n].tobytes())
+    return out
+
+
+class SortResultCache:
+    """
+    LRU of sort permutations with a byte budget and optional disk copies
+
+    An entry bigger than the whole budget is not kept in memory (it may
+    still be written to disk). Disk files whose dataset fingerprint is not
+    the one being written are deleted, so edits to the CSV do not leave
+    stale results behind.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES, directory: Optional[str] = None):
+        self.budget_bytes = budget_bytes
+        self.directory = directory
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[ResultKey, int], array]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget every in-memory entry (disk files are kept)"""
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def get(self, key: ResultKey, n: int) -> Optional[array]:
+        """The permutation for the first n rows, or None"""
+        found = self.lookup(key, n)
+        return None if found is None else found[0]
+
+    def lookup(self, key: ResultKey, n: int) -> Optional[Tuple[array, str]]:
+        """
+        (permutation, source) for the first n rows, or None
+
+        source is 'memory', 'disk', or 'prefix of N' when the result was
+        filtered from a cached sort of N > n rows. Derived results are
+        kept in memory only.
+        """
+        perm = self._entries.get((key, n))
+        if perm is not None:
+            self._entries.move_to_end((key, n))
+            self.hits += 1
+            return perm, 'memory'
+
+        perm = self._read(key, n)
+        if perm is not None:
+            self._remember(key, n, perm)
+            self.hits += 1
+            return perm, 'disk'
+
+        larger = self._smallest_larger(key, n)
+        source = self.lookup(key, larger) if larger is not None else None
+        if source is not None:
+            perm = filter_prefix(source[0], n)
+            self._remember(key, n, perm)
+            return perm, f'prefix of {larger:,}'
+
+        self.misses += 1
+        return None
+
+    def put(self, key: ResultKey, n: int, order) -> array:
+        """Store a sort result for the first n rows; returns it as array('i')"""
+        perm = to_permutation(order)
+        if len(perm) != n:
+            raise ValueError(f"permutation has {len(perm)} entries, expected {n}")
+        self._remember(key, n, perm)
+        if self.directory is not None:
+            self._write(key, n, perm)
+        return perm
+
+    def _remember(self, key: ResultKey, n: int, perm: array) -> None:
+        size = len(perm) * perm.itemsize
+        if size > self.budget_bytes:
+            return
+        old = self._entries.pop((key, n), None)
+        if old is not None:
+            self.bytes_used -= len(old) * old.itemsize
+        self._entries[(key, n)] = perm
+        self.bytes_used += size
+        while self.bytes_used > self.budget_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes_used -= len(evicted) * evicted.itemsize
+
+    def _smallest_larger(self, key: ResultKey, n: int) -> Optional[int]:
+        """The smallest cached N > n for the same key, in memory or on disk"""
+        sizes = [size for cached_key, size in self._entries if cached_key == key and size > n]
+        sizes.extend(size for size in self._disk_sizes(key) if size > n)
+        return min(sizes) if sizes else None
+
+    # ------------------------------------------------------------------------
+    # Disk copies: "<fingerprint>-<key hash>-<n>.perm"
+    #
+    #   header  magic, version, byte order, n, key length
+    #   key     UTF-8 repr of the key (guards against hash collisions)
+    #   perm    n x int32, starting on an 8-byte boundary
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _file_prefix(key: ResultKey) -> str:
+        import hashlib
+
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8).hexdigest()
+        return f"{key[0][:16]}-{digest}-"
+
+    def _disk_files(self) -> Iterator[str]:
+        if self.directory is None:
+            return iter(())
+        try:
+            return iter(os.listdir(self.directory))
+        except OSError:
+            return iter(())
+
+    def _disk_sizes(self, key: ResultKey) -> Iterator[int]:
+        prefix = self._file_prefix(key)
+        for name in self._disk_files():
+            if name.startswith(prefix) and name.endswith('.perm'):
+                size = name[len(prefix):-len('.perm')]
+                if size.isdigit():
+                    yield int(size)
+
+    def _path(self, key: ResultKey, n: int) -> str:
+        return os.path.join(self.directory, f"{self._file_prefix(key)}{n}.perm")
+
+    def _read(self, key: ResultKey, n: int) -> Optional[array]:
+        if self.directory is None:
+            return None
+        key_bytes = repr(key).encode('utf-8')
+        try:
+            with open(self._path(key, n), 'rb') as f:
+                magic, version, byte_order, count, key_size = PERM_HEADER.unpack(f.read(PERM_HEADER.size))
+                if (magic != PERM_MAGIC or version != PERM_VERSION
+                        or byte_order != (1 if sys.byteorder == 'little' else 2)
+                        or count != n or f.read(key_size) != key_bytes):
+                    return None
+                f.seek((PERM_HEADER.size + key_size + 7) & ~7)
+                data = f.read(4 * n)
+        except (OSError, struct.error):
+            return None
+        if len(data) != 4 * n:
+            return None
+        perm = array('i')
+        perm.frombytes(data)
+        return perm
+
+    def _write(self, key: ResultKey, n: int, perm: array) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        current = key[0][:16] + '-'
+        for name in self._disk_files():
+            if name.endswith('.perm') and not name.startswith(current):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+        key_bytes = repr(key).encode('utf-8')
+        header = PERM_HEADER.pack(PERM_MAGIC, PERM_VERSION, 1 if sys.byteorder == 'little' else 2,
+                                  n, len(key_bytes))
+        path = self._path(key, n)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(key_bytes)
+            f.write(b'\0' * (((f.tell() + 7) & ~7) - f.tell()))
+            f.write(perm)
+        os.replace(tmp_path, path)
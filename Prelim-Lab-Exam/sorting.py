@@ -0,0 +1,1160 @@
+"""
+Sorting algorithms for the Sorting Algorithm Stress Test
+Design & Analysis of Algorithms Lab - Prelim Exam
+
+Every sort follows the same contract:
+    sort(arr, key_func, reverse=False) -> (sorted_list, seconds)
+
+bubble_sort, insertion_sort, merge_sort, bottom_up_merge_sort,
+hybrid_sort and radix_sort also take an optional progress(fraction)
+callback. It is called a bounded number of times per sort (at most about
+PROGRESS_STEPS) with the estimated fraction of the work done; returning
+False aborts the sort with SortCancelled.
+
+bubble_sort, insertion_sort and merge_sort also take an optional OpCounter.
+Passing one runs an instrumented copy of the algorithm that counts
+comparisons, swaps, moves, key_func calls and allocations; the plain
+paths only pay a single `counter is not None` check.
+
+numpy_sort and argsort_keys use NumPy when it is installed and fall back
+to radix_sort otherwise; NumPy is only imported when they are first called.
+
+heap_top_k and quickselect_top_k take an extra k and return only the first
+k records of the sorted order, (arr, key_func, k, reverse=False, progress=None).
+"""
+
+import time
+import os
+import sys
+import heapq
+from array import array
+from typing import List, Tuple, Callable, Any, Dict, Optional
+
+from records import Record
+
+# The shared sortlab package lives in the repository root, one folder up
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+from sortlab.counting import OpCounter
+# numpy_available is re-exported for the GUI's backend menu
+from sortlab.intload import numpy_available  # noqa: F401
+from sortlab.radix import load_numpy, radix_order
+
+ProgressFunc = Callable[[float], Optional[bool]]
+
+PROGRESS_STEPS = 1000
+# Fewest elements of O(n log n) work between two progress calls, so the
+# hook stays a small fraction of a fast sort on small inputs
+PROGRESS_MIN_CHUNK = 1024
+
+
+class SortCancelled(Exception):
+    """Raised inside a sort when its progress callback returns False"""
+
+
+def _report(progress: ProgressFunc, fraction: float) -> None:
+    """Pass the completed fraction to the callback and honour a cancel request"""
+    if progress(fraction) is False:
+        raise SortCancelled(f"sort cancelled at {fraction:.1%}")
+
+
+def _quadratic_stride(n: int) -> int:
+    """Outer-loop iterations between progress calls for the O(n²) sorts"""
+    return max(1, n // PROGRESS_STEPS)
+
+
+class _MergeProgress:
+    """
+    Progress of a recursive merge sort, counted in merged elements
+    
+    The whole sort merges about n * ceil(log2 n) elements. Only merges of
+    at least min_len elements report, so the callback fires a bounded
+    number of times; such a merge credits its whole subtree when its
+    children were too small to report themselves.
+    """
+    __slots__ = ('progress', 'min_len', 'total', 'done')
+    
+    def __init__(self, progress: ProgressFunc, n: int):
+        self.progress = progress
+        self.min_len = max(PROGRESS_MIN_CHUNK, n // PROGRESS_STEPS)
+        self.total = max(1, n * (n - 1).bit_length())
+        self.done = 0
+    
+    def merged(self, length: int) -> None:
+        if length >= 2 * self.min_len:
+            self.done += length
+        else:
+            self.done += length * (length - 1).bit_length()
+        _report(self.progress, min(1.0, self.done / self.total))
+
+
+# ============================================================================
+# SORTING ALGORITHMS
+# ============================================================================
+
+def bubble_sort(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool = False,
+                precompute_keys: bool = True,
+                progress: Optional[ProgressFunc] = None,
+                counter: Optional[OpCounter] = None) -> Tuple[List[Record], float]:
+    """
+    Bubble Sort - O(n²) complexity
+    Sorts records based on key function in ascending order (or descending if reverse=True)
+    
+    With precompute_keys=True (the default) every record is decorated once as
+    a (key, record) pair and the pairs are compared on their stored key,
+    instead of calling key_func twice per comparison.
+    
+    progress is called every n / PROGRESS_STEPS passes; pass i has done
+    about 1 - ((n - i) / n)² of the comparisons.
+    
+    With a counter the instrumented _bubble_sort_counted runs instead
+    (without progress reporting).
+    """
+    if counter is not None:
+        return _bubble_sort_counted(arr, key_func, reverse, precompute_keys, counter)
+    
+    start_time = time.perf_counter()
+    n = len(arr)
+    arr_copy = arr.copy()
+    stride = _quadratic_stride(n)
+    
+    if precompute_keys:
+        pairs = [(key_func(record), record) for record in arr_copy]
+        for i in range(n):
+            if progress is not None and i % stride == 0:
+                _report(progress, 1.0 - ((n - i) / n) ** 2)
+            swapped = False
+            for j in range(0, n - i - 1):
+                if (pairs[j][0] < pairs[j + 1][0]) if reverse else (pairs[j][0] > pairs[j + 1][0]):
+                    pairs[j], pairs[j + 1] = pairs[j + 1], pairs[j]
+                    swapped = True
+            
+            if not swapped:
+                break
+        
+        arr_copy = [record for _, record in pairs]
+        if progress is not None:
+            progress(1.0)
+        end_time = time.perf_counter()
+        return arr_copy, end_time - start_time
+    
+    for i in range(n):
+        if progress is not None and i % stride == 0:
+            _report(progress, 1.0 - ((n - i) / n) ** 2)
+        swapped = False
+        for j in range(0, n - i - 1):
+            key_j = key_func(arr_copy[j])
+            key_j_next = key_func(arr_copy[j + 1])
+            
+            if reverse:
+                should_swap = key_j < key_j_next
+            else:
+                should_swap = key_j > key_j_next
+            
+            if should_swap:
+                arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                swapped = True
+        
+        if not swapped:
+            break
+    
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return arr_copy, end_time - start_time
+
+
+def insertion_sort(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool = False,
+                   precompute_keys: bool = True,
+                   progress: Optional[ProgressFunc] = None,
+                   counter: Optional[OpCounter] = None) -> Tuple[List[Record], float]:
+    """
+    Insertion Sort - O(n²) complexity
+    Sorts records based on key function
+    
+    With precompute_keys=True (the default) the same (key, record)
+    decoration is used, so each shift moves one pair and no comparison
+    calls key_func.
+    
+    progress is called every n / PROGRESS_STEPS insertions; on random input
+    inserting element i costs about i / 2 shifts, so (i / n)² of the work
+    is done.
+    
+    With a counter the instrumented _insertion_sort_counted runs instead.
+    """
+    if counter is not None:
+        return _insertion_sort_counted(arr, key_func, reverse, precompute_keys, counter)
+    
+    start_time = time.perf_counter()
+    n = len(arr)
+    arr_copy = arr.copy()
+    stride = _quadratic_stride(n)
+    
+    if precompute_keys:
+        pairs = [(key_func(record), record) for record in arr_copy]
+        for i in range(1, n):
+            if progress is not None and i % stride == 0:
+                _report(progress, (i / n) ** 2)
+            item = pairs[i]
+            key_val = item[0]
+            j = i - 1
+            
+            if reverse:
+                while j >= 0 and pairs[j][0] < key_val:
+                    pairs[j + 1] = pairs[j]
+                    j -= 1
+            else:
+                while j >= 0 and pairs[j][0] > key_val:
+                    pairs[j + 1] = pairs[j]
+                    j -= 1
+            
+            pairs[j + 1] = item
+        
+        arr_copy = [record for _, record in pairs]
+        if progress is not None:
+            progress(1.0)
+        end_time = time.perf_counter()
+        return arr_copy, end_time - start_time
+    
+    for i in range(1, n):
+        if progress is not None and i % stride == 0:
+            _report(progress, (i / n) ** 2)
+        key = arr_copy[i]
+        key_val = key_func(key)
+        j = i - 1
+        
+        while j >= 0:
+            key_j = key_func(arr_copy[j])
+            
+            if reverse:
+                should_insert = key_j < key_val
+            else:
+                should_insert = key_j > key_val
+            
+            if should_insert:
+                arr_copy[j + 1] = arr_copy[j]
+                j -= 1
+            else:
+                break
+        
+        arr_copy[j + 1] = key
+    
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return arr_copy, end_time - start_time
+
+
+def merge_sort(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool = False,
+               precompute_keys: bool = True,
+               progress: Optional[ProgressFunc] = None,
+               counter: Optional[OpCounter] = None) -> Tuple[List[Record], float]:
+    """
+    Merge Sort - O(n log n) complexity
+    Sorts records based on key function using divide and conquer
+    
+    With precompute_keys=True (the default) the records are decorated as
+    (key, record) pairs once, merged on the stored keys, and undecorated at
+    the end.
+    
+    progress is called after each merge of at least n / PROGRESS_STEPS
+    (and PROGRESS_MIN_CHUNK) elements with the fraction of all merge work
+    done.
+    
+    With a counter the instrumented _merge_sort_counted runs instead.
+    """
+    if counter is not None:
+        return _merge_sort_counted(arr, key_func, reverse, precompute_keys, counter)
+    
+    start_time = time.perf_counter()
+    tracker = _MergeProgress(progress, len(arr)) if progress is not None else None
+    # One length test per merge; no merge is ever longer than the input
+    report_len = tracker.min_len if tracker is not None else len(arr) + 1
+    
+    if precompute_keys:
+        def merge_decorated(left: List[Tuple[Any, Record]], right: List[Tuple[Any, Record]]) -> List[Tuple[Any, Record]]:
+            """Merge two sorted lists of (key, record) pairs"""
+            result = []
+            i = j = 0
+            len_left, len_right = len(left), len(right)
+            
+            while i < len_left and j < len_right:
+                if (left[i][0] >= right[j][0]) if reverse else (left[i][0] <= right[j][0]):
+                    result.append(left[i])
+                    i += 1
+                else:
+                    result.append(right[j])
+                    j += 1
+            
+            result.extend(left[i:])
+            result.extend(right[j:])
+            return result
+        
+        def sort_decorated(pairs: List[Tuple[Any, Record]]) -> List[Tuple[Any, Record]]:
+            """Recursive merge sort over decorated pairs"""
+            if len(pairs) <= 1:
+                return pairs
+            
+            mid = len(pairs) // 2
+            merged = merge_decorated(sort_decorated(pairs[:mid]), sort_decorated(pairs[mid:]))
+            if len(merged) >= report_len:
+                tracker.merged(len(merged))
+            return merged
+        
+        decorated = [(key_func(record), record) for record in arr]
+        sorted_arr = [record for _, record in sort_decorated(decorated)]
+        if progress is not None:
+            progress(1.0)
+        end_time = time.perf_counter()
+        return sorted_arr, end_time - start_time
+    
+    def merge(left: List[Record], right: List[Record]) -> List[Record]:
+        """Merge two sorted lists"""
+        result = []
+        i = j = 0
+        
+        while i < len(left) and j < len(right):
+            left_key = key_func(left[i])
+            right_key = key_func(right[j])
+            
+            if reverse:
+                should_take_left = left_key >= right_key
+            else:
+                should_take_left = left_key <= right_key
+            
+            if should_take_left:
+                result.append(left[i])
+                i += 1
+            else:
+                result.append(right[j])
+                j += 1
+        
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return result
+    
+    def merge_sort_helper(arr_slice: List[Record]) -> List[Record]:
+        """Recursive merge sort helper"""
+        if len(arr_slice) <= 1:
+            return arr_slice
+        
+        mid = len(arr_slice) // 2
+        left = merge_sort_helper(arr_slice[:mid])
+        right = merge_sort_helper(arr_slice[mid:])
+        merged = merge(left, right)
+        if len(merged) >= report_len:
+            tracker.merged(len(merged))
+        return merged
+    
+    sorted_arr = merge_sort_helper(arr)
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+# ============================================================================
+# INSTRUMENTED VARIANTS (counter=...)
+# ============================================================================
+# Same algorithms, written once over "items" plus a key accessor: with
+# precompute_keys the items are (key, record) pairs, otherwise the records
+# themselves with key_func counted on every call.
+
+def _counted_items(arr: List[Record], key_func: Callable[[Record], Any], precompute_keys: bool,
+                   counter: OpCounter) -> Tuple[List[Any], Callable[[Any], Any]]:
+    """Working list and key accessor for an instrumented sort"""
+    if precompute_keys:
+        counter.key_calls += len(arr)
+        counter.allocations += len(arr) + 1
+        return [(key_func(record), record) for record in arr], lambda pair: pair[0]
+    
+    def key_of(record: Record) -> Any:
+        counter.key_calls += 1
+        return key_func(record)
+    
+    counter.allocations += 1
+    return arr.copy(), key_of
+
+
+def _counted_result(items: List[Any], precompute_keys: bool, counter: OpCounter) -> List[Record]:
+    if precompute_keys:
+        counter.allocations += 1
+        return [record for _, record in items]
+    return items
+
+
+def _bubble_sort_counted(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool,
+                         precompute_keys: bool, counter: OpCounter) -> Tuple[List[Record], float]:
+    """bubble_sort, counting comparisons, swaps, key calls and allocations"""
+    start_time = time.perf_counter()
+    items, key_of = _counted_items(arr, key_func, precompute_keys, counter)
+    n = len(items)
+    
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            counter.comparisons += 1
+            key_j, key_j_next = key_of(items[j]), key_of(items[j + 1])
+            if (key_j < key_j_next) if reverse else (key_j > key_j_next):
+                items[j], items[j + 1] = items[j + 1], items[j]
+                counter.swaps += 1
+                swapped = True
+        if not swapped:
+            break
+    
+    sorted_arr = _counted_result(items, precompute_keys, counter)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def _insertion_sort_counted(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool,
+                            precompute_keys: bool, counter: OpCounter) -> Tuple[List[Record], float]:
+    """insertion_sort, counting comparisons, moves (shifts plus the final write), key calls and allocations"""
+    start_time = time.perf_counter()
+    items, key_of = _counted_items(arr, key_func, precompute_keys, counter)
+    
+    for i in range(1, len(items)):
+        item = items[i]
+        key_val = key_of(item)
+        j = i - 1
+        while j >= 0:
+            counter.comparisons += 1
+            key_j = key_of(items[j])
+            if not ((key_j < key_val) if reverse else (key_j > key_val)):
+                break
+            items[j + 1] = items[j]
+            counter.moves += 1
+            j -= 1
+        items[j + 1] = item
+        counter.moves += 1
+    
+    sorted_arr = _counted_result(items, precompute_keys, counter)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def _merge_sort_counted(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool,
+                        precompute_keys: bool, counter: OpCounter) -> Tuple[List[Record], float]:
+    """merge_sort, counting comparisons, elements written to merge results, key calls and allocations"""
+    start_time = time.perf_counter()
+    items, key_of = _counted_items(arr, key_func, precompute_keys, counter)
+    
+    def merge(left: List[Any], right: List[Any]) -> List[Any]:
+        result = []
+        counter.allocations += 1
+        i = j = 0
+        while i < len(left) and j < len(right):
+            counter.comparisons += 1
+            left_key, right_key = key_of(left[i]), key_of(right[j])
+            if (left_key >= right_key) if reverse else (left_key <= right_key):
+                result.append(left[i])
+                i += 1
+            else:
+                result.append(right[j])
+                j += 1
+        counter.moves += len(left) + len(right)
+        counter.allocations += 2
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return result
+    
+    def sort_items(part: List[Any]) -> List[Any]:
+        if len(part) <= 1:
+            return part
+        mid = len(part) // 2
+        counter.allocations += 2
+        return merge(sort_items(part[:mid]), sort_items(part[mid:]))
+    
+    sorted_arr = _counted_result(sort_items(items), precompute_keys, counter)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+BOTTOM_UP_CUTOFF = 8
+
+
+def _insertion_sort_pairs(pairs: List[Tuple[Any, Record]], lo: int, hi: int, reverse: bool) -> None:
+    """Insertion sort pairs[lo:hi] in place on their precomputed keys"""
+    for i in range(lo + 1, hi):
+        item = pairs[i]
+        key_val = item[0]
+        j = i - 1
+        
+        if reverse:
+            while j >= lo and pairs[j][0] < key_val:
+                pairs[j + 1] = pairs[j]
+                j -= 1
+        else:
+            while j >= lo and pairs[j][0] > key_val:
+                pairs[j + 1] = pairs[j]
+                j -= 1
+        
+        pairs[j + 1] = item
+
+
+def _merge_pairs(src: List[Tuple[Any, Record]], dst: List[Any], lo: int, mid: int, hi: int, reverse: bool) -> None:
+    """Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]"""
+    i, j, k = lo, mid, lo
+    left, right = src[i], src[j]
+    
+    if reverse:
+        while True:
+            if left[0] >= right[0]:
+                dst[k] = left
+                i += 1
+                k += 1
+                if i == mid:
+                    dst[k:hi] = src[j:hi]
+                    return
+                left = src[i]
+            else:
+                dst[k] = right
+                j += 1
+                k += 1
+                if j == hi:
+                    dst[k:hi] = src[i:mid]
+                    return
+                right = src[j]
+    else:
+        while True:
+            if left[0] <= right[0]:
+                dst[k] = left
+                i += 1
+                k += 1
+                if i == mid:
+                    dst[k:hi] = src[j:hi]
+                    return
+                left = src[i]
+            else:
+                dst[k] = right
+                j += 1
+                k += 1
+                if j == hi:
+                    dst[k:hi] = src[i:mid]
+                    return
+                right = src[j]
+
+
+def bottom_up_merge_sort(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool = False,
+                         cutoff: int = BOTTOM_UP_CUTOFF,
+                         progress: Optional[ProgressFunc] = None) -> Tuple[List[Record], float]:
+    """
+    Bottom-Up Merge Sort - O(n log n) complexity
+    Iterative merge sort with a single preallocated auxiliary buffer
+    
+    Runs of `cutoff` records are first insertion-sorted in place, then runs
+    of doubling width are merged back and forth between the decorated list
+    and one auxiliary list of the same size. Unlike merge_sort, no slices
+    or result lists are built per merge, and a merge is skipped entirely
+    when its two runs are already in order.
+    
+    progress is called once per merge level (the run-sorting pass counts
+    as one level).
+    """
+    start_time = time.perf_counter()
+    pairs = _bottom_up_sort_pairs([(key_func(record), record) for record in arr], reverse, cutoff,
+                                  progress)
+    sorted_arr = [record for _, record in pairs]
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def _bottom_up_sort_pairs(src: List[Tuple[Any, Any]], reverse: bool, cutoff: int = BOTTOM_UP_CUTOFF,
+                          progress: Optional[ProgressFunc] = None) -> List[Tuple[Any, Any]]:
+    """Bottom-up merge sort engine over (key, value) pairs; returns the sorted list"""
+    n = len(src)
+    cutoff = max(1, cutoff)
+    for lo in range(0, n, cutoff):
+        _insertion_sort_pairs(src, lo, min(lo + cutoff, n), reverse)
+    
+    dst: List[Any] = [None] * n
+    width = cutoff
+    levels = 1 + max(0, (-(-n // cutoff) - 1).bit_length())
+    level = 1
+    while width < n:
+        if progress is not None:
+            _report(progress, level / levels)
+        level += 1
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            
+            # Single run left over, or two runs that are already in order
+            if mid >= hi or ((src[mid - 1][0] >= src[mid][0]) if reverse else (src[mid - 1][0] <= src[mid][0])):
+                dst[lo:hi] = src[lo:hi]
+                continue
+            
+            _merge_pairs(src, dst, lo, mid, hi, reverse)
+        
+        src, dst = dst, src
+        width *= 2
+    
+    return src
+
+
+MIN_GALLOP = 7
+
+
+def _min_run(n: int) -> int:
+    """Timsort minimum run length: n itself below 64, else in [32, 64]"""
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def _binary_insertion_pairs(pairs: List[Tuple[Any, Any]], lo: int, start: int, hi: int) -> None:
+    """Extend the sorted pairs[lo:start] to pairs[lo:hi]; slice moves do the shifting"""
+    for i in range(start, hi):
+        item = pairs[i]
+        key = item[0]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if key < pairs[mid][0]:
+                right = mid
+            else:
+                left = mid + 1
+        if left < i:
+            pairs[left + 1:i + 1] = pairs[left:i]
+            pairs[left] = item
+
+
+def _count_run(pairs: List[Tuple[Any, Any]], lo: int, hi: int) -> int:
+    """Length of the natural run at lo; a strictly descending run is reversed in place"""
+    n = lo + 1
+    if n == hi:
+        return 1
+    if pairs[n][0] < pairs[lo][0]:
+        while n + 1 < hi and pairs[n + 1][0] < pairs[n][0]:
+            n += 1
+        pairs[lo:n + 1] = pairs[lo:n + 1][::-1]
+    else:
+        while n + 1 < hi and not pairs[n + 1][0] < pairs[n][0]:
+            n += 1
+    return n + 1 - lo
+
+
+def _gallop_left(key: Any, pairs: List[Tuple[Any, Any]], lo: int, hi: int) -> int:
+    """First index in pairs[lo:hi] whose key is >= key: exponential probe from lo, then bisection"""
+    if lo >= hi or not pairs[lo][0] < key:
+        return lo
+    last, ofs = lo, 1
+    while lo + ofs < hi and pairs[lo + ofs][0] < key:
+        last = lo + ofs
+        ofs = 2 * ofs + 1
+    left, right = last + 1, min(lo + ofs, hi)
+    while left < right:
+        mid = (left + right) // 2
+        if pairs[mid][0] < key:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def _gallop_right(key: Any, pairs: List[Tuple[Any, Any]], lo: int, hi: int) -> int:
+    """First index in pairs[lo:hi] whose key is > key: exponential probe from lo, then bisection"""
+    if lo >= hi or key < pairs[lo][0]:
+        return lo
+    last, ofs = lo, 1
+    while lo + ofs < hi and not key < pairs[lo + ofs][0]:
+        last = lo + ofs
+        ofs = 2 * ofs + 1
+    left, right = last + 1, min(lo + ofs, hi)
+    while left < right:
+        mid = (left + right) // 2
+        if key < pairs[mid][0]:
+            right = mid
+        else:
+            left = mid + 1
+    return left
+
+
+def _gallop_merge_pairs(pairs: List[Tuple[Any, Any]], lo: int, mid: int, hi: int, state: List[int]) -> None:
+    """
+    Stable in-place merge of the ascending runs pairs[lo:mid] and pairs[mid:hi]
+    
+    Elements already in their final place at either end are trimmed off by
+    galloping first, and only the rest of the left run is copied out. The
+    merge starts one element at a time; once one side wins state[0]
+    (min_gallop) times in a row it switches to galloping, which finds how
+    many elements to take with an exponential search and moves them as one
+    slice. min_gallop adapts to how well galloping has been paying off.
+    """
+    lo = _gallop_right(pairs[mid][0], pairs, lo, mid)
+    if lo == mid:
+        return
+    hi = _gallop_left(pairs[mid - 1][0], pairs, mid, hi)
+    if hi == mid:
+        return
+    
+    tmp = pairs[lo:mid]
+    len_tmp = len(tmp)
+    i, j, k = 0, mid, lo
+    min_gallop = state[0]
+    
+    while True:
+        # One element at a time until one side keeps winning
+        count_a = count_b = 0
+        while True:
+            if pairs[j][0] < tmp[i][0]:
+                pairs[k] = pairs[j]
+                j += 1
+                k += 1
+                count_b += 1
+                count_a = 0
+                if j == hi or count_b >= min_gallop:
+                    break
+            else:
+                pairs[k] = tmp[i]
+                i += 1
+                k += 1
+                count_a += 1
+                count_b = 0
+                if i == len_tmp or count_a >= min_gallop:
+                    break
+        if i == len_tmp or j == hi:
+            break
+        
+        # Galloping: move whole stretches while they stay long
+        while True:
+            n_a = _gallop_right(pairs[j][0], tmp, i, len_tmp) - i
+            if n_a:
+                pairs[k:k + n_a] = tmp[i:i + n_a]
+                i += n_a
+                k += n_a
+                if i == len_tmp:
+                    break
+            n_b = _gallop_left(tmp[i][0], pairs, j, hi) - j
+            if n_b:
+                pairs[k:k + n_b] = pairs[j:j + n_b]
+                j += n_b
+                k += n_b
+                if j == hi:
+                    break
+            if n_a < MIN_GALLOP and n_b < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+        if i == len_tmp or j == hi:
+            break
+    
+    state[0] = min_gallop
+    # Whatever is left of the right run is already in place
+    if i < len_tmp:
+        pairs[k:k + len_tmp - i] = tmp[i:]
+
+
+def _hybrid_sort_pairs(pairs: List[Tuple[Any, Any]], progress: Optional[ProgressFunc] = None) -> None:
+    """Timsort-style ascending, stable sort of (key, value) pairs in place"""
+    n = len(pairs)
+    if n < 2:
+        return
+    min_run = _min_run(n)
+    runs: List[List[int]] = []
+    state = [MIN_GALLOP]
+    
+    def merge_at(i: int) -> None:
+        base_a, len_a = runs[i]
+        base_b, len_b = runs[i + 1]
+        runs[i][1] = len_a + len_b
+        del runs[i + 1]
+        _gallop_merge_pairs(pairs, base_a, base_b, base_b + len_b, state)
+    
+    lo = 0
+    while lo < n:
+        run_len = _count_run(pairs, lo, n)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_pairs(pairs, lo, lo + run_len, lo + forced)
+            run_len = forced
+        runs.append([lo, run_len])
+        lo += run_len
+        
+        # Keep run lengths decreasing faster than Fibonacci so merges stay balanced
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                    or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            merge_at(i)
+        
+        if progress is not None:
+            _report(progress, lo / n)
+    
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        merge_at(i)
+
+
+def hybrid_sort(arr: List[Record], key_func: Callable[[Record], Any], reverse: bool = False,
+                progress: Optional[ProgressFunc] = None) -> Tuple[List[Record], float]:
+    """
+    Hybrid Sort - O(n log n) worst case, O(n) on presorted input
+    Timsort-style adaptive merge sort over precomputed keys
+    
+    The input is scanned for natural runs (strictly descending runs are
+    reversed in place); runs shorter than the minimum run length (32-64)
+    are extended with binary insertion sort. Runs are merged from a stack
+    that keeps them balanced, and each merge trims elements already in
+    place and switches to galloping when one side keeps winning.
+    
+    Descending order follows sorted(): the input is reversed, sorted
+    ascending, and reversed back, which keeps equal keys in input order.
+    progress is called after every run is pushed, with the fraction of the
+    input scanned.
+    """
+    start_time = time.perf_counter()
+    pairs = [(key_func(record), record) for record in arr]
+    if reverse:
+        pairs.reverse()
+    _hybrid_sort_pairs(pairs, progress)
+    if reverse:
+        pairs.reverse()
+    sorted_arr = [record for _, record in pairs]
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def radix_sort(arr: List[Record], key_func: Callable[[Record], int], reverse: bool = False,
+               progress: Optional[ProgressFunc] = None) -> Tuple[List[Record], float]:
+    """
+    LSD Radix Sort - O(n * bytes), no key comparisons at all
+    Stable byte-wise radix sort for integer keys
+    
+    Keys are extracted once and offset by their minimum, so negative keys
+    work and only as many byte passes run as the key range needs (3 for
+    7-digit IDs, 2 for name ranks under 65,536). sortlab.radix.radix_order
+    packs each key with its position and distributes the packed ints into
+    256 buckets per byte; descending order concatenates the buckets from
+    255 down, which keeps equal keys in input order just like
+    sorted(reverse=True). progress is called after every pass.
+    """
+    start_time = time.perf_counter()
+    
+    try:
+        keys = array('q', [key_func(record) for record in arr])
+    except (TypeError, OverflowError):
+        raise TypeError("radix_sort needs integer keys (use the ID column or get_sort_keys)")
+    
+    hook = None if progress is None else (lambda fraction: _report(progress, fraction))
+    order = radix_order(keys, reverse, hook)
+    
+    sorted_arr = [arr[i] for i in order]
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def argsort_keys(keys, reverse: bool = False):
+    """
+    Stable sorting permutation of an integer key column
+    
+    With NumPy this is one argsort over the keys (viewed in place when they
+    are an int array or memoryview) and comes back as an int64 ndarray. Descending
+    order sorts a reversed view of the keys ascending, maps positions back
+    with n - 1 - i and reverses the result, which keeps equal keys in input
+    order without copying or negating the keys. Without NumPy it is the
+    radix_sort permutation as a list.
+    """
+    np = load_numpy()
+    if np is None:
+        return radix_sort(range(len(keys)), keys.__getitem__, reverse)[0]
+    
+    if isinstance(keys, (array, memoryview)) and (getattr(keys, 'typecode', None) or keys.format) in 'qi':
+        # array('q') IDs, array('i') name ranks or a memory-mapped column: no copy
+        column = np.frombuffer(keys, dtype=getattr(keys, 'typecode', None) or keys.format)
+    else:
+        column = np.asarray(keys, dtype=np.int64)
+    if not reverse:
+        return np.argsort(column, kind='stable')
+    n = len(column)
+    return (n - 1 - np.argsort(column[::-1], kind='stable'))[::-1]
+
+
+def numpy_sort(arr: List[Record], key_func: Callable[[Record], int], reverse: bool = False,
+               progress: Optional[ProgressFunc] = None) -> Tuple[List[Record], float]:
+    """
+    NumPy Sort - stable argsort of integer keys in compiled code
+    Falls back to the pure-Python radix_sort when NumPy is not installed
+    
+    Keys are extracted once into an int64 array; argsort_keys() computes
+    the permutation and the records are gathered in that order. progress is
+    only called at the end (the sort itself is a single NumPy call).
+    """
+    np = load_numpy()
+    if np is None:
+        return radix_sort(arr, key_func, reverse, progress)
+    
+    start_time = time.perf_counter()
+    try:
+        keys = np.fromiter(map(key_func, arr), dtype=np.int64, count=len(arr))
+    except (TypeError, ValueError, OverflowError):
+        raise TypeError("numpy_sort needs integer keys (use the ID column or get_sort_keys)")
+    
+    perm = argsort_keys(keys, reverse)
+    sorted_arr = [arr[i] for i in perm.tolist()]
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+PARALLEL_MIN_ROWS = 20000
+
+
+def _parallel_sort_chunk(shm_name: str, n: int, lo: int, hi: int, reverse: bool) -> float:
+    """
+    Worker process: sort rows lo..hi of the shared key column
+    
+    The shared block holds n int64 keys followed by n int64 slots for the
+    resulting permutation; the sorted row indices are written to slots
+    lo..hi. Returns the time spent sorting.
+    """
+    from multiprocessing import shared_memory
+    
+    start_time = time.perf_counter()
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        keys = block.buf[:8 * n].cast('q')
+        perm = block.buf[8 * n:16 * n].cast('q')
+        pairs = _bottom_up_sort_pairs([(keys[i], i) for i in range(lo, hi)], reverse)
+        for offset, (_, index) in enumerate(pairs, lo):
+            perm[offset] = index
+        del keys, perm
+    finally:
+        block.close()
+    return time.perf_counter() - start_time
+
+
+def _kway_merge_runs(keys, perm, bounds: List[Tuple[int, int]], reverse: bool) -> List[int]:
+    """
+    Merge sorted runs of row indices into one permutation
+    
+    heapq.merge keeps its heap in C and is stable: ties go to the earlier
+    run, i.e. the lower row indices, as in the serial sorts.
+    """
+    runs = [perm[lo:hi] for lo, hi in bounds]
+    return list(heapq.merge(*runs, key=keys.__getitem__, reverse=reverse))
+
+
+def parallel_merge_sort(arr: List[Record], key_func: Callable[[Record], int], reverse: bool = False,
+                        workers: Optional[int] = None) -> Tuple[List[Record], float]:
+    """
+    Parallel Merge Sort - O(n log n) work split across processes
+    Sorts records on an integer key using a process pool
+    
+    Keys are extracted once into an int64 column in shared memory, so the
+    workers never receive pickled records. Each worker sorts one contiguous
+    chunk (one per core by default) with the bottom-up engine and writes the
+    chunk's permutation back to shared memory; the parent then merges the
+    chunks with heapq.merge. Small inputs (or workers=1) run serially.
+    """
+    start_time = time.perf_counter()
+    n = len(arr)
+    workers = max(1, workers or os.cpu_count() or 1)
+    
+    try:
+        keys = array('q', [key_func(record) for record in arr])
+    except (TypeError, OverflowError):
+        raise TypeError("parallel_merge_sort needs integer keys (use the ID column or get_sort_keys)")
+    
+    if workers == 1 or n < PARALLEL_MIN_ROWS:
+        pairs = _bottom_up_sort_pairs([(keys[i], i) for i in range(n)], reverse)
+        sorted_arr = [arr[i] for _, i in pairs]
+        end_time = time.perf_counter()
+        return sorted_arr, end_time - start_time
+    
+    # Imported here so that importing this module stays cheap
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    step = -(-n // workers)
+    bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+    block = shared_memory.SharedMemory(create=True, size=16 * n)
+    try:
+        block.buf[:8 * n] = memoryview(keys).cast('B')
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            jobs = [pool.submit(_parallel_sort_chunk, block.name, n, lo, hi, reverse) for lo, hi in bounds]
+            for job in jobs:
+                job.result()
+        
+        # One copy out of shared memory, so no view outlives the block
+        perm = array('q')
+        perm.frombytes(block.buf[8 * n:16 * n])
+        order = _kway_merge_runs(keys, perm, bounds, reverse)
+    finally:
+        block.close()
+        block.unlink()
+    
+    sorted_arr = [arr[i] for i in order]
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def parallel_speedup(arr: List[Record], key_func: Callable[[Record], int], reverse: bool = False,
+                     workers: Optional[int] = None) -> Dict[str, float]:
+    """Time parallel_merge_sort against the serial merge_sort on the same input"""
+    parallel_result, parallel_time = parallel_merge_sort(arr, key_func, reverse, workers)
+    serial_result, serial_time = merge_sort(arr, key_func, reverse)
+    if parallel_result != serial_result:
+        raise RuntimeError("parallel and serial merge sort disagree")
+    return {
+        'workers': max(1, workers or os.cpu_count() or 1),
+        'serial_time': serial_time,
+        'parallel_time': parallel_time,
+        'speedup': serial_time / parallel_time if parallel_time > 0 else float('inf'),
+    }
+
+
+# ============================================================================
+# TOP-K (PARTIAL SORT)
+# ============================================================================
+#
+# Both return exactly sorted(arr, key=key_func, reverse=reverse)[:k]: the k
+# first records of the full stable sort, equal keys in input order.
+
+class _Inverted:
+    """Key wrapper that orders in reverse, for non-integer keys"""
+    
+    __slots__ = ('key',)
+    
+    def __init__(self, key: Any):
+        self.key = key
+    
+    def __lt__(self, other: '_Inverted') -> bool:
+        return other.key < self.key
+    
+    def __gt__(self, other: '_Inverted') -> bool:
+        return self.key < other.key
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Inverted) and self.key == other.key
+
+
+def heap_top_k(arr: List[Record], key_func: Callable[[Record], Any], k: int, reverse: bool = False,
+               progress: Optional[ProgressFunc] = None) -> Tuple[List[Record], float]:
+    """
+    Heap Top-K - O(n log k) time, a heap of only k entries
+    The k first records of the sorted order, without sorting the rest
+    
+    A min-heap holds the k best entries seen so far with the worst one at
+    the root; each later record either loses to the root (one comparison)
+    or replaces it (log k). Entries are (key, -index), with the key negated
+    (or wrapped) for ascending order, so "better" is always "larger" and
+    ties prefer the earlier record. The k survivors are sorted at the end.
+    progress is called every n / PROGRESS_STEPS (at least
+    PROGRESS_MIN_CHUNK) records of the scan.
+    """
+    start_time = time.perf_counter()
+    n = len(arr)
+    k = max(0, min(k, n))
+    heap: List[Tuple[Any, int]] = []
+    
+    if k:
+        keys = [key_func(record) for record in arr]
+        # Integer keys are negated only as they enter the heap; other keys
+        # are wrapped up front
+        negate = not reverse and all(type(key) is int for key in keys)
+        if not reverse and not negate:
+            keys = [_Inverted(key) for key in keys]
+        
+        heap = [(-keys[i] if negate else keys[i], -i) for i in range(k)]
+        heapq.heapify(heap)
+        stride = max(PROGRESS_MIN_CHUNK, n // PROGRESS_STEPS)
+        for lo in range(k, n, stride):
+            # A later record never wins a tie, so only a strictly better
+            # key can enter the heap and the index need not be compared
+            hi = min(lo + stride, n)
+            if negate:
+                worst = -heap[0][0]
+                for i in range(lo, hi):
+                    if keys[i] < worst:
+                        heapq.heapreplace(heap, (-keys[i], -i))
+                        worst = -heap[0][0]
+            else:
+                worst = heap[0][0]
+                for i in range(lo, hi):
+                    if keys[i] > worst:
+                        heapq.heapreplace(heap, (keys[i], -i))
+                        worst = heap[0][0]
+            if progress is not None:
+                _report(progress, hi / n)
+        heap.sort(reverse=True)
+    
+    sorted_arr = [arr[-i] for _, i in heap]
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def _select_kth(values: List[Any], rank: int) -> Any:
+    """The value at position `rank` of sorted(values), expected O(n) (quickselect)"""
+    import random
+    
+    rng = random.Random(len(values))
+    while True:
+        pivot = values[rng.randrange(len(values))]
+        lows = [value for value in values if value < pivot]
+        if rank < len(lows):
+            values = lows
+            continue
+        equal = sum(1 for value in values if value == pivot)
+        if rank < len(lows) + equal:
+            return pivot
+        rank -= len(lows) + equal
+        values = [value for value in values if pivot < value]
+
+
+def quickselect_top_k(arr: List[Record], key_func: Callable[[Record], Any], k: int, reverse: bool = False,
+                      progress: Optional[ProgressFunc] = None) -> Tuple[List[Record], float]:
+    """
+    Quickselect Top-K - O(n + k log k) expected time
+    Partial sort: select the k-th key, then sort only the records before it
+    
+    Quickselect with a three-way partition finds the key t of the k-th
+    record in sorted order. One pass then keeps every record whose key
+    beats t plus the first records (in input order) whose key equals t,
+    exactly k in all, and hybrid_sort orders just those. progress is
+    called after the selection and at the end.
+    """
+    start_time = time.perf_counter()
+    n = len(arr)
+    k = max(0, min(k, n))
+    selected: List[Record] = []
+    
+    if k:
+        keys = [key_func(record) for record in arr]
+        threshold = _select_kth(list(keys), n - k if reverse else k - 1)
+        if progress is not None:
+            _report(progress, 0.5)
+        if reverse:
+            better = [i for i in range(n) if threshold < keys[i]]
+        else:
+            better = [i for i in range(n) if keys[i] < threshold]
+        ties = k - len(better)
+        if ties:
+            tied = [i for i in range(n) if keys[i] == threshold][:ties]
+            better = sorted(better + tied)
+        selected = [arr[i] for i in better]
+        selected, _ = hybrid_sort(selected, key_func, reverse)
+    
+    if progress is not None:
+        progress(1.0)
+    end_time = time.perf_counter()
+    return selected, end_time - start_time
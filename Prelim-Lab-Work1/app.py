@@ -1,17 +1,34 @@
 import time
 import os
+import sys
 
-def bubble_sort(arr):
+# The shared sortlab package (OpCounter, timing harness, loaders) lives in
+# the repository root, one folder up
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+# Re-exported so callers can pass counter=OpCounter() from this module
+from sortlab.counting import OpCounter  # noqa: F401
+from sortlab.radix import load_numpy, radix_sort_ints
+
+
+def bubble_sort(arr, counter=None):
     """
     Sorts an array using the bubble sort algorithm in descending order.
     
     Args:
         arr: List of comparable elements to sort
+        counter: Optional OpCounter; when given, an instrumented copy of the
+            loop counts comparisons and swaps (the plain loop is untouched)
         
     Returns:
         Tuple of (sorted list, time taken in seconds)
     """
-    start_time = time.time()
+    if counter is not None:
+        return _bubble_sort_counted(arr, counter)
+    
+    start_time = time.perf_counter()
     n = len(arr)
     
     # Traverse through all array elements
@@ -30,35 +47,150 @@ def bubble_sort(arr):
         if not swapped:
             break
     
-    end_time = time.time()
+    end_time = time.perf_counter()
     time_taken = end_time - start_time
     
     return arr, time_taken
 
 
+def _bubble_sort_counted(arr, counter):
+    """bubble_sort with every comparison and swap recorded in counter"""
+    start_time = time.perf_counter()
+    n = len(arr)
+    
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            counter.comparisons += 1
+            if arr[j] < arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                counter.swaps += 1
+                swapped = True
+        if not swapped:
+            break
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def radix_sort(arr):
+    """
+    Sorts integers with a byte-wise LSD radix sort in descending order.
+    
+    Values are offset by the minimum (so negatives work) and distributed
+    into 256 buckets one byte at a time, least significant byte first,
+    for only as many bytes as the value range needs. Concatenating the
+    buckets from 255 down gives descending order without comparing any
+    two values. The bucket passes are the shared sortlab.radix core.
+    
+    Args:
+        arr: List of integers to sort
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    start_time = time.perf_counter()
+    arr[:] = radix_sort_ints(arr, reverse=True)
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def numpy_sort(arr):
+    """
+    Sorts integers with NumPy in descending order, falling back to
+    radix_sort when NumPy is not installed.
+    
+    A list is converted to an int64 array, sorted in compiled code and
+    written back in place. A NumPy array (see sortlab.intload) is
+    returned as a descending view of its sorted copy, so no Python ints
+    are created at all.
+    
+    Args:
+        arr: List of integers, or a NumPy int64 array
+        
+    Returns:
+        Tuple of (sorted list or array, time taken in seconds)
+    """
+    np = load_numpy()
+    if np is None:
+        return radix_sort(arr)
+    
+    start_time = time.perf_counter()
+    if isinstance(arr, np.ndarray):
+        result = np.sort(arr)[::-1]
+    else:
+        arr[:] = np.sort(np.array(arr, dtype=np.int64))[::-1].tolist()
+        result = arr
+    end_time = time.perf_counter()
+    return result, end_time - start_time
+
+
+ALGORITHMS = {'bubble': bubble_sort, 'radix': radix_sort, 'numpy': numpy_sort}
+
+
+def parse_args(argv=None):
+    """Command-line options for the timing run"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Sort dataset.txt in descending order")
+    parser.add_argument('--algorithm', '-a', choices=sorted(ALGORITHMS), default='bubble',
+                        help='sorting algorithm (default: bubble)')
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='timed runs (default: 3)')
+    parser.add_argument('--warmup', '-w', type=int, default=0, help='untimed runs first (default: 0)')
+    parser.add_argument('--disable-gc', action='store_true',
+                        help='pause the garbage collector during the timed runs')
+    parser.add_argument('--output', '-o', metavar='PATH',
+                        help='write the sorted numbers to PATH, one per line (.gz to compress), '
+                             'instead of printing them all')
+    return parser.parse_args(argv)
+
+
 # Example usage 
 if __name__ == "__main__":
+    from sortlab.intload import load_int_ndarray, load_ints, numpy_available, save_ints
+    from sortlab.timing import measure
+    
+    args = parse_args()
+    
     # Load data from dataset.txt
     script_dir = os.path.dirname(os.path.abspath(__file__))
     dataset_path = os.path.join(script_dir, 'dataset.txt')
     
     try:
-        with open(dataset_path, 'r') as f:
-            data = [int(line.strip()) for line in f if line.strip()]
+        # The whole file is read as one buffer and converted in bulk
+        if args.algorithm == 'numpy' and numpy_available():
+            # Parsed by NumPy into an int64 array; numpy_sort then never builds Python ints
+            data = load_int_ndarray(dataset_path)
+        else:
+            data = load_ints(dataset_path)
         
         print(f"Loaded {len(data)} numbers from dataset.txt")
-        print(f"First 10 numbers: {data[:10]}")
-        print(f"Last 10 numbers: {data[-10:]}\n")
+        print(f"First 10 numbers: {[int(v) for v in data[:10]]}")
+        print(f"Last 10 numbers: {[int(v) for v in data[-10:]]}\n")
         
-        # Perform bubble sort in descending order
-        print("Sorting in descending order...")
-        sorted_arr, time_taken = bubble_sort(data.copy())
+        # Sort in descending order; every run gets a fresh copy
+        print(f"Sorting in descending order with {args.algorithm} sort "
+              f"({args.warmup} warmup + {args.repeat} timed runs)...")
+        results = []
+        stats = measure(ALGORITHMS[args.algorithm], repeat=args.repeat, warmup=args.warmup,
+                        disable_gc=args.disable_gc, setup=lambda: (data.copy(),),
+                        on_result=lambda run, value: results.append(value[0]))
+        sorted_arr = results[0]
         
-        # Display results
-        print(f"\nSorted array (descending order):")
-        print(sorted_arr)
-        print(f"\nTime spent: {time_taken:.6f} seconds")
-        print(f"Time spent: {time_taken*1000:.2f} milliseconds")
+        # Display results, or write them in bulk when an output file is given
+        if args.output:
+            size = save_ints(args.output, sorted_arr)
+            print(f"\nWrote {len(sorted_arr)} sorted numbers to {args.output} ({size / 1e6:.2f} MB)")
+            print(f"First 10 sorted: {[int(v) for v in sorted_arr[:10]]}")
+        else:
+            print("\nSorted array (descending order):")
+            print([int(v) for v in sorted_arr])
+        print(f"\nTime spent: {stats.summary()}")
+        print(f"Mean:   {stats.mean_s:.6f} seconds ({stats.mean_s*1000:.2f} milliseconds)")
+        print(f"Median: {stats.median_s:.6f} seconds")
+        if stats.repeat > 1:
+            print(f"Stdev:  {stats.stdev_s:.6f} seconds")
+            print(f"95% CI: {stats.ci95_s[0]:.6f} – {stats.ci95_s[1]:.6f} seconds")
         
     except FileNotFoundError:
         print("Error: dataset.txt not found!")
@@ -73,7 +205,7 @@ if __name__ == "__main__":
         
         for arr in test_arrays:
             print(f"Original: {arr}")
-            sorted_arr, time_taken = bubble_sort(arr.copy())
+            sorted_arr, time_taken = ALGORITHMS[args.algorithm](arr.copy())
             print(f"Sorted (descending): {sorted_arr}")
             print(f"Time taken: {time_taken:.6f} seconds\n")
         print(f"Sorted:   {sorted_arr}")
@@ -0,0 +1,532 @@
+"""
+Sorting algorithms used by the Sorting Algorithm Analyzer.
+
+All sorts order integers in descending order and return
+(sorted list, time taken in seconds). This module has no GUI dependencies.
+
+bubble_sort, insertion_sort and merge_sort take an optional OpCounter.
+Passing one runs an instrumented copy of the algorithm that counts
+comparisons, swaps, element moves and list allocations; without it the
+plain loops run unchanged.
+"""
+
+import os
+import sys
+import time
+
+# The shared sortlab package lives in the repository root, one folder up
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+# Re-exported so callers can pass counter=OpCounter() from this module
+from sortlab.counting import OpCounter  # noqa: F401
+from sortlab.radix import load_numpy, radix_sort_ints
+
+
+def bubble_sort(arr, counter=None):
+    """
+    Sorts an array using the bubble sort algorithm in descending order.
+    
+    Args:
+        arr: List of comparable elements to sort
+        counter: Optional OpCounter for an instrumented run
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    if counter is not None:
+        return _bubble_sort_counted(arr, counter)
+    
+    start_time = time.perf_counter()
+    n = len(arr)
+    
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            if arr[j] < arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swapped = True
+        if not swapped:
+            break
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def insertion_sort(arr, counter=None):
+    """
+    Sorts an array using the insertion sort algorithm in descending order.
+    
+    Args:
+        arr: List of comparable elements to sort
+        counter: Optional OpCounter for an instrumented run
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    if counter is not None:
+        return _insertion_sort_counted(arr, counter)
+    
+    start_time = time.perf_counter()
+    n = len(arr)
+    
+    for i in range(1, n):
+        key = arr[i]
+        j = i - 1
+        while j >= 0 and arr[j] < key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def merge_sort(arr, counter=None):
+    """
+    Sorts an array using the merge sort algorithm in descending order.
+    
+    Args:
+        arr: List of comparable elements to sort
+        counter: Optional OpCounter for an instrumented run
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    if counter is not None:
+        return _merge_sort_counted(arr, counter)
+    
+    start_time = time.perf_counter()
+    
+    def merge(left, right):
+        result = []
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] >= right[j]:
+                result.append(left[i])
+                i += 1
+            else:
+                result.append(right[j])
+                j += 1
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return result
+    
+    def merge_sort_helper(arr):
+        if len(arr) <= 1:
+            return arr
+        mid = len(arr) // 2
+        left = merge_sort_helper(arr[:mid])
+        right = merge_sort_helper(arr[mid:])
+        return merge(left, right)
+    
+    sorted_arr = merge_sort_helper(arr)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+# ===== INSTRUMENTED VARIANTS (counter=...) =====
+
+def _bubble_sort_counted(arr, counter):
+    """bubble_sort, counting comparisons and swaps"""
+    start_time = time.perf_counter()
+    n = len(arr)
+    
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            counter.comparisons += 1
+            if arr[j] < arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                counter.swaps += 1
+                swapped = True
+        if not swapped:
+            break
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def _insertion_sort_counted(arr, counter):
+    """insertion_sort, counting comparisons and element moves (shifts plus the final write)"""
+    start_time = time.perf_counter()
+    n = len(arr)
+    
+    for i in range(1, n):
+        key = arr[i]
+        j = i - 1
+        while j >= 0:
+            counter.comparisons += 1
+            if not arr[j] < key:
+                break
+            arr[j + 1] = arr[j]
+            counter.moves += 1
+            j -= 1
+        arr[j + 1] = key
+        counter.moves += 1
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def _merge_sort_counted(arr, counter):
+    """merge_sort, counting comparisons, elements written to merge results and lists allocated"""
+    start_time = time.perf_counter()
+    
+    def merge(left, right):
+        result = []
+        counter.allocations += 1
+        i = j = 0
+        while i < len(left) and j < len(right):
+            counter.comparisons += 1
+            if left[i] >= right[j]:
+                result.append(left[i])
+                i += 1
+            else:
+                result.append(right[j])
+                j += 1
+        counter.moves += len(left) + len(right)
+        counter.allocations += 2
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return result
+    
+    def merge_sort_helper(arr):
+        if len(arr) <= 1:
+            return arr
+        mid = len(arr) // 2
+        counter.allocations += 2
+        left = merge_sort_helper(arr[:mid])
+        right = merge_sort_helper(arr[mid:])
+        return merge(left, right)
+    
+    sorted_arr = merge_sort_helper(arr)
+    end_time = time.perf_counter()
+    return sorted_arr, end_time - start_time
+
+
+def _insertion_sort_range(arr, lo, hi):
+    """Insertion sort arr[lo:hi] in place, descending"""
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] < key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _merge_runs(src, dst, lo, mid, hi):
+    """Merge the descending runs src[lo:mid] and src[mid:hi] into dst[lo:hi]"""
+    i, j, k = lo, mid, lo
+    left, right = src[i], src[j]
+    while True:
+        if left >= right:
+            dst[k] = left
+            i += 1
+            k += 1
+            if i == mid:
+                dst[k:hi] = src[j:hi]
+                return
+            left = src[i]
+        else:
+            dst[k] = right
+            j += 1
+            k += 1
+            if j == hi:
+                dst[k:hi] = src[i:mid]
+                return
+            right = src[j]
+
+
+def bottom_up_merge_sort(arr, cutoff=8):
+    """
+    Sorts an array using an iterative (bottom-up) merge sort in descending order.
+    
+    Runs of `cutoff` elements are insertion-sorted in place, then runs of
+    doubling width are merged back and forth between the input list and a
+    single auxiliary list allocated once up front, so no slices or result
+    lists are created per merge.
+    
+    Args:
+        arr: List of comparable elements to sort
+        cutoff: Run length handled by insertion sort before merging
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    start_time = time.perf_counter()
+    n = len(arr)
+    cutoff = max(1, cutoff)
+    
+    for lo in range(0, n, cutoff):
+        _insertion_sort_range(arr, lo, min(lo + cutoff, n))
+    
+    src, dst = arr, [None] * n
+    width = cutoff
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            # Single run left over, or two runs that are already in order
+            if mid >= hi or src[mid - 1] >= src[mid]:
+                dst[lo:hi] = src[lo:hi]
+                continue
+            _merge_runs(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    
+    if src is not arr:
+        arr[:] = src
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+MIN_GALLOP = 7
+
+
+def _min_run(n):
+    """Timsort minimum run length: n itself below 64, else in [32, 64]"""
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def _count_run(arr, lo, hi):
+    """Length of the descending run at lo; a strictly ascending run is reversed in place"""
+    n = lo + 1
+    if n == hi:
+        return 1
+    if arr[n] > arr[lo]:
+        while n + 1 < hi and arr[n + 1] > arr[n]:
+            n += 1
+        arr[lo:n + 1] = arr[lo:n + 1][::-1]
+    else:
+        while n + 1 < hi and arr[n + 1] <= arr[n]:
+            n += 1
+    return n + 1 - lo
+
+
+def _binary_insertion(arr, lo, start, hi):
+    """Extend the sorted arr[lo:start] to arr[lo:hi], shifting with slice moves"""
+    for i in range(start, hi):
+        value = arr[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if value > arr[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        if left < i:
+            arr[left + 1:i + 1] = arr[left:i]
+            arr[left] = value
+
+
+def _gallop(value, arr, lo, hi, strict):
+    """
+    First index in arr[lo:hi] (descending) past every element >= value,
+    or > value when strict: exponential probe from lo, then bisection.
+    """
+    def before(x):
+        return x > value if strict else x >= value
+    
+    if lo >= hi or not before(arr[lo]):
+        return lo
+    last, ofs = lo, 1
+    while lo + ofs < hi and before(arr[lo + ofs]):
+        last = lo + ofs
+        ofs = 2 * ofs + 1
+    left, right = last + 1, min(lo + ofs, hi)
+    while left < right:
+        mid = (left + right) // 2
+        if before(arr[mid]):
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def _gallop_merge(arr, lo, mid, hi, state):
+    """
+    In-place merge of the descending runs arr[lo:mid] and arr[mid:hi]
+    
+    Elements already in place at either end are trimmed by galloping and
+    only the rest of the left run is copied out. Once one side wins
+    state[0] times in a row the merge gallops, moving whole stretches
+    as slices.
+    """
+    lo = _gallop(arr[mid], arr, lo, mid, strict=False)
+    if lo == mid:
+        return
+    hi = _gallop(arr[mid - 1], arr, mid, hi, strict=True)
+    if hi == mid:
+        return
+    
+    tmp = arr[lo:mid]
+    len_tmp = len(tmp)
+    i, j, k = 0, mid, lo
+    min_gallop = state[0]
+    
+    while True:
+        count_a = count_b = 0
+        while True:
+            if arr[j] > tmp[i]:
+                arr[k] = arr[j]
+                j += 1
+                k += 1
+                count_b += 1
+                count_a = 0
+                if j == hi or count_b >= min_gallop:
+                    break
+            else:
+                arr[k] = tmp[i]
+                i += 1
+                k += 1
+                count_a += 1
+                count_b = 0
+                if i == len_tmp or count_a >= min_gallop:
+                    break
+        if i == len_tmp or j == hi:
+            break
+        
+        while True:
+            n_a = _gallop(arr[j], tmp, i, len_tmp, strict=False) - i
+            if n_a:
+                arr[k:k + n_a] = tmp[i:i + n_a]
+                i += n_a
+                k += n_a
+                if i == len_tmp:
+                    break
+            n_b = _gallop(tmp[i], arr, j, hi, strict=True) - j
+            if n_b:
+                arr[k:k + n_b] = arr[j:j + n_b]
+                j += n_b
+                k += n_b
+                if j == hi:
+                    break
+            if n_a < MIN_GALLOP and n_b < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+        if i == len_tmp or j == hi:
+            break
+    
+    state[0] = min_gallop
+    if i < len_tmp:
+        arr[k:k + len_tmp - i] = tmp[i:]
+
+
+def hybrid_sort(arr):
+    """
+    Sorts an array with a Timsort-style hybrid sort in descending order.
+    
+    The input is split into natural runs (ascending runs are reversed);
+    runs shorter than the minimum run length are extended with binary
+    insertion sort, then merged from a stack that keeps them balanced,
+    galloping when one run keeps winning. Already sorted input costs a
+    single pass.
+    
+    Args:
+        arr: List of comparable elements to sort
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    start_time = time.perf_counter()
+    n = len(arr)
+    min_run = _min_run(n)
+    runs = []
+    state = [MIN_GALLOP]
+    
+    def merge_at(i):
+        base_a, len_a = runs[i]
+        base_b, len_b = runs[i + 1]
+        runs[i][1] = len_a + len_b
+        del runs[i + 1]
+        _gallop_merge(arr, base_a, base_b, base_b + len_b, state)
+    
+    lo = 0
+    while lo < n:
+        run_len = _count_run(arr, lo, n)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion(arr, lo, lo + run_len, lo + forced)
+            run_len = forced
+        runs.append([lo, run_len])
+        lo += run_len
+        
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                    or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            merge_at(i)
+    
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        merge_at(i)
+    
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def radix_sort(arr):
+    """
+    Sorts integers with a byte-wise LSD radix sort in descending order.
+    
+    Values are offset by the minimum (so negatives work) and distributed
+    into 256 buckets one byte at a time, least significant byte first,
+    for only as many bytes as the value range needs. Concatenating the
+    buckets from 255 down gives descending order without comparing any
+    two values. The bucket passes are the shared sortlab.radix core.
+    
+    Args:
+        arr: List of integers to sort
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    start_time = time.perf_counter()
+    arr[:] = radix_sort_ints(arr, reverse=True)
+    end_time = time.perf_counter()
+    return arr, end_time - start_time
+
+
+def numpy_sort(arr):
+    """
+    Sorts integers with NumPy in descending order, falling back to
+    radix_sort when NumPy is not installed.
+    
+    A list is converted to an int64 array, sorted in compiled code and
+    written back in place. A NumPy array (see sortlab.intload) is
+    returned as a descending view of its sorted copy, so no Python ints
+    are created at all.
+    
+    Args:
+        arr: List of integers, or a NumPy int64 array
+        
+    Returns:
+        Tuple of (sorted list or array, time taken in seconds)
+    """
+    np = load_numpy()
+    if np is None:
+        return radix_sort(arr)
+    
+    start_time = time.perf_counter()
+    if isinstance(arr, np.ndarray):
+        result = np.sort(arr)[::-1]
+    else:
+        arr[:] = np.sort(np.array(arr, dtype=np.int64))[::-1].tolist()
+        result = arr
+    end_time = time.perf_counter()
+    return result, end_time - start_time
@@ -0,0 +1,327 @@
+"""
+Tkinter GUI for the Sorting Algorithm Analyzer.
+
+Only imported from app.main(), so algorithms.py and load_dataset() stay
+usable where Tk is slow to load or not installed.
+"""
+
+import tkinter as tk
+from tkinter import scrolledtext, messagebox, ttk
+
+from sortlab.timing import measure
+from sortlab.tkviews import VirtualTable, WorkerQueue
+from algorithms import bubble_sort, insertion_sort, merge_sort, bottom_up_merge_sort, hybrid_sort, radix_sort
+
+
+class SortingGUI:
+    def __init__(self, root, data):
+        self.root = root
+        self.data = data
+        self.root.title("🚀 Advanced Sorting Algorithm Analyzer")
+        self.root.geometry("1200x900")
+        self.root.configure(bg="#0a0e27")
+        
+        # Modern gradient-like color scheme
+        self.bg_color = "#0a0e27"
+        self.accent_color = "#1a2847"
+        self.text_color = "#ffffff"
+        self.button_colors = {
+            "bubble": "#00d4ff",
+            "insertion": "#ff006e",
+            "merge": "#00ff41",
+            "bottomup": "#ffd60a",
+            "hybrid": "#b388ff",
+            "radix": "#ff9f1c"
+        }
+        
+        # Sorts run on a worker thread that reports back through this queue;
+        # only the handlers below (on the Tk thread) update widgets
+        self.current_title = ""
+        self.worker = WorkerQueue(root, {
+            "result": self.on_result,
+            "error": self.on_error,
+            "done": self.on_done,
+        })
+        
+        # ===== PREMIUM HEADER WITH 3D EFFECT =====
+        header_frame = tk.Frame(root, bg="#0f1535", highlightthickness=3, highlightcolor="#00d4ff", highlightbackground="#00d4ff")
+        header_frame.pack(fill=tk.X, padx=0, pady=0)
+        
+        # Shadow effect
+        shadow1 = tk.Frame(header_frame, bg="#1a2555", height=2)
+        shadow1.pack(fill=tk.X, side=tk.TOP)
+        
+        title = tk.Label(header_frame, text="⚡ SORTING ALGORITHM ANALYZER", 
+                         font=("Segoe UI", 28, "bold"), 
+                         bg="#0f1535", fg="#00d4ff")
+        title.pack(pady=20, padx=20)
+        
+        subtitle = tk.Label(header_frame, text="Professional Performance Analysis Tool | Real-time Processing", 
+                           font=("Segoe UI", 11, "italic"), 
+                           bg="#0f1535", fg="#00ffff")
+        subtitle.pack(pady=(0, 15), padx=20)
+        
+        # Shadow effect
+        shadow2 = tk.Frame(header_frame, bg="#1a2555", height=2)
+        shadow2.pack(fill=tk.X, side=tk.BOTTOM)
+        
+        # ===== TIMING OPTIONS =====
+        timing_frame = tk.Frame(root, bg="#1a2847")
+        timing_frame.pack(fill=tk.X, padx=15, pady=(15, 0))
+        
+        tk.Label(timing_frame, text="⏱️ Repeats:", font=("Segoe UI", 11, "bold"),
+                 bg="#1a2847", fg="#00d4ff").pack(side=tk.LEFT, padx=(20, 10), pady=10)
+        self.repeat_var = tk.StringVar(value="3")
+        self.repeat_menu = ttk.Combobox(timing_frame, textvariable=self.repeat_var,
+                                        values=["1", "3", "5", "10"],
+                                        state="readonly", width=4, font=("Segoe UI", 10))
+        self.repeat_menu.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(timing_frame, text="Warmup:", font=("Segoe UI", 11, "bold"),
+                 bg="#1a2847", fg="#00d4ff").pack(side=tk.LEFT, padx=(20, 10))
+        self.warmup_var = tk.StringVar(value="0")
+        self.warmup_menu = ttk.Combobox(timing_frame, textvariable=self.warmup_var,
+                                        values=["0", "1", "2"],
+                                        state="readonly", width=4, font=("Segoe UI", 10))
+        self.warmup_menu.pack(side=tk.LEFT, padx=5)
+        
+        self.gc_var = tk.BooleanVar(value=True)
+        self.gc_check = tk.Checkbutton(timing_frame, text="Pause GC while timing", variable=self.gc_var,
+                                       font=("Segoe UI", 10), bg="#1a2847", fg="#00d4ff",
+                                       selectcolor="#0a0e27", activebackground="#1a2847",
+                                       activeforeground="#00d4ff")
+        self.gc_check.pack(side=tk.LEFT, padx=20)
+        
+        # ===== MODERN BUTTONS SECTION WITH 3D EFFECT =====
+        button_container = tk.Frame(root, bg="#0a0e27", highlightthickness=0)
+        button_container.pack(pady=25)
+        
+        # Create 3D button effect with shadow
+        button_frame = tk.Frame(button_container, bg="#0a0e27")
+        button_frame.pack(side=tk.TOP, padx=20)
+        
+        self.bubble_btn = self.create_3d_button(
+            button_frame, 
+            "🔄\nBUBBLE\nSORT", 
+            lambda: self.run_sort("bubble"), 
+            self.button_colors["bubble"],
+            0
+        )
+        
+        self.insertion_btn = self.create_3d_button(
+            button_frame, 
+            "➡️\nINSERTION\nSORT", 
+            lambda: self.run_sort("insertion"), 
+            self.button_colors["insertion"],
+            1
+        )
+        
+        self.merge_btn = self.create_3d_button(
+            button_frame, 
+            "⛓️\nMERGE\nSORT", 
+            lambda: self.run_sort("merge"), 
+            self.button_colors["merge"],
+            2
+        )
+        
+        self.bottomup_btn = self.create_3d_button(
+            button_frame, 
+            "🧱\nBOTTOM-UP\nMERGE", 
+            lambda: self.run_sort("bottomup"), 
+            self.button_colors["bottomup"],
+            3
+        )
+        
+        self.hybrid_btn = self.create_3d_button(
+            button_frame, 
+            "🧬\nHYBRID\nSORT", 
+            lambda: self.run_sort("hybrid"), 
+            self.button_colors["hybrid"],
+            4
+        )
+        
+        self.radix_btn = self.create_3d_button(
+            button_frame, 
+            "🔢\nRADIX\nSORT", 
+            lambda: self.run_sort("radix"), 
+            self.button_colors["radix"],
+            5
+        )
+        
+        # ===== RESULTS LABEL WITH GRADIENT EFFECT =====
+        results_header = tk.Frame(root, bg="#1a2847", highlightthickness=2, highlightcolor="#00d4ff")
+        results_header.pack(fill=tk.X, padx=15, pady=(15, 0))
+        
+        results_label = tk.Label(results_header, text="📊 SORTED OUTPUT:", 
+                                 font=("Segoe UI", 13, "bold"), 
+                                 bg="#1a2847", fg="#00ff41")
+        results_label.pack(anchor="w", padx=15, pady=10)
+        
+        # ===== MODERN RESULTS TEXT AREA WITH 3D BORDERS =====
+        text_container = tk.Frame(root, bg="#0a0e27")
+        text_container.pack(fill=tk.X, padx=15, pady=(0, 10))
+        
+        # Outer border for 3D effect
+        outer_border = tk.Frame(text_container, bg="#00d4ff", highlightthickness=0)
+        outer_border.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        
+        # Inner frame
+        inner_frame = tk.Frame(outer_border, bg="#1a2555")
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=3)
+        
+        self.result_text = scrolledtext.ScrolledText(
+            inner_frame, 
+            height=8, 
+            width=142,
+            font=("Consolas", 9),
+            bg="#121a3a",
+            fg="#00ff41",
+            insertbackground="#00ff41",
+            relief=tk.FLAT,
+            borderwidth=0,
+            highlightthickness=0
+        )
+        self.result_text.pack(fill=tk.BOTH, expand=True)
+        
+        # ===== SORTED VALUES (VIRTUALIZED, ONLY VISIBLE ROWS ARE RENDERED) =====
+        table_border = tk.Frame(root, bg="#00d4ff", highlightthickness=0)
+        table_border.pack(fill=tk.BOTH, expand=True, padx=17, pady=(0, 15))
+        
+        self.result_table = VirtualTable(
+            table_border,
+            columns=[("#", 120), ("Value", 300)],
+            bg="#121a3a", fg="#00ff41", heading_bg="#1a2847"
+        )
+        self.result_table.pack(fill=tk.BOTH, expand=True, padx=3, pady=3)
+    
+    def create_3d_button(self, parent, text, command, color, column):
+        """Create a 3D styled button"""
+        # Outer shadow frame
+        shadow_frame = tk.Frame(parent, bg="#000000")
+        shadow_frame.grid(row=0, column=column, padx=12, pady=12, sticky="nsew")
+        
+        # Main button
+        btn = tk.Button(
+            shadow_frame,
+            text=text,
+            command=command,
+            font=("Segoe UI", 12, "bold"),
+            bg=color,
+            fg="#000000",
+            padx=22, pady=24,
+            border=0,
+            cursor="hand2",
+            activebackground=self.lighten_color(color),
+            activeforeground="#000000",
+            relief=tk.RAISED,
+            bd=2
+        )
+        btn.pack(padx=3, pady=3)
+        
+        return btn
+    
+    def lighten_color(self, hex_color):
+        """Lighten a hex color for hover effect"""
+        hex_color = hex_color.lstrip('#')
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        r = min(255, r + 40)
+        g = min(255, g + 40)
+        b = min(255, b + 40)
+        return '#{:02x}{:02x}{:02x}'.format(r, g, b)
+        
+    def run_sort(self, sort_type):
+        """Run sorting algorithm on a worker thread"""
+        if not self.data:
+            messagebox.showerror("Error", "No data loaded!")
+            return
+        
+        emoji = {"bubble": "🔄", "insertion": "➡️", "merge": "⛓️", "bottomup": "🧱", "hybrid": "🧬",
+                 "radix": "🔢"}[sort_type]
+        title = {"bubble": "BUBBLE SORT", "insertion": "INSERTION SORT",
+                 "merge": "MERGE SORT", "bottomup": "BOTTOM-UP MERGE SORT",
+                 "hybrid": "HYBRID SORT", "radix": "RADIX SORT"}[sort_type]
+        self.current_title = f"{emoji} {title}"
+        
+        self.disable_buttons()
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{self.current_title} - PROCESSING\n")
+        self.result_text.insert(tk.END, "█" * 142 + "\n\n")
+        self.result_text.insert(tk.END, "⏳ Sorting in progress...\n")
+        self.result_text.config(state="disabled")
+        self.result_table.clear()
+        
+        timing = {"repeat": int(self.repeat_var.get()), "warmup": int(self.warmup_var.get()),
+                  "disable_gc": self.gc_var.get()}
+        self.worker.start(self.execute_sort, sort_type, list(self.data), timing)
+    
+    def disable_buttons(self):
+        self.bubble_btn.config(state="disabled")
+        self.insertion_btn.config(state="disabled")
+        self.merge_btn.config(state="disabled")
+        self.bottomup_btn.config(state="disabled")
+        self.hybrid_btn.config(state="disabled")
+        self.radix_btn.config(state="disabled")
+        self.repeat_menu.config(state="disabled")
+        self.warmup_menu.config(state="disabled")
+        self.gc_check.config(state="disabled")
+    
+    def enable_buttons(self):
+        self.bubble_btn.config(state="normal")
+        self.insertion_btn.config(state="normal")
+        self.merge_btn.config(state="normal")
+        self.bottomup_btn.config(state="normal")
+        self.hybrid_btn.config(state="normal")
+        self.radix_btn.config(state="normal")
+        self.repeat_menu.config(state="readonly")
+        self.warmup_menu.config(state="readonly")
+        self.gc_check.config(state="normal")
+    
+    def execute_sort(self, sort_type, data, timing):
+        """Worker thread: time the sort on fresh copies and post the result (never touches Tk)"""
+        sort = {"bubble": bubble_sort, "insertion": insertion_sort,
+                "merge": merge_sort, "bottomup": bottom_up_merge_sort,
+                "hybrid": hybrid_sort, "radix": radix_sort}[sort_type]
+        
+        results = []
+        stats = measure(sort, timing["repeat"], timing["warmup"], timing["disable_gc"],
+                        setup=lambda: (data.copy(),),
+                        on_result=lambda run, value: results.append(value[0]))
+        
+        # The hybrid sort is compared against the built-in sorted() (Timsort in C)
+        baseline = None
+        if sort_type == "hybrid":
+            baseline = measure(lambda arr: sorted(arr, reverse=True), timing["repeat"], timing["warmup"],
+                               timing["disable_gc"], setup=lambda: (data.copy(),))
+        
+        self.worker.post("result", results[0], stats, baseline)
+    
+    # ===== WORKER MESSAGES (HANDLED ON THE TK MAIN THREAD) =====
+    
+    def on_result(self, sorted_arr, stats, baseline):
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, f"{self.current_title} - COMPLETED\n")
+        self.result_text.insert(tk.END, "█" * 142 + "\n\n")
+        self.result_text.insert(tk.END, f"⏱️  Time: {stats.summary()}\n")
+        if stats.repeat > 1:
+            low, high = stats.ci95_s
+            self.result_text.insert(tk.END, f"   Mean {stats.mean_s:.6f}s | Median {stats.median_s:.6f}s | "
+                                            f"Std Dev {stats.stdev_s:.6f}s | 95% CI {low:.6f}–{high:.6f}s\n")
+        gc_note = ", GC paused" if stats.gc_disabled else ""
+        self.result_text.insert(tk.END, f"   {stats.warmup} warmup + {stats.repeat} timed runs{gc_note}\n")
+        if baseline is not None:
+            ratio = stats.mean_s / baseline.mean_s if baseline.mean_s > 0 else float('inf')
+            self.result_text.insert(tk.END, f"   Built-in sorted(): {baseline.summary()} "
+                                            f"(hybrid is {ratio:.1f}× slower)\n")
+        self.result_text.insert(tk.END, f"📊 {len(sorted_arr):,} sorted values are listed below\n")
+        self.result_text.config(state="disabled")
+        self.result_table.set_rows(len(sorted_arr), lambda i: (i + 1, sorted_arr[i]))
+    
+    def on_error(self, e):
+        self.result_text.config(state="normal")
+        self.result_text.insert(tk.END, f"❌ ERROR: {str(e)}\n")
+        self.result_text.config(state="disabled")
+    
+    def on_done(self):
+        self.enable_buttons()
@@ -0,0 +1,16 @@
+"""
+Shared tooling for the DAA sorting labs.
+
+The labs themselves stay self-contained folders (Prelim-Lab-Work1,
+Prelim-Lab-Work2, Prelim-Lab-Exam). This package loads their sorting code
+headlessly and drives it from the command line:
+
+    python -m sortlab bench --lab exam --algorithm merge bottomup -n 10000
+
+Widgets shared by the lab GUIs live in sortlab.tkviews; nothing else in the
+package imports tkinter.
+"""
+
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,5 @@
+import sys
+
+from sortlab.cli import main
+
+sys.exit(main())
@@ -0,0 +1,578 @@
+"""
+Command-line entry point: python -m sortlab <command> ...
+
+    bench         time lab sorting algorithms and print JSON or CSV results
+    scale         fit n / n log n / n² models over growing N and extrapolate
+    loadbench     time the dataset.txt loaders on generated 10k / 100k / 10M-line files
+    extsort       sort an Exam-format CSV larger than memory with an external merge sort
+    export        sort the Exam dataset and write it as CSV, JSON Lines or columnar, optionally gzipped
+    import-time   check that the lab core modules import quickly and without tkinter
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from sortlab.importcheck import DEFAULT_BUDGET_MS, check_imports
+from sortlab.intload import LOADERS, bench_loaders, write_int_file
+from sortlab.labs import LABS, Lab, import_lab_module
+from sortlab.progress import ProgressMeter, format_eta
+from sortlab.scaling import fit_scaling, geometric_sizes, run_scaling
+from sortlab.timing import TimingStats, gc_paused, measure
+
+RESULT_FIELDS = [
+    'lab', 'algorithm', 'column', 'collation', 'order', 'n', 'top_k', 'repeat', 'warmup', 'gc_disabled',
+    'min_s', 'median_s', 'mean_s', 'stdev_s', 'ci95_low_s', 'ci95_high_s', 'p95_s', 'comparisons', 'swaps', 'moves', 'key_calls',
+    'allocations', 'verified', 'timed_out',
+]
+OP_FIELDS = ('comparisons', 'swaps', 'moves', 'key_calls', 'allocations')
+# Mirrors records.COLLATIONS in the Exam folder, which is only imported on demand
+COLLATIONS = ('binary', 'casefold', 'accents', 'natural')
+# bench's default input size: small enough for the O(n²) sorts to finish
+# in seconds on every lab (bubble sort of 100,000 Exam rows takes hours)
+DEFAULT_BENCH_ROWS = 1000
+
+
+def row_count(value: str) -> Optional[int]:
+    """argparse type for --rows: a positive int, or 'all' for the whole dataset (None)"""
+    if value == 'all':
+        return None
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive row count or 'all', got {value!r}")
+    return n
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _is_sorted(keys: List[Any], reverse: bool) -> bool:
+    if reverse:
+        return all(a >= b for a, b in zip(keys, keys[1:]))
+    return all(a <= b for a, b in zip(keys, keys[1:]))
+
+
+def count_operations(lab: Lab, algorithm: str, func, data, reverse: bool) -> Dict[str, Optional[int]]:
+    """
+    Operation counts for one extra run
+
+    Algorithms with an instrumented mode report every OP_FIELDS count;
+    the rest only get comparisons, counted through CountingKey wrappers.
+    The lab's integer_key_algorithms compare raw integers and get none.
+    """
+    ops = lab.count_ops(algorithm, func, data, reverse)
+    if ops is not None:
+        return ops
+    if algorithm in lab.integer_key_algorithms:
+        return {'comparisons': None}
+    return {'comparisons': count_comparisons(lab, func, data, reverse)}
+
+
+def count_comparisons(lab: Lab, func, data, reverse: bool) -> int:
+    """Comparisons made by one run over CountingKey-wrapped values"""
+    counter = [0]
+    wrapped = lab.count_wrap(data, counter)
+    lab.execute(func, wrapped, lab.prepare(wrapped), reverse)
+    return counter[0]
+
+
+def _progress_printer(label: str):
+    """on_update callback that redraws one status line on stderr"""
+    def show(fraction: float, elapsed: float, eta: Optional[float]) -> None:
+        sys.stderr.write(f"\r{label}: {fraction:6.1%}  {elapsed:7.1f}s elapsed  ETA {format_eta(eta):<8}")
+        sys.stderr.flush()
+    return show
+
+
+def bench_one(lab: Lab, algorithm: str, func, data, column: Optional[str],
+              order: str, repeat: int, count: bool, progress: bool = False,
+              timeout: Optional[float] = None, warmup: int = 0,
+              disable_gc: bool = False) -> Dict[str, Any]:
+    """
+    Time `repeat` runs of one algorithm on one input
+
+    Runs are timed with perf_counter_ns after `warmup` untimed runs, with
+    the garbage collector paused when disable_gc is set; the statistics
+    come from sortlab.timing.TimingStats.
+
+    For algorithms with a progress hook, `progress` prints a live status
+    line to stderr and `timeout` (seconds per run) aborts a run; the row is
+    then marked timed_out and its statistics cover the completed runs only.
+    """
+    reverse = order == 'desc'
+    hooked = algorithm in lab.progress_algorithms and (progress or timeout is not None)
+    samples_ns = []
+    verified = None
+    timed_out = False
+
+    for _ in range(warmup):
+        lab.execute(func, data, lab.prepare(data), reverse)
+
+    with gc_paused(disable_gc):
+        for run in range(repeat):
+            meter = None
+            if hooked:
+                label = f"{lab.name} {algorithm} n={len(data)} run {run + 1}/{repeat}"
+                meter = ProgressMeter(_progress_printer(label) if progress else None, timeout=timeout)
+            arr = lab.prepare(data)
+            start = time.perf_counter_ns()
+            try:
+                result = lab.execute(func, data, arr, reverse, progress=meter)
+            except Exception:
+                if meter is None or not meter.timed_out:
+                    raise
+                timed_out = True
+            finally:
+                if meter is not None and progress:
+                    sys.stderr.write('  timed out\n' if timed_out else '\n')
+            if timed_out:
+                break
+            samples_ns.append(time.perf_counter_ns() - start)
+            if verified is None:
+                verified = _is_sorted(lab.sort_keys(data, result), reverse)
+
+    ops: Dict[str, Optional[int]] = {}
+    if count and not timed_out:
+        ops = count_operations(lab, algorithm, func, data, reverse)
+
+    row = {
+        'lab': lab.name,
+        'algorithm': algorithm,
+        'column': column,
+        'order': order,
+        'n': len(data),
+        'repeat': repeat,
+        'warmup': warmup,
+        'gc_disabled': disable_gc,
+        'verified': verified,
+        'timed_out': timed_out,
+    }
+    if samples_ns:
+        stats = TimingStats(samples_ns, warmup, disable_gc)
+        row.update({
+            'min_s': stats.min_s,
+            'median_s': stats.median_s,
+            'mean_s': stats.mean_s,
+            'stdev_s': stats.stdev_s,
+            'ci95_low_s': stats.ci95_s[0],
+            'ci95_high_s': stats.ci95_s[1],
+            'p95_s': percentile([ns / 1e9 for ns in samples_ns], 95),
+        })
+    row.update(ops)
+    # Missing statistics / counts become None, in RESULT_FIELDS order
+    return {field: row.get(field) for field in RESULT_FIELDS}
+
+
+def write_results(results: List[Dict[str, Any]], fmt: str, out) -> None:
+    if fmt == 'json':
+        json.dump(results, out, indent=2)
+        out.write('\n')
+    else:
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    lab_names = list(LABS) if args.lab == 'all' else [args.lab]
+    results = []
+
+    for lab_name in lab_names:
+        lab = LABS[lab_name]
+        order = args.order or lab.default_order
+        if order not in lab.orders:
+            print(f"{lab.name}: only supports order {'/'.join(lab.orders)}", file=sys.stderr)
+            return 2
+
+        algorithms = lab.algorithms()
+        top_k = lab.top_k_algorithms(args.top_k) if args.top_k else {}
+        if args.top_k and not top_k:
+            if args.lab != 'all':
+                print(f"{lab.name}: --top-k is only supported by the Exam lab", file=sys.stderr)
+                return 2
+            continue
+        algorithms.update(top_k)
+        wanted = args.algorithm or list(algorithms)
+        unknown = [name for name in wanted if name not in algorithms]
+        if unknown and args.lab != 'all':
+            print(f"{lab.name}: unknown algorithm(s) {', '.join(unknown)}; "
+                  f"choose from {', '.join(algorithms)}", file=sys.stderr)
+            return 2
+
+        try:
+            column = lab.column_spec(args.column, args.order_by)
+        except ValueError as e:
+            print(f"{lab.name}: {e}", file=sys.stderr)
+            return 2
+        for n in args.rows:
+            data = lab.load(n, column, args.collation)
+            for name in wanted:
+                if name in algorithms:
+                    row = bench_one(lab, name, algorithms[name], data, column,
+                                    order, args.repeat, args.count,
+                                    args.progress, args.timeout,
+                                    args.warmup, args.disable_gc)
+                    row['collation'] = args.collation if column else None
+                    row['top_k'] = args.top_k if name in top_k else None
+                    results.append(row)
+
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            write_results(results, args.format, f)
+    else:
+        write_results(results, args.format, sys.stdout)
+    return 0
+
+
+def _print_scaling(lab: Lab, algorithm: str, column: Optional[str], order: str,
+                   fit, predict: List[int]) -> None:
+    title = f"{lab.name} {algorithm}" + (f" ({column}, {order})" if column else f" ({order})")
+    print(title)
+    print(f"  {'n':>10}  {'seconds':>12}")
+    for n, seconds in fit.points:
+        print(f"  {n:>10,}  {seconds:>12.6f}")
+    print(f"  fitted exponent {fit.exponent:.2f}  (t ≈ {fit.constant:.3e} · n^{fit.exponent:.2f})")
+    for name, model in fit.models.items():
+        mark = '  <- best' if model is fit.best else ''
+        print(f"  {name:<8} c = {model.constant:.3e}  rms log error {model.rms_log_error:.3f}{mark}")
+    for n in predict:
+        print(f"  predicted at n={n:,}: {fit.predict(n):.3f} s ({fit.best.name}), "
+              f"{fit.predict_power(n):.3f} s (power law)")
+    print()
+
+
+def cmd_scale(args: argparse.Namespace) -> int:
+    lab_names = list(LABS) if args.lab == 'all' else [args.lab]
+    reports = []
+
+    for lab_name in lab_names:
+        lab = LABS[lab_name]
+        order = args.order or lab.default_order
+        if order not in lab.orders:
+            print(f"{lab.name}: only supports order {'/'.join(lab.orders)}", file=sys.stderr)
+            return 2
+        reverse = order == 'desc'
+        try:
+            column = lab.column_spec(args.column, args.order_by)
+        except ValueError as e:
+            print(f"{lab.name}: {e}", file=sys.stderr)
+            return 2
+
+        algorithms = lab.algorithms()
+        wanted = [name for name in (args.algorithm or list(algorithms)) if name in algorithms]
+        full = lab.load(None, column, args.collation)
+        stop = min(args.stop or len(full), len(full))
+        predict = args.predict or [len(full)]
+
+        for name in wanted:
+            func = algorithms[name]
+
+            def time_at(n: int) -> float:
+                data = full[:n]
+                stats = measure(lambda arr: lab.execute(func, data, arr, reverse),
+                                args.repeat, args.warmup, setup=lambda: (lab.prepare(data),))
+                return stats.median_s
+
+            def show_point(n: int, seconds: float) -> None:
+                if args.verbose:
+                    print(f"{lab.name} {name} n={n:,}: {seconds:.6f} s", file=sys.stderr)
+
+            points = run_scaling(time_at, geometric_sizes(args.start, stop, args.factor),
+                                 args.max_point_seconds, show_point)
+            if len(points) < 2:
+                print(f"{lab.name} {name}: fewer than two sizes fit in --max-point-seconds",
+                      file=sys.stderr)
+                continue
+            fit = fit_scaling(points)
+            if args.format == 'text':
+                _print_scaling(lab, name, column, order, fit, predict)
+            report = {'lab': lab.name, 'algorithm': name, 'column': column,
+                      'collation': args.collation if column else None, 'order': order}
+            report.update(fit.as_dict())
+            report['predictions'] = [{'n': n, 'best_model_s': fit.predict(n), 'power_law_s': fit.predict_power(n)}
+                                     for n in predict]
+            reports.append(report)
+
+    if args.format == 'json':
+        json.dump(reports, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+
+def cmd_loadbench(args: argparse.Namespace) -> int:
+    reports = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.dir or tmp
+        for n in args.lines:
+            path = os.path.join(directory, f"ints_{n}.txt")
+            if not os.path.exists(path):
+                if args.verbose:
+                    print(f"writing {n:,} lines to {path}", file=sys.stderr)
+                write_int_file(path, n)
+            rows = bench_loaders(path, args.loader, args.repeat)
+            baseline = rows[0]['seconds']
+            for row in rows:
+                row['lines'] = n
+                row['speedup'] = baseline / row['seconds'] if row['seconds'] > 0 else float('inf')
+            reports.extend(rows)
+
+            if args.format == 'text':
+                print(f"{n:,} lines ({rows[0]['bytes'] / 1e6:.1f} MB)")
+                for row in rows:
+                    print(f"  {row['loader']:<6} {row['seconds'] * 1000:10.2f} ms  "
+                          f"{row['rows_per_s'] / 1e6:7.2f} M rows/s  {row['mb_per_s']:7.1f} MB/s  "
+                          f"{row['speedup']:5.1f}×")
+                print()
+
+    if args.format == 'json':
+        json.dump(reports, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+
+def cmd_extsort(args: argparse.Namespace) -> int:
+    lab = LABS['exam']
+    extsort = import_lab_module(lab.folder, 'extsort')
+    sort_func = None
+    if args.algorithm != 'builtin':
+        sort_func = lab.algorithms()[args.algorithm]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        in_path = args.input or lab.dataset_path
+        if args.generate:
+            in_path = os.path.join(args.tmp_dir or tmp, f"generated_{args.generate}.csv")
+            if args.verbose:
+                print(f"writing {args.generate:,} rows to {in_path}", file=sys.stderr)
+            extsort.write_sample_csv(in_path, args.generate, args.input or lab.dataset_path)
+        out_path = args.output or os.path.join(tmp, 'sorted.csv')
+
+        try:
+            column = lab.column_spec(args.column, args.order_by)
+            stats = extsort.external_sort(in_path, out_path, column, args.order == 'desc', args.collation,
+                                          int(args.memory_mb * (1 << 20)), args.fan_in, args.tmp_dir or tmp,
+                                          sort_func)
+        except (OSError, ValueError) as e:
+            print(f"extsort: {e}", file=sys.stderr)
+            return 2
+
+    report = {'input': in_path, 'output': args.output, 'column': column, 'order': args.order,
+              'collation': args.collation, 'algorithm': args.algorithm, 'memory_mb': args.memory_mb,
+              'fan_in': args.fan_in}
+    report.update(stats.as_dict())
+    if args.format == 'json':
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print(f"{column} {args.order}, memory ceiling {args.memory_mb:g} MB, run sort {args.algorithm}")
+        print(f"  {stats.summary()}")
+        print(f"  largest run {stats.largest_run_bytes / (1 << 20):.1f} MB (estimated), "
+              f"output {stats.output_bytes / 1e6:.1f} MB" + (f" -> {args.output}" if args.output else ""))
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    lab = LABS['exam']
+    records = import_lab_module(lab.folder, 'records')
+    export = import_lab_module(lab.folder, 'export')
+    top_k_methods = {'heap': 'topk-heap', 'quickselect': 'topk-select'}
+    if (args.algorithm in top_k_methods) != bool(args.top_k):
+        print("export: --top-k needs --algorithm heap or quickselect, and those need --top-k", file=sys.stderr)
+        return 2
+    if args.top_k:
+        sort_func = lab.top_k_algorithms(args.top_k)[top_k_methods[args.algorithm]]
+    else:
+        sort_func = lab.algorithms()[args.algorithm]
+
+    try:
+        column = lab.column_spec(args.column, args.order_by)
+        fmt, compress = args.format, args.gzip or None
+        if fmt is None or compress is None:
+            implied_fmt, implied_compress = export.export_format(args.output)
+            fmt = fmt or implied_fmt
+            compress = implied_compress if compress is None else compress
+    except ValueError as e:
+        print(f"export: {e}", file=sys.stderr)
+        return 2
+
+    manager = records.CSVDataManager(lab.dataset_path, lazy=True)
+    n = args.rows
+    if n is None:
+        manager.load_data()
+        n = manager.get_total_count()
+    keys = manager.get_sort_keys(column, n, args.collation)
+    start = time.perf_counter()
+    order = lab.execute(sort_func, keys, lab.prepare(keys), args.order == 'desc')
+    sort_s = time.perf_counter() - start
+
+    try:
+        stats = export.export_sorted(manager.store, order, args.output, fmt, compress)
+    except (OSError, ValueError) as e:
+        print(f"export: {e}", file=sys.stderr)
+        return 2
+
+    report = {'column': column, 'order': args.order, 'collation': args.collation,
+              'algorithm': args.algorithm, 'n': len(keys), 'top_k': args.top_k, 'sort_s': sort_s}
+    report.update(stats.as_dict())
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print(f"{column} {args.order}, {len(keys):,} rows sorted with {args.algorithm} in {sort_s:.3f} s")
+        print(f"  {stats.summary()} -> {args.output}")
+    return 0
+
+
+def cmd_import_time(args: argparse.Namespace) -> int:
+    results = check_imports(args.runs, args.budget_ms)
+    for row in results:
+        status = 'ok' if row['ok'] else 'FAIL'
+        tk_note = ' (imports tkinter!)' if row['tkinter'] else ''
+        print(f"{status:<4} {row['lab']:<6} {row['module']:<11} {row['best_ms']:8.2f} ms{tk_note}")
+    return 0 if all(row['ok'] for row in results) else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m sortlab',
+                                     description='Headless tools for the DAA sorting labs')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    bench = commands.add_parser('bench', help='time sorting algorithms without the GUI')
+    bench.add_argument('--lab', choices=['all'] + list(LABS), default='all')
+    bench.add_argument('--algorithm', '-a', nargs='+',
+                       help='algorithm name(s); default: every algorithm of the lab')
+    bench.add_argument('--column', '-c', default='ID', choices=['ID', 'FirstName', 'LastName'],
+                       help='Exam column to sort by (ignored by Work1/Work2)')
+    bench.add_argument('--order-by', metavar='SPEC',
+                       help='Exam composite key such as "LastName, FirstName DESC, ID"; '
+                            'overrides --column, and --order desc reverses the whole key')
+    bench.add_argument('--collation', default='binary', choices=COLLATIONS,
+                       help='Exam name order: binary (default), casefold, accents or natural')
+    bench.add_argument('--rows', '-n', type=row_count, nargs='+', default=[DEFAULT_BENCH_ROWS],
+                       help=f"input size(s), or 'all' for the whole dataset (default: {DEFAULT_BENCH_ROWS})")
+    bench.add_argument('--top-k', type=int, metavar='K',
+                       help='Exam only: add topk-heap and topk-select, which return just the '
+                            'first K records of the sorted order')
+    bench.add_argument('--order', choices=['asc', 'desc'],
+                       help="default: the lab's own order (Work1/Work2 desc, Exam asc)")
+    bench.add_argument('--repeat', '-r', type=int, default=3, help='timed runs per row')
+    bench.add_argument('--warmup', '-w', type=int, default=0, help='untimed runs before timing')
+    bench.add_argument('--disable-gc', action='store_true',
+                       help='pause the garbage collector during the timed runs')
+    bench.add_argument('--count', action='store_true',
+                       help='add an extra instrumented run that counts comparisons, swaps, '
+                            'moves, key calls and allocations')
+    bench.add_argument('--progress', action='store_true',
+                       help='show completion %% and ETA on stderr (Exam sorts except parallel)')
+    bench.add_argument('--timeout', type=float, metavar='SECONDS',
+                       help='abort a run after this long (same algorithms as --progress)')
+    bench.add_argument('--format', '-f', choices=['json', 'csv'], default='json')
+    bench.add_argument('--output', '-o', help='write results to a file instead of stdout')
+    bench.set_defaults(handler=cmd_bench)
+
+    scale = commands.add_parser('scale', help='fit complexity models over growing N and extrapolate')
+    scale.add_argument('--lab', choices=['all'] + list(LABS), default='exam')
+    scale.add_argument('--algorithm', '-a', nargs='+',
+                       help='algorithm name(s); default: every algorithm of the lab')
+    scale.add_argument('--column', '-c', default='ID', choices=['ID', 'FirstName', 'LastName'],
+                       help='Exam column to sort by (ignored by Work1/Work2)')
+    scale.add_argument('--order-by', metavar='SPEC',
+                       help='Exam composite key such as "LastName, FirstName DESC, ID"; '
+                            'overrides --column')
+    scale.add_argument('--collation', default='binary', choices=COLLATIONS,
+                       help='Exam name order: binary (default), casefold, accents or natural')
+    scale.add_argument('--order', choices=['asc', 'desc'],
+                       help="default: the lab's own order (Work1/Work2 desc, Exam asc)")
+    scale.add_argument('--start', type=int, default=250, help='smallest N (default: 250)')
+    scale.add_argument('--stop', type=int, help='largest N (default: the whole dataset)')
+    scale.add_argument('--factor', type=float, default=2.0, help='growth factor between sizes')
+    scale.add_argument('--max-point-seconds', type=float, default=2.0,
+                       help='skip sizes predicted to take longer than this per run (default: 2)')
+    scale.add_argument('--predict', type=int, nargs='+',
+                       help='sizes to extrapolate to (default: the whole dataset)')
+    scale.add_argument('--repeat', '-r', type=int, default=3, help='timed runs per size (median is used)')
+    scale.add_argument('--warmup', '-w', type=int, default=1)
+    scale.add_argument('--format', '-f', choices=['text', 'json'], default='text')
+    scale.add_argument('--verbose', '-v', action='store_true', help='print each point on stderr')
+    scale.set_defaults(handler=cmd_scale)
+
+    loadbench = commands.add_parser('loadbench', help='time the bulk dataset.txt loaders')
+    loadbench.add_argument('--lines', '-n', type=int, nargs='+', default=[10000, 100000, 10000000],
+                           help='file sizes in lines (default: 10,000 100,000 10,000,000)')
+    loadbench.add_argument('--loader', '-l', nargs='+', choices=list(LOADERS),
+                           help="loaders to time; the first is the speedup baseline "
+                                "(default: all, starting with the line-by-line 'lines')")
+    loadbench.add_argument('--repeat', '-r', type=int, default=3, help='runs per loader (best is kept)')
+    loadbench.add_argument('--dir', help='keep the generated files here and reuse them next time '
+                                         '(default: a temporary directory)')
+    loadbench.add_argument('--format', '-f', choices=['text', 'json'], default='text')
+    loadbench.add_argument('--verbose', '-v', action='store_true', help='report file generation on stderr')
+    loadbench.set_defaults(handler=cmd_loadbench)
+
+    extsort = commands.add_parser('extsort', help='external merge sort of an Exam-format CSV')
+    extsort.add_argument('input', nargs='?', help='CSV with ID, FirstName and LastName columns '
+                                                  '(default: the Exam generated_data.csv)')
+    extsort.add_argument('--output', '-o', help='sorted CSV to write (default: a temporary file, '
+                                                'for timing only)')
+    extsort.add_argument('--column', '-c', default='ID', choices=['ID', 'FirstName', 'LastName'])
+    extsort.add_argument('--order-by', metavar='SPEC',
+                         help='composite key such as "LastName, FirstName DESC, ID"; overrides --column')
+    extsort.add_argument('--order', choices=['asc', 'desc'], default='asc')
+    extsort.add_argument('--collation', default='binary', choices=COLLATIONS)
+    extsort.add_argument('--memory-mb', type=float, default=64,
+                         help='estimated memory ceiling for one in-memory run (default: 64)')
+    extsort.add_argument('--fan-in', type=int, default=64,
+                         help='runs merged at once; more runs take several passes (default: 64)')
+    extsort.add_argument('--algorithm', '-a', default='builtin',
+                         choices=['builtin', 'merge', 'bottomup', 'hybrid', 'radix'],
+                         help='sort used for each run (default: list.sort)')
+    extsort.add_argument('--tmp-dir', help='where runs are spilled (default: the system temp directory)')
+    extsort.add_argument('--generate', type=int, metavar='ROWS',
+                         help='sort a generated file of ROWS rows with names drawn from the input')
+    extsort.add_argument('--format', '-f', choices=['text', 'json'], default='text')
+    extsort.add_argument('--verbose', '-v', action='store_true', help='report file generation on stderr')
+    extsort.set_defaults(handler=cmd_extsort)
+
+    export = commands.add_parser('export', help='sort the Exam dataset and write the sorted records to a file')
+    export.add_argument('--output', '-o', required=True,
+                        help='file to write; .csv, .jsonl or .srtc (columnar), optionally + .gz')
+    export.add_argument('--format', '-f', choices=['csv', 'jsonl', 'columnar'],
+                        help='output format (default: from the file extension)')
+    export.add_argument('--gzip', action='store_true', help='gzip the output (default: when it ends in .gz)')
+    export.add_argument('--column', '-c', default='ID', choices=['ID', 'FirstName', 'LastName'])
+    export.add_argument('--order-by', metavar='SPEC',
+                        help='composite key such as "LastName, FirstName DESC, ID"; overrides --column')
+    export.add_argument('--order', choices=['asc', 'desc'], default='asc')
+    export.add_argument('--collation', default='binary', choices=COLLATIONS)
+    export.add_argument('--rows', '-n', type=int, help='sort and write the first N rows (default: all)')
+    export.add_argument('--algorithm', '-a', default='radix',
+                        choices=['builtin', 'merge', 'bottomup', 'hybrid', 'radix', 'numpy', 'heap', 'quickselect'],
+                        help='sort to use (default: radix); heap or quickselect with --top-k')
+    export.add_argument('--top-k', type=int, metavar='K', help='write only the first K sorted records')
+    export.add_argument('--json', action='store_true', help='print the report as JSON')
+    export.set_defaults(handler=cmd_export)
+
+    import_time = commands.add_parser('import-time',
+                                      help='fail if a lab core module is slow to import or loads tkinter')
+    import_time.add_argument('--runs', type=int, default=5, help='fresh interpreters per module')
+    import_time.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                             help='maximum best-of-runs import time per module')
+    import_time.set_defaults(handler=cmd_import_time)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,29 @@
+"""
+Operation counter shared by the labs' instrumented sorts.
+
+Passing counter=OpCounter() to a lab sort that supports it runs an
+instrumented copy of the algorithm, which adds to these fields:
+
+    comparisons   key comparisons
+    swaps         exchanges of two elements
+    moves         single element writes (shifts, merge copies)
+    key_calls     key_func calls (Exam sorts)
+    allocations   auxiliary lists created
+"""
+
+from typing import Dict
+
+
+class OpCounter:
+    """Operation counts filled in by the counter=... variants of the sorts"""
+    __slots__ = ('comparisons', 'swaps', 'moves', 'key_calls', 'allocations')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return 'OpCounter(' + ', '.join(f'{k}={v}' for k, v in self.as_dict().items()) + ')'
@@ -0,0 +1,67 @@
+"""
+Import-time budget for the lab core modules.
+
+Each module is imported in a fresh interpreter started in its lab folder,
+so no module is already loaded. The lab folders and the sortlab package
+are byte-compiled first (also under PYTHONDONTWRITEBYTECODE=1), so the
+samples time loading the modules and not compiling their source. The check
+fails if a module pulls in tkinter, or if its best import time over several
+runs is above the budget.
+"""
+
+import compileall
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+from sortlab import REPO_ROOT
+from sortlab.labs import LABS, _lab_path
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "tkinter": "tkinter" in sys.modules}}))
+'''
+
+# Warm core modules load in about 4-11 ms here; 20 ms still flags a few-fold regression
+DEFAULT_BUDGET_MS = 20.0
+
+
+def warm_bytecode() -> None:
+    """Write the .pyc files of every lab folder and of sortlab"""
+    folders = [_lab_path(lab.folder) for lab in LABS.values()]
+    folders.append(os.path.join(REPO_ROOT, 'sortlab'))
+    for folder in folders:
+        compileall.compile_dir(folder, maxlevels=0, quiet=1)
+
+
+def time_import(folder: str, module: str) -> Dict[str, Any]:
+    """Import one module in a fresh interpreter and report time and tkinter use"""
+    output = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(module=module)],
+        cwd=_lab_path(folder), capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def check_imports(runs: int = 5, budget_ms: float = DEFAULT_BUDGET_MS) -> List[Dict[str, Any]]:
+    """Best-of-`runs` import time for every lab core module"""
+    warm_bytecode()
+    results = []
+    for lab in LABS.values():
+        for module in lab.core_modules:
+            samples = [time_import(lab.folder, module) for _ in range(runs)]
+            best_ms = min(sample['seconds'] for sample in samples) * 1000
+            uses_tk = any(sample['tkinter'] for sample in samples)
+            results.append({
+                'lab': lab.name,
+                'module': module,
+                'best_ms': round(best_ms, 3),
+                'tkinter': uses_tk,
+                'ok': best_ms <= budget_ms and not uses_tk,
+            })
+    return results
@@ -0,0 +1,185 @@
+"""
+Bulk loading of one-integer-per-line files such as the labs' dataset.txt.
+
+The file is read as one bytes buffer and converted in bulk instead of
+line by line:
+
+    values = load_ints(path)          # list of ints: one split, one map(int)
+    values = load_int_array(path)     # array('q'), 8 bytes per value
+    values = load_int_ndarray(path)   # NumPy int64 array, parsed in C
+
+save_ints(path, values) writes values back in the same format, in large
+blocks (gzip-compressed when the path ends in ".gz").
+
+Any whitespace separates values, so blank lines and CRLF endings are
+fine. A token that is not an integer raises ValueError, and so does a
+value outside the int64 range in load_int_array() and load_int_ndarray()
+(instead of OverflowError or a silently saturated value). NumPy is only
+imported by load_int_ndarray(), and numpy_available() checks for it
+without importing it.
+"""
+
+import os
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def read_buffer(path: str) -> bytes:
+    """The whole file in one read"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def parse_ints(data: bytes, source: str = '<buffer>') -> List[int]:
+    """Split a buffer on whitespace and convert every token with int()"""
+    try:
+        return list(map(int, data.split()))
+    except ValueError as e:
+        raise ValueError(f"{source}: not one integer per line ({e})") from None
+
+
+def load_ints(path: str) -> List[int]:
+    """Every integer in a file, as a list"""
+    return parse_ints(read_buffer(path), path)
+
+
+def load_int_array(path: str) -> array:
+    """Every integer in a file, as a compact array('q')"""
+    try:
+        return array('q', load_ints(path))
+    except OverflowError:
+        raise ValueError(f"{path}: a value is outside the int64 range "
+                         f"[{INT64_MIN}, {INT64_MAX}]") from None
+
+
+def numpy_available() -> bool:
+    """Whether NumPy is installed, checked without importing it"""
+    import importlib.util
+
+    return importlib.util.find_spec('numpy') is not None
+
+
+def load_int_ndarray(path: str):
+    """
+    Every integer in a file, as a NumPy int64 array
+
+    NumPy parses the whole buffer in one call. Older NumPy versions only
+    warn (and stop early) at unparsable text; that warning is turned into
+    the same ValueError the other loaders raise. NumPy saturates values
+    outside the int64 range, so any result at INT64_MIN or INT64_MAX is
+    checked against its token in the text.
+    """
+    import warnings
+    import numpy as np
+
+    text = read_buffer(path).decode('ascii', errors='replace')
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=np.int64, sep=' ')
+        except (DeprecationWarning, ValueError) as e:
+            raise ValueError(f"{path}: not one integer per line ({e})") from None
+
+    extremes = np.flatnonzero((values == INT64_MIN) | (values == INT64_MAX))
+    if len(extremes):
+        tokens = text.split()
+        for i in extremes.tolist():
+            if int(tokens[i]) != int(values[i]):
+                raise ValueError(f"{path}: value {tokens[i]} is outside the int64 range "
+                                 f"[{INT64_MIN}, {INT64_MAX}]")
+    return values
+
+
+def load_lines(path: str) -> List[int]:
+    """The labs' original line-by-line parse, kept as the benchmark baseline"""
+    with open(path, 'r') as f:
+        return [int(line.strip()) for line in f if line.strip()]
+
+
+LOADERS: Dict[str, Callable[[str], Any]] = {
+    'lines': load_lines,
+    'split': load_ints,
+    'array': load_int_array,
+    'numpy': load_int_ndarray,
+}
+
+
+def save_ints(path: str, values, block: int = 100000) -> int:
+    """
+    Write integers one per line and return the file size
+
+    Each block of values is converted and written with one join and one
+    write call; a list, array('q') or NumPy array is accepted. A path
+    ending in ".gz" is gzip-compressed (level 1).
+    """
+    if type(values).__module__ == 'numpy':
+        values = values.tolist()
+    if path.endswith('.gz'):
+        import gzip
+
+        f = gzip.open(path, 'wt', compresslevel=1, encoding='ascii', newline='')
+    else:
+        f = open(path, 'w', encoding='ascii', newline='', buffering=1 << 20)
+    with f:
+        for start in range(0, len(values), block):
+            f.write('\n'.join(map(str, values[start:start + block])))
+            f.write('\n')
+    return os.path.getsize(path)
+
+
+def write_int_file(path: str, n: int, low: int = 0, high: int = 10 ** 6, seed: int = 0) -> None:
+    """Write n random integers, one per line (benchmark input)"""
+    import random
+
+    rng = random.Random(seed)
+    block = 100000
+    with open(path, 'w') as f:
+        for start in range(0, n, block):
+            count = min(block, n - start)
+            f.write('\n'.join(str(rng.randint(low, high)) for _ in range(count)))
+            f.write('\n')
+
+
+def bench_loaders(path: str, loaders: Optional[Sequence[str]] = None,
+                  repeat: int = 3) -> List[Dict[str, Any]]:
+    """
+    Best-of-`repeat` load time of each loader on one file
+
+    Loaders that cannot run here (NumPy not installed) are skipped. Every
+    loader must agree with the first one on the count, the first 1,000
+    values and the last value.
+    """
+    names = [name for name in (loaders or LOADERS)
+             if name != 'numpy' or numpy_available()]
+    size = os.path.getsize(path)
+    expected = None
+    results = []
+    for name in names:
+        loader = LOADERS[name]
+        best = float('inf')
+        for _ in range(max(1, repeat)):
+            values = None
+            start = time.perf_counter()
+            values = loader(path)
+            best = min(best, time.perf_counter() - start)
+        count = len(values)
+        # Compare a cheap fingerprint: a full copy of 10M Python ints costs ~400 MB
+        check = (count, [int(v) for v in values[:1000]], int(values[-1]) if count else None)
+        if expected is None:
+            expected = check
+        elif check != expected:
+            raise RuntimeError(f"loader {name} disagrees with {names[0]} on {path}")
+        results.append({
+            'loader': name,
+            'rows': count,
+            'bytes': size,
+            'seconds': best,
+            'rows_per_s': count / best if best > 0 else float('inf'),
+            'mb_per_s': size / best / 1e6 if best > 0 else float('inf'),
+        })
+        del values
+    return results
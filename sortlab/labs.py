@@ -0,0 +1,311 @@
+"""
+Headless access to the three lab projects.
+
+Each lab lives in a hyphenated folder, so it cannot be imported as a
+package. This module puts the lab folder on sys.path and imports only its
+algorithm and data modules -- never the GUI -- then wraps each lab behind
+the same small interface:
+
+    data = lab.load(n, column)          # list of ints, or an Exam key column
+    arr = lab.prepare(data)             # fresh input for one run
+    result = lab.execute(func, data, arr, reverse)
+
+Algorithms listed in lab.progress_algorithms also accept a progress hook
+(see sortlab.progress), passed as execute(..., progress=meter), and those in
+lab.counted_algorithms have an instrumented mode used by lab.count_ops().
+Every lab also lists 'builtin', Python's own sorted() behind the same
+contract, as the baseline to compare the lab sorts against. 'numpy' uses
+NumPy when it is installed and the lab's radix sort otherwise.
+lab.top_k_algorithms(k) lists partial sorts that return only the first k
+records of the sorted order, behind the same contract.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sortlab import REPO_ROOT
+from sortlab.counting import OpCounter
+from sortlab.intload import load_ints
+
+
+def _lab_path(folder: str, *parts: str) -> str:
+    return os.path.join(REPO_ROOT, folder, *parts)
+
+
+def import_lab_module(folder: str, module_name: str):
+    """Import a module from a lab folder by its plain name"""
+    path = _lab_path(folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return importlib.import_module(module_name)
+
+
+def load_module_file(module_name: str, path: str):
+    """Import a single file under a unique module name"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def builtin_sort_desc(arr: List) -> Tuple[List, float]:
+    """sorted() baseline with the Work1/Work2 contract: descending ints"""
+    start = time.perf_counter()
+    result = sorted(arr, reverse=True)
+    return result, time.perf_counter() - start
+
+
+def builtin_sort(arr: List, key_func: Callable, reverse: bool = False) -> Tuple[List, float]:
+    """sorted() baseline with the Exam contract"""
+    start = time.perf_counter()
+    result = sorted(arr, key=key_func, reverse=reverse)
+    return result, time.perf_counter() - start
+
+
+def read_int_dataset(path: str) -> List[int]:
+    """Read a dataset.txt file (one integer per line)"""
+    return load_ints(path)
+
+
+class CountingKey:
+    """Wraps a value and counts every comparison made against it"""
+    __slots__ = ('value', 'counter')
+
+    def __init__(self, value: Any, counter: List[int]):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other: 'CountingKey') -> bool:
+        self.counter[0] += 1
+        return self.value < other.value
+
+    def __le__(self, other: 'CountingKey') -> bool:
+        self.counter[0] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: 'CountingKey') -> bool:
+        self.counter[0] += 1
+        return self.value > other.value
+
+    def __ge__(self, other: 'CountingKey') -> bool:
+        self.counter[0] += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: object) -> bool:
+        self.counter[0] += 1
+        return isinstance(other, CountingKey) and self.value == other.value
+
+    __hash__ = None
+
+
+class Lab(ABC):
+    """One lab project as seen by the benchmark runner"""
+
+    name = ''
+    folder = ''
+    dataset = ''
+    orders = ('desc',)
+    columns = (None,)
+    core_modules: Tuple[str, ...] = ('app',)
+    progress_algorithms: Tuple[str, ...] = ()
+    counted_algorithms: Tuple[str, ...] = ()
+    integer_key_algorithms: Tuple[str, ...] = ()
+
+    @property
+    def dataset_path(self) -> str:
+        return _lab_path(self.folder, self.dataset)
+
+    @property
+    def default_order(self) -> str:
+        return self.orders[0]
+
+    @abstractmethod
+    def algorithms(self) -> Dict[str, Callable]:
+        """Algorithm name -> lab sort function"""
+
+    def top_k_algorithms(self, k: int) -> Dict[str, Callable]:
+        """Algorithm name -> sort returning only the first k records (empty if unsupported)"""
+        return {}
+
+    def column_spec(self, column: Optional[str], order_by: Optional[str] = None) -> Optional[str]:
+        """The column (or ORDER BY spec) load() sorts by; None for labs without columns"""
+        return None
+
+    @abstractmethod
+    def load(self, n: Optional[int], column: Optional[str], collation: str = 'binary') -> Any:
+        """Load the first n values (all when n is None) to be sorted"""
+
+    @abstractmethod
+    def prepare(self, data: Any) -> List:
+        """Build a fresh input list for one run (not timed)"""
+
+    @abstractmethod
+    def execute(self, func: Callable, data: Any, arr: List, reverse: bool,
+                progress: Optional[Callable[[float], bool]] = None) -> List:
+        """Run one sort and return the sorted list"""
+
+    def count_ops(self, algorithm: str, func: Callable, data: Any,
+                  reverse: bool) -> Optional[Dict[str, int]]:
+        """Operation counts of one instrumented run, or None if unsupported"""
+        if algorithm not in self.counted_algorithms:
+            return None
+        counter = OpCounter()
+        self.run_counted(func, data, self.prepare(data), reverse, counter)
+        return counter.as_dict()
+
+    @abstractmethod
+    def module(self):
+        """The lab module that defines the algorithms"""
+
+    @abstractmethod
+    def run_counted(self, func: Callable, data: Any, arr: List, reverse: bool, counter: Any) -> None:
+        """Run one sort with its operations recorded in counter"""
+
+    def count_wrap(self, data: Any, counter: List[int]) -> Any:
+        """Same data, but with every value wrapped in a CountingKey"""
+        return [CountingKey(value, counter) for value in data]
+
+    def sort_keys(self, data: Any, result: List) -> List:
+        """The key sequence of a sorted result, for verification"""
+        return list(result)
+
+
+class IntegerLab(Lab):
+    """Work1 / Work2: sort a list of integers in descending order"""
+
+    dataset = 'dataset.txt'
+
+    def load(self, n, column, collation='binary'):
+        values = read_int_dataset(self.dataset_path)
+        return values if n is None else values[:n]
+
+    def prepare(self, data):
+        return data.copy()
+
+    def execute(self, func, data, arr, reverse, progress=None):
+        return func(arr)[0]
+
+    def run_counted(self, func, data, arr, reverse, counter):
+        func(arr, counter=counter)
+
+
+class Work1Lab(IntegerLab):
+    name = 'work1'
+    folder = 'Prelim-Lab-Work1'
+    counted_algorithms = ('bubble',)
+    integer_key_algorithms = ('radix', 'numpy')
+
+    def module(self):
+        # Work1 is a single script without a GUI, so import the file itself
+        return load_module_file('work1_app', _lab_path(self.folder, 'app.py'))
+
+    def algorithms(self):
+        module = self.module()
+        return {'bubble': module.bubble_sort, 'radix': module.radix_sort, 'numpy': module.numpy_sort,
+                'builtin': builtin_sort_desc}
+
+
+class Work2Lab(IntegerLab):
+    name = 'work2'
+    folder = 'Prelim-Lab-Work2'
+    core_modules = ('algorithms', 'app')
+    counted_algorithms = ('bubble', 'insertion', 'merge')
+    integer_key_algorithms = ('radix', 'numpy')
+
+    def module(self):
+        return import_lab_module(self.folder, 'algorithms')
+
+    def algorithms(self):
+        module = self.module()
+        return {
+            'bubble': module.bubble_sort,
+            'insertion': module.insertion_sort,
+            'merge': module.merge_sort,
+            'bottomup': module.bottom_up_merge_sort,
+            'hybrid': module.hybrid_sort,
+            'radix': module.radix_sort,
+            'numpy': module.numpy_sort,
+            'builtin': builtin_sort_desc,
+        }
+
+
+class ExamLab(Lab):
+    """Exam: sort an index permutation over an integer key column"""
+
+    name = 'exam'
+    folder = 'Prelim-Lab-Exam'
+    dataset = 'generated_data.csv'
+    orders = ('asc', 'desc')
+    columns = ('ID', 'FirstName', 'LastName')
+    core_modules = ('records', 'sortedindex', 'sorting', 'resultcache', 'extsort', 'export', 'app')
+    progress_algorithms = ('bubble', 'insertion', 'merge', 'bottomup', 'hybrid', 'radix',
+                           'topk-heap', 'topk-select')
+    counted_algorithms = ('bubble', 'insertion', 'merge')
+    integer_key_algorithms = ('parallel', 'radix', 'numpy')
+
+    def module(self):
+        return import_lab_module(self.folder, 'sorting')
+
+    def algorithms(self):
+        module = self.module()
+        return {
+            'bubble': module.bubble_sort,
+            'insertion': module.insertion_sort,
+            'merge': module.merge_sort,
+            'bottomup': module.bottom_up_merge_sort,
+            'parallel': module.parallel_merge_sort,
+            'hybrid': module.hybrid_sort,
+            'radix': module.radix_sort,
+            'numpy': module.numpy_sort,
+            'builtin': builtin_sort,
+        }
+
+    def top_k_algorithms(self, k):
+        module = self.module()
+
+        def bind(func):
+            return lambda arr, key_func, reverse=False, progress=None: func(arr, key_func, k, reverse, progress)
+
+        return {
+            'topk-heap': bind(module.heap_top_k),
+            'topk-select': bind(module.quickselect_top_k),
+        }
+
+    def column_spec(self, column, order_by=None):
+        if not order_by:
+            return column or 'ID'
+        records = import_lab_module(self.folder, 'records')
+        return records.format_order_by(records.parse_order_by(order_by))
+
+    def load(self, n, column, collation='binary'):
+        records = import_lab_module(self.folder, 'records')
+        manager = records.CSVDataManager(self.dataset_path, lazy=True)
+        if n is None:
+            manager.load_data()
+            n = manager.get_total_count()
+        return manager.get_sort_keys(column or 'ID', n, collation)
+
+    def prepare(self, data):
+        return list(range(len(data)))
+
+    def execute(self, func, data, arr, reverse, progress=None):
+        if progress is not None:
+            return func(arr, data.__getitem__, reverse, progress=progress)[0]
+        return func(arr, data.__getitem__, reverse)[0]
+
+    def run_counted(self, func, data, arr, reverse, counter):
+        func(arr, data.__getitem__, reverse, counter=counter)
+
+    def sort_keys(self, data, result):
+        return [data[i] for i in result]
+
+
+LABS: Dict[str, Lab] = {lab.name: lab for lab in (Work1Lab(), Work2Lab(), ExamLab())}
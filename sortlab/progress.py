@@ -0,0 +1,86 @@
+"""
+Progress callbacks for the Exam sorts.
+
+The sorts call progress(fraction) a bounded number of times and stop with
+SortCancelled when it returns False. ProgressMeter is such a callback: it
+throttles updates, estimates the time left, and turns a cancel request or
+a timeout into a False return. It is thread-safe to cancel() from another
+thread, which is how the GUI's Cancel button stops a worker.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+UPDATE_INTERVAL_S = 0.1
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Human-readable time left, e.g. '42s' or '3m 05s'"""
+    if seconds is None:
+        return '--'
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+class ProgressMeter:
+    """
+    Callable passed as a sort's progress hook
+
+    on_update(fraction, elapsed, eta) is called at most once per `interval`
+    seconds; eta is None until some progress has been made. The meter
+    returns False (cancelling the sort) once cancel() was called or
+    `timeout` seconds have passed since it was created.
+    """
+
+    def __init__(self, on_update: Optional[Callable[[float, float, Optional[float]], None]] = None,
+                 interval: float = UPDATE_INTERVAL_S, timeout: Optional[float] = None):
+        self.on_update = on_update
+        self.interval = interval
+        self.timeout = timeout
+        self.start = time.perf_counter()
+        self.fraction = 0.0
+        self.timed_out = False
+        self._cancel = threading.Event()
+        self._last_update = float('-inf')
+        self._shown_done = False
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def eta(self) -> Optional[float]:
+        """Seconds left, extrapolated linearly from the fraction done so far"""
+        if self.fraction <= 0.0:
+            return None
+        return self.elapsed * (1.0 - self.fraction) / self.fraction
+
+    def __call__(self, fraction: float) -> bool:
+        self.fraction = fraction
+        now = time.perf_counter()
+        if self.timeout is not None and now - self.start > self.timeout:
+            self.timed_out = True
+            self._cancel.set()
+        if self._cancel.is_set():
+            return False
+
+        done = fraction >= 1.0
+        if self.on_update is not None and (now - self._last_update >= self.interval
+                                           or (done and not self._shown_done)):
+            self._last_update = now
+            self._shown_done = done
+            self.on_update(fraction, now - self.start, self.eta())
+        return True
@@ -0,0 +1,91 @@
+"""
+Byte-wise LSD radix sort shared by the labs, and the lazy NumPy loader.
+
+    values = radix_sort_ints(values, reverse=True)    # the sorted ints
+    order = radix_order(keys, reverse=False)           # stable permutation
+
+Values are offset by their minimum (so negatives work) and distributed
+into 256 buckets one byte at a time, least significant byte first, for
+only as many bytes as the value range needs. Descending order
+concatenates the buckets from 255 down; either way equal values keep
+their input order, so no two values are ever compared.
+
+radix_order packs each key with its position, (key - min) << b | i, and
+sorts the packed ints on the key bytes only, so the positions ride along
+in the same single-int inner loop. The labs wrap these in their own sort
+contracts (Work1 / Work2 sort lists of ints in place, the Exam sorts
+records by key_func).
+"""
+
+from typing import Callable, List, Optional, Sequence
+
+RADIX_BITS = 8
+RADIX_MASK = (1 << RADIX_BITS) - 1
+
+
+def load_numpy():
+    """NumPy if it is installed, else None (imported on first use to keep startup fast)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def radix_passes(span: int) -> int:
+    """Byte passes needed for values in range(span + 1)"""
+    return max(1, (span.bit_length() + RADIX_BITS - 1) // RADIX_BITS)
+
+
+def _lsd(values: List[int], first_shift: int, passes: int, reverse: bool,
+         progress: Optional[Callable[[float], None]]) -> List[int]:
+    """Stable bucket passes over non-negative ints, byte by byte from first_shift"""
+    for p in range(passes):
+        shift = first_shift + p * RADIX_BITS
+        buckets = [[] for _ in range(RADIX_MASK + 1)]
+        append = [bucket.append for bucket in buckets]
+        for value in values:
+            append[(value >> shift) & RADIX_MASK](value)
+        if reverse:
+            buckets.reverse()
+        values = [value for bucket in buckets for value in bucket]
+        if progress is not None:
+            progress((p + 1) / passes)
+    return values
+
+
+def radix_sort_ints(values: Sequence[int], reverse: bool = False,
+                    progress: Optional[Callable[[float], None]] = None) -> List[int]:
+    """
+    The ints in values, sorted, as a new list
+
+    progress, if given, is called with the completed fraction after every
+    byte pass.
+    """
+    if len(values) < 2:
+        return list(values)
+    low = min(values)
+    span = max(values) - low
+    shifted = [value - low for value in values] if low else list(values)
+    result = _lsd(shifted, 0, radix_passes(span), reverse, progress)
+    return [value + low for value in result] if low else result
+
+
+def radix_order(keys: Sequence[int], reverse: bool = False,
+                progress: Optional[Callable[[float], None]] = None) -> List[int]:
+    """
+    Stable sorting permutation of integer keys: positions in key order
+
+    With reverse=True the keys descend and equal keys stay in input
+    order, like sorted(range(n), key=keys.__getitem__, reverse=True).
+    """
+    n = len(keys)
+    if n < 2:
+        return list(range(n))
+    low = min(keys)
+    span = max(keys) - low
+    bits = (n - 1).bit_length()
+    packed = [(key - low) << bits | i for i, key in enumerate(keys)]
+    packed = _lsd(packed, bits, radix_passes(span), reverse, progress)
+    mask = (1 << bits) - 1
+    return [value & mask for value in packed]
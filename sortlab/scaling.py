@@ -0,0 +1,139 @@
+"""
+Empirical complexity: time a sort on geometrically growing N and fit models.
+
+    points = run_scaling(time_at, geometric_sizes(500, 100000), max_point_s=2.0)
+    fit = fit_scaling(points)
+    fit.best.name, fit.exponent, fit.predict(100000)
+
+Each model t(n) = c * f(n) for f in n, n log n and n² is fitted in log
+space (c is the geometric mean of t / f(n)), so small and large N weigh the
+same; the model with the smallest RMS log error is the best fit. A free
+power law t = c * n^k gives the fitted exponent k. run_scaling() stops
+growing N once the power law predicts the next point would exceed the time
+budget, so an O(n²) sort is extrapolated to 100k rows instead of run.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+MODELS: Dict[str, Callable[[float], float]] = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log2(n),
+    'n²': lambda n: n * n,
+}
+
+
+def geometric_sizes(start: int, stop: int, factor: float = 2.0) -> List[int]:
+    """start, start*factor, ... up to stop; stop itself is always included"""
+    if start < 2 or stop < start or factor <= 1:
+        raise ValueError("need 2 <= start <= stop and factor > 1")
+    sizes = []
+    n = float(start)
+    while int(n) < stop:
+        sizes.append(int(n))
+        n *= factor
+    sizes.append(stop)
+    return sizes
+
+
+class ModelFit:
+    """t(n) = constant * f(n) for one model, with its RMS error in log space"""
+
+    def __init__(self, name: str, constant: float, rms_log_error: float):
+        self.name = name
+        self.constant = constant
+        self.rms_log_error = rms_log_error
+
+    def predict(self, n: int) -> float:
+        return self.constant * MODELS[self.name](n)
+
+    def __repr__(self) -> str:
+        return f"ModelFit({self.name}, c={self.constant:.3e}, rms={self.rms_log_error:.3f})"
+
+
+class ScalingFit:
+    """Fits of every model plus the free power law over the same points"""
+
+    def __init__(self, points: Sequence[Tuple[int, float]], models: Dict[str, ModelFit],
+                 exponent: float, constant: float):
+        self.points = list(points)
+        self.models = models
+        self.exponent = exponent
+        self.constant = constant
+
+    @property
+    def best(self) -> ModelFit:
+        return min(self.models.values(), key=lambda fit: fit.rms_log_error)
+
+    def predict(self, n: int) -> float:
+        """Time at n from the best model"""
+        return self.best.predict(n)
+
+    def predict_power(self, n: int) -> float:
+        """Time at n from the fitted power law"""
+        return self.constant * n ** self.exponent
+
+    def as_dict(self) -> dict:
+        return {
+            'points': [{'n': n, 'seconds': t} for n, t in self.points],
+            'exponent': self.exponent,
+            'power_constant': self.constant,
+            'best_model': self.best.name,
+            'models': {name: {'constant': fit.constant, 'rms_log_error': fit.rms_log_error}
+                       for name, fit in self.models.items()},
+        }
+
+
+def power_law(points: Sequence[Tuple[int, float]]) -> Tuple[float, float]:
+    """Least-squares (exponent, constant) of log t = log c + k log n"""
+    if len(points) < 2:
+        raise ValueError("need at least two points for a power-law fit")
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        raise ValueError("need at least two distinct sizes")
+    k = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    return k, math.exp(mean_y - k * mean_x)
+
+
+def fit_scaling(points: Sequence[Tuple[int, float]]) -> ScalingFit:
+    """Fit every model in MODELS and the power law to (n, seconds) points"""
+    points = [(n, t) for n, t in points if n >= 2 and t > 0]
+    if len(points) < 2:
+        raise ValueError("need at least two timed sizes with n >= 2")
+
+    models = {}
+    for name, f in MODELS.items():
+        residuals = [math.log(t) - math.log(f(n)) for n, t in points]
+        log_c = sum(residuals) / len(residuals)
+        rms = math.sqrt(sum((r - log_c) ** 2 for r in residuals) / len(residuals))
+        models[name] = ModelFit(name, math.exp(log_c), rms)
+
+    exponent, constant = power_law(points)
+    return ScalingFit(points, models, exponent, constant)
+
+
+def run_scaling(time_at: Callable[[int], float], sizes: Sequence[int], max_point_s: float = 2.0,
+                on_point: Optional[Callable[[int, float], None]] = None) -> List[Tuple[int, float]]:
+    """
+    Time time_at(n) for each size in increasing order
+
+    Before each new size (once two points exist) the power law fitted so
+    far predicts its time; sizes predicted to take longer than max_point_s
+    are skipped and the run stops there. on_point(n, seconds) is called
+    after every measured point.
+    """
+    points: List[Tuple[int, float]] = []
+    for n in sorted(set(sizes)):
+        if len(points) >= 2:
+            k, c = power_law(points)
+            if c * n ** k > max_point_s:
+                break
+        seconds = time_at(n)
+        points.append((n, max(seconds, 1e-9)))
+        if on_point is not None:
+            on_point(n, seconds)
+    return points
@@ -0,0 +1,137 @@
+"""
+Timing harness shared by the CLI, the Work1 script and both GUIs.
+
+Each sample is taken with perf_counter_ns around one call, after optional
+untimed warmup calls, with the garbage collector optionally paused so a
+collection cycle does not land inside a single sample:
+
+    stats = measure(lambda arr: bubble_sort(arr), setup=lambda: (data.copy(),),
+                    repeat=5, warmup=1, disable_gc=True)
+    print(stats.summary())
+"""
+
+import gc
+import math
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+# Two-sided 95% Student t critical values by degrees of freedom; larger
+# samples use the normal value
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+def t_critical_95(df: int) -> float:
+    """Two-sided 95% t value, using the nearest tabulated df at or below"""
+    if df <= 0:
+        return float('nan')
+    best = max(k for k in _T95 if k <= df)
+    return _T95[best] if df <= 120 else 1.960
+
+
+class TimingStats:
+    """Summary of repeated timings; all derived values are in seconds"""
+
+    def __init__(self, samples_ns: Sequence[int], warmup: int = 0, gc_disabled: bool = False):
+        if not samples_ns:
+            raise ValueError("need at least one timing sample")
+        self.samples_ns = list(samples_ns)
+        self.warmup = warmup
+        self.gc_disabled = gc_disabled
+
+        seconds = [ns / 1e9 for ns in self.samples_ns]
+        self.repeat = len(seconds)
+        self.min_s = min(seconds)
+        self.max_s = max(seconds)
+        self.mean_s = statistics.fmean(seconds)
+        self.median_s = statistics.median(seconds)
+        self.stdev_s = statistics.stdev(seconds) if len(seconds) > 1 else 0.0
+        half = t_critical_95(len(seconds) - 1) * self.stdev_s / math.sqrt(len(seconds))
+        # A few noisy samples give a wide interval; a duration is never negative
+        self.ci95_s: Tuple[float, float] = ((max(0.0, self.mean_s - half), self.mean_s + half)
+                                            if len(seconds) > 1 else (self.mean_s, self.mean_s))
+
+    def as_dict(self) -> dict:
+        return {
+            'repeat': self.repeat,
+            'warmup': self.warmup,
+            'gc_disabled': self.gc_disabled,
+            'min_s': self.min_s,
+            'max_s': self.max_s,
+            'mean_s': self.mean_s,
+            'median_s': self.median_s,
+            'stdev_s': self.stdev_s,
+            'ci95_low_s': self.ci95_s[0],
+            'ci95_high_s': self.ci95_s[1],
+        }
+
+    def summary(self) -> str:
+        """One line such as 'mean 12.345 ms ± 0.210 ms (95% CI 12.1–12.6 ms), median ...'"""
+        if self.repeat == 1:
+            return f"{format_seconds(self.mean_s)} (single run)"
+        low, high = self.ci95_s
+        return (f"mean {format_seconds(self.mean_s)} ± {format_seconds(self.stdev_s)} "
+                f"(95% CI {format_seconds(low)} – {format_seconds(high)}), "
+                f"median {format_seconds(self.median_s)}, min {format_seconds(self.min_s)}, "
+                f"n={self.repeat}")
+
+    def __repr__(self) -> str:
+        return f"TimingStats({self.summary()})"
+
+
+def format_seconds(seconds: float) -> str:
+    """Pick s / ms / µs so the number stays readable"""
+    if abs(seconds) >= 1:
+        return f"{seconds:.3f} s"
+    if abs(seconds) >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+@contextmanager
+def gc_paused(disable: bool = True) -> Iterator[None]:
+    """Disable the cyclic garbage collector for the block (if it was enabled)"""
+    was_enabled = gc.isenabled()
+    if disable and was_enabled:
+        gc.collect()
+        gc.disable()
+    try:
+        yield
+    finally:
+        if disable and was_enabled:
+            gc.enable()
+
+
+def measure(func: Callable[..., Any], repeat: int = 5, warmup: int = 1, disable_gc: bool = False,
+            setup: Optional[Callable[[], tuple]] = None,
+            on_result: Optional[Callable[[int, Any], None]] = None) -> TimingStats:
+    """
+    Time func(*setup()) `repeat` times after `warmup` untimed calls
+
+    setup() runs before every call (warmup included) and is not timed; use
+    it to hand each run a fresh copy of the input. on_result(run, value) is
+    called after each timed run, also outside the timed region.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    samples: List[int] = []
+
+    for _ in range(max(0, warmup)):
+        func(*(setup() if setup else ()))
+
+    with gc_paused(disable_gc):
+        for run in range(repeat):
+            args = setup() if setup else ()
+            start = time.perf_counter_ns()
+            value = func(*args)
+            samples.append(time.perf_counter_ns() - start)
+            if on_result is not None:
+                on_result(run, value)
+
+    return TimingStats(samples, warmup, disable_gc)
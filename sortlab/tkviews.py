@@ -0,0 +1,160 @@
+"""
+Tkinter widgets shared by the lab GUIs.
+
+Only the GUI modules import this, so tkinter is never loaded by the
+headless tools.
+"""
+
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+ROW_HEIGHT = 20
+HEADER_HEIGHT = 24
+POLL_MS = 50
+
+
+class VirtualTable(tk.Frame):
+    """
+    Scrollable table that only renders the rows currently on screen
+
+    The data is never handed to Tk in bulk: set_rows() takes a row count and
+    a function that formats one row by index, and every scroll re-renders
+    just the visible window. Showing 100 or 10,000,000 rows costs the same.
+    """
+
+    def __init__(self, parent, columns: Sequence[Tuple[str, int]], bg: str = "#121a3a",
+                 fg: str = "#45b7d1", heading_bg: str = "#1a2847", font=("Consolas", 9)):
+        super().__init__(parent, bg=bg)
+        self._count = 0
+        self._row_func: Optional[Callable[[int], Sequence]] = None
+        self._offset = 0
+        self._visible = 1
+
+        style = ttk.Style(self)
+        style.configure("Virtual.Treeview", background=bg, fieldbackground=bg, foreground=fg,
+                        rowheight=ROW_HEIGHT, font=font, borderwidth=0)
+        style.configure("Virtual.Treeview.Heading", background=heading_bg, foreground=fg,
+                        font=(font[0], font[1], "bold"))
+
+        names = [name for name, _ in columns]
+        self.tree = ttk.Treeview(self, columns=names, show="headings", selectmode="browse",
+                                 style="Virtual.Treeview")
+        for name, width in columns:
+            self.tree.heading(name, text=name, anchor="w")
+            self.tree.column(name, width=width, anchor="w", stretch=(name == names[-1]))
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.tree.bind("<Up>", lambda e: self.scroll_by(-1) or "break")
+        self.tree.bind("<Down>", lambda e: self.scroll_by(1) or "break")
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self._visible) or "break")
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self._visible) or "break")
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0) or "break")
+        self.tree.bind("<End>", lambda e: self.scroll_to(self._count) or "break")
+
+    def set_rows(self, count: int, row_func: Callable[[int], Sequence]) -> None:
+        """Show `count` rows; row_func(i) returns the cell values of row i"""
+        self._count = count
+        self._row_func = row_func
+        self._offset = 0
+        self._render()
+
+    def clear(self) -> None:
+        self.set_rows(0, lambda i: ())
+
+    def scroll_to(self, offset: int) -> None:
+        self._offset = max(0, min(offset, self._count - self._visible))
+        self._render()
+
+    def scroll_by(self, rows: int) -> None:
+        self.scroll_to(self._offset + rows)
+
+    def _render(self) -> None:
+        self.tree.delete(*self.tree.get_children())
+        end = min(self._count, self._offset + self._visible)
+        for i in range(self._offset, end):
+            self.tree.insert("", tk.END, values=self._row_func(i))
+
+        if self._count:
+            self.scrollbar.set(self._offset / self._count, end / self._count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_resize(self, event) -> None:
+        visible = max(1, (event.height - HEADER_HEIGHT) // ROW_HEIGHT)
+        if visible != self._visible:
+            self._visible = visible
+            self.scroll_to(self._offset)
+
+    def _on_wheel(self, event) -> None:
+        self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self._count))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+
+class WorkerQueue:
+    """
+    Runs a job on a background thread without letting it touch Tk
+
+    The job only calls post(kind, *args); the Tk main loop drains the queue
+    every POLL_MS with after() and calls handlers[kind](*args) on the main
+    thread. An exception in the job is posted as "error" and every job ends
+    with a "done" message, so the GUI can re-enable its controls in one place.
+    """
+
+    def __init__(self, root: tk.Misc, handlers: Dict[str, Callable[..., Any]],
+                 poll_ms: int = POLL_MS):
+        self.root = root
+        self.handlers = handlers
+        self.poll_ms = poll_ms
+        self._queue: "queue.Queue[Tuple[str, tuple]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def busy(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def post(self, kind: str, *args: Any) -> None:
+        """Queue a message for the main thread (safe to call from any thread)"""
+        self._queue.put((kind, args))
+
+    def start(self, job: Callable[..., None], *args: Any) -> None:
+        """Run job(*args) on a daemon thread and start draining its messages"""
+        self._thread = threading.Thread(target=self._run, args=(job, args), daemon=True)
+        self._thread.start()
+        self.root.after(self.poll_ms, self._drain)
+
+    def _run(self, job: Callable[..., None], args: tuple) -> None:
+        try:
+            job(*args)
+        except Exception as e:
+            self.post("error", e)
+        finally:
+            self.post("done")
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                kind, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            handler = self.handlers.get(kind)
+            if handler is not None:
+                handler(*args)
+
+        if self.busy or not self._queue.empty():
+            self.root.after(self.poll_ms, self._drain)